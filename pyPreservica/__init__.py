@@ -20,6 +20,7 @@ from .uploadAPI import (
     csv_to_search_xml,
     generic_asset_package,
     upload_config,
+    get_transfer_config,
     multi_asset_package,
 )
 from .workflowAPI import WorkflowAPI, WorkflowContext, WorkflowInstance, ProcessAPI, Process
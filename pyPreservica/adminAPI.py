@@ -13,6 +13,7 @@ import xml.etree.ElementTree
 from typing import List, Any, Union
 
 from pyPreservica.common import *
+from pyPreservica.common import _xml_fromstring
 
 logger = logging.getLogger(__name__)
 
@@ -32,14 +33,11 @@ class AdminAPI(AuthenticatedAPI):
                 "delete_system_role API call is only available with a Preservica v6.5.0 system or higher")
 
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.delete(f'{self.protocol}://{self.server}/api/admin/security/roles/{role_name}',
-                                      headers=headers)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('DELETE', f'{self.protocol}://{self.server}/api/admin/security/roles/{role_name}',
+                                headers=headers)
         if request.status_code == requests.codes.no_content:
             return None
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.delete_system_role(role_name)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "delete_system_role failed")
@@ -57,14 +55,11 @@ class AdminAPI(AuthenticatedAPI):
                 "delete_security_tag API call is only available with a Preservica v6.4.0 system or higher")
 
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.delete(f'{self.protocol}://{self.server}/api/admin/security/tags/{tag_name}',
-                                      headers=headers)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('DELETE', f'{self.protocol}://{self.server}/api/admin/security/tags/{tag_name}',
+                                headers=headers)
         if request.status_code == requests.codes.no_content:
             return None
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.delete_security_tag(tag_name)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "delete_security_tag failed")
@@ -84,21 +79,17 @@ class AdminAPI(AuthenticatedAPI):
             raise RuntimeError("add_system_role API call is only available with a Preservica v6.5.0 system or higher")
 
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
         xml_tag = xml.etree.ElementTree.Element('Role', {"xmlns": self.admin_ns})
         xml_tag.text = str(role_name).strip()
         xml_request = xml.etree.ElementTree.tostring(xml_tag, encoding='utf-8')
-        request = self.session.post(f'{self.protocol}://{self.server}/api/admin/security/roles', data=xml_request,
-                                    headers=headers)
+        request = self._request('POST', f'{self.protocol}://{self.server}/api/admin/security/roles', data=xml_request,
+                                headers=headers)
         if request.status_code == requests.codes.created:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             return entity_response.text
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_system_role(role_name)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "add_system_role failed")
@@ -119,22 +110,18 @@ class AdminAPI(AuthenticatedAPI):
             raise RuntimeError("add_security_tag API call is only available with a Preservica v6.4.0 system or higher")
 
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
         xml_tag = xml.etree.ElementTree.Element('Tag', {"xmlns": self.admin_ns})
         xml_tag.text = str(tag_name).strip()
         xml_request = xml.etree.ElementTree.tostring(xml_tag, encoding='utf-8')
 
-        request = self.session.post(f'{self.protocol}://{self.server}/api/admin/security/tags', data=xml_request,
-                                    headers=headers)
+        request = self._request('POST', f'{self.protocol}://{self.server}/api/admin/security/tags', data=xml_request,
+                                headers=headers)
         if request.status_code == requests.codes.created:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             return entity_response.text
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_security_tag(tag_name)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "add_security_tag failed")
@@ -153,20 +140,16 @@ class AdminAPI(AuthenticatedAPI):
             raise RuntimeError(
                 "system_roles API call is only available with a Preservica v6.5.0 system or higher")
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/admin/security/roles', headers=headers)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('GET', f'{self.protocol}://{self.server}/api/admin/security/roles', headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             roles = entity_response.findall(f'.//{{{self.admin_ns}}}Role')
             security_roles = []
             for role in roles:
                 security_roles.append(role.text)
             return security_roles
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.roles()
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "roles failed")
@@ -180,20 +163,16 @@ class AdminAPI(AuthenticatedAPI):
 
         """
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/admin/security/tags', headers=headers)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('GET', f'{self.protocol}://{self.server}/api/admin/security/tags', headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             tags = entity_response.findall(f'.//{{{self.admin_ns}}}Tag')
             security_tags = []
             for tag in tags:
                 security_tags.append(tag.text)
             return security_tags
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.security_tags()
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "security_tags failed")
@@ -208,13 +187,10 @@ class AdminAPI(AuthenticatedAPI):
         """
         self._check_if_user_has_manager_role()
         self.disable_user(username)
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.delete(f'{self.protocol}://{self.server}/api/admin/users/{username}', headers=headers)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('DELETE', f'{self.protocol}://{self.server}/api/admin/users/{username}', headers=headers)
         if request.status_code == requests.codes.no_content:
             return None
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.delete_user(username)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "delete_user failed")
@@ -238,7 +214,7 @@ class AdminAPI(AuthenticatedAPI):
         :rtype: dict
         """
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
         xml_object = xml.etree.ElementTree.Element('User ', {"xmlns": self.admin_ns})
         xml.etree.ElementTree.SubElement(xml_object, "FullName").text = full_name
@@ -252,13 +228,10 @@ class AdminAPI(AuthenticatedAPI):
         xml_request = xml.etree.ElementTree.tostring(xml_object, encoding='utf-8')
         logger.debug(xml_request)
         params = {"source": "UX2"}
-        request = self.session.post(f'{self.protocol}://{self.server}/api/admin/users', data=xml_request,
-                                    headers=headers, params=params)
+        request = self._request('POST', f'{self.protocol}://{self.server}/api/admin/users', data=xml_request,
+                                headers=headers, params=params)
         if request.status_code == requests.codes.created:
             return self.user_details(username)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_user(username, full_name, roles)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "add_user failed")
@@ -277,30 +250,23 @@ class AdminAPI(AuthenticatedAPI):
          :rtype: dict
          """
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.get(f"{self.protocol}://{self.server}/api/admin/users/{username}", headers=headers)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('GET', f"{self.protocol}://{self.server}/api/admin/users/{username}", headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = xml.etree.ElementTree.fromstring(request.content)
             fullname = entity_response.find(f'.//{{{self.admin_ns}}}FullName')
             fullname.text = new_display_name
             xml_request = xml.etree.ElementTree.tostring(entity_response, encoding='utf-8')
             logger.debug(xml_request)
-            update_request = self.session.put(f'{self.protocol}://{self.server}/api/admin/users/{username}',
-                                              data=xml_request,
-                                              headers=headers)
+            update_request = self._request('PUT', f'{self.protocol}://{self.server}/api/admin/users/{username}',
+                                           data=xml_request,
+                                           headers=headers)
             if update_request.status_code == requests.codes.ok:
                 return self.user_details(username)
-            elif update_request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.change_user_display_name(username, new_display_name)
             else:
                 logger.error(request.content.decode('utf-8'))
                 raise RuntimeError(request.status_code, "change_user_display_name failed")
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.change_user_display_name(username, new_display_name)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "change_user_display_name failed")
@@ -317,13 +283,12 @@ class AdminAPI(AuthenticatedAPI):
         """
 
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.get(f"{self.protocol}://{self.server}/api/admin/users/{username}", headers=headers)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('GET', f"{self.protocol}://{self.server}/api/admin/users/{username}", headers=headers)
         return_dict = {}
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             username = entity_response.find(f'.//{{{self.admin_ns}}}UserName')
             return_dict['UserName'] = username.text
             fullname = entity_response.find(f'.//{{{self.admin_ns}}}FullName')
@@ -341,24 +306,18 @@ class AdminAPI(AuthenticatedAPI):
                 return_roles.append(role.text)
             return_dict['Roles'] = return_roles
             return return_dict
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.user_details(username)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "user_details failed")
 
     def _account_status_(self, username: str, status: str, name: str):
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'text/plain;charset=UTF-8'}
+        headers = {'Content-Type': 'text/plain;charset=UTF-8'}
         data = {"userEnabledStatus": status}
-        request = self.session.put(f"{self.protocol}://{self.server}/api/admin/users/{username}/enabled",
-                                   headers=headers,
-                                   data=data)
+        request = self._request('PUT', f"{self.protocol}://{self.server}/api/admin/users/{username}/enabled",
+                                headers=headers,
+                                data=data)
         if request.status_code == requests.codes.ok:
             return request.content.decode("utf-8")
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._account_status_(username, status, name)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, f"{name} failed")
@@ -411,20 +370,16 @@ class AdminAPI(AuthenticatedAPI):
         """
 
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.get(f"{self.protocol}://{self.server}/api/admin/users", headers=headers)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('GET', f"{self.protocol}://{self.server}/api/admin/users", headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             users = entity_response.findall(f'.//{{{self.admin_ns}}}User')
             system_users = []
             for user in users:
                 system_users.append(user.text)
             return system_users
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.all_users()
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "all_users failed")
@@ -459,15 +414,12 @@ class AdminAPI(AuthenticatedAPI):
         elif hasattr(xml_data, "read"):
             pass
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.post(f"{self.protocol}://{self.server}/api/admin/schemas", headers=headers,
-                                    params=params,
-                                    data=xml_data)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('POST', f"{self.protocol}://{self.server}/api/admin/schemas", headers=headers,
+                                params=params,
+                                data=xml_data)
         if request.status_code == requests.codes.created:
             return None
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_xml_schema(name, description, originalName, xml_data)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "add_xml_schema failed")
@@ -509,15 +461,12 @@ class AdminAPI(AuthenticatedAPI):
         elif hasattr(xml_data, "read"):
             pass
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.post(f"{self.protocol}://{self.server}/api/admin/documents", headers=headers,
-                                    params=params,
-                                    data=xml_data)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('POST', f"{self.protocol}://{self.server}/api/admin/documents", headers=headers,
+                                params=params,
+                                data=xml_data)
         if request.status_code == requests.codes.created:
             return None
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_xml_document(name, xml_data, document_type)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "add_xml_document failed")
@@ -536,18 +485,15 @@ class AdminAPI(AuthenticatedAPI):
 
         self._check_if_user_has_manager_role()
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
         for document in self.xml_documents():
             if document['SchemaUri'] == uri.strip():
-                request = self.session.delete(
-                    f"{self.protocol}://{self.server}/api/admin/documents/{document['ApiId']}",
+                request = self._request(
+                    'DELETE', f"{self.protocol}://{self.server}/api/admin/documents/{document['ApiId']}",
                     headers=headers)
                 if request.status_code == requests.codes.no_content:
                     return None
-                elif request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.delete_xml_document(uri)
                 else:
                     logger.error(request.content.decode('utf-8'))
                     raise RuntimeError(request.status_code, "delete_xml_document failed")
@@ -567,17 +513,14 @@ class AdminAPI(AuthenticatedAPI):
 
         self._check_if_user_has_manager_role()
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
         for schema in self.xml_schemas():
             if schema['SchemaUri'] == uri.strip():
-                request = self.session.delete(f"{self.protocol}://{self.server}/api/admin/schemas/{schema['ApiId']}",
-                                              headers=headers)
+                request = self._request('DELETE', f"{self.protocol}://{self.server}/api/admin/schemas/{schema['ApiId']}",
+                                        headers=headers)
                 if request.status_code == requests.codes.no_content:
                     return None
-                elif request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.delete_xml_schema(uri)
                 else:
                     logger.error(request.content.decode('utf-8'))
                     raise RuntimeError(request.status_code, "delete_xml_schema failed")
@@ -594,19 +537,15 @@ class AdminAPI(AuthenticatedAPI):
         :rtype: str
 
          """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
         for schema in self.xml_schemas():
             if schema['SchemaUri'] == uri.strip():
-                request = self.session.get(
-                    f"{self.protocol}://{self.server}/api/admin/schemas/{schema['ApiId']}/content",
+                request = self._request(
+                    'GET', f"{self.protocol}://{self.server}/api/admin/schemas/{schema['ApiId']}/content",
                     headers=headers)
                 if request.status_code == requests.codes.ok:
-                    xml_response = str(request.content.decode('utf-8'))
-                    return xml_response
-                elif request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.xml_schema(uri)
+                    return request.content.decode('utf-8')
                 else:
                     logger.error(request.content.decode('utf-8'))
                     raise RuntimeError(request.status_code, "xml_schema failed")
@@ -623,18 +562,14 @@ class AdminAPI(AuthenticatedAPI):
         :rtype: str
 
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
         for document in self.xml_documents():
             if document['SchemaUri'] == uri.strip():
-                request = self.session.get(
-                    f"{self.protocol}://{self.server}/api/admin/documents/{document['ApiId']}/content",
+                request = self._request(
+                    'GET', f"{self.protocol}://{self.server}/api/admin/documents/{document['ApiId']}/content",
                     headers=headers)
                 if request.status_code == requests.codes.ok:
-                    xml_response = str(request.content.decode('utf-8'))
-                    return xml_response
-                elif request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.xml_document(uri)
+                    return request.content.decode('utf-8')
                 else:
                     logger.error(request.content.decode('utf-8'))
                     raise RuntimeError(request.status_code, "xml_document failed")
@@ -648,12 +583,11 @@ class AdminAPI(AuthenticatedAPI):
         :rtype: list
 
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/admin/documents', headers=headers)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('GET', f'{self.protocol}://{self.server}/api/admin/documents', headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             documents = entity_response.findall(f'.//{{{self.admin_ns}}}Document')
             results = list()
             for document in documents:
@@ -668,9 +602,6 @@ class AdminAPI(AuthenticatedAPI):
                 document_dict['ApiId'] = api_id.text
                 results.append(document_dict)
             return results
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.xml_documents()
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "xml_documents failed")
@@ -683,13 +614,12 @@ class AdminAPI(AuthenticatedAPI):
         :rtype: list
 
          """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
-        request = self.session.get(f'{self.protocol}://{self.server}/api/admin/schemas', headers=headers)
+        request = self._request('GET', f'{self.protocol}://{self.server}/api/admin/schemas', headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             schemas = entity_response.findall(f'.//{{{self.admin_ns}}}Schema')
             results = []
             for schema in schemas:
@@ -707,9 +637,6 @@ class AdminAPI(AuthenticatedAPI):
                 schema_dict['ApiId'] = aip_id.text
                 results.append(schema_dict)
             return results
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.xml_schemas()
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "xml_schemas failed")
@@ -722,12 +649,11 @@ class AdminAPI(AuthenticatedAPI):
         :rtype: list
 
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/admin/transforms', headers=headers)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('GET', f'{self.protocol}://{self.server}/api/admin/transforms', headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             transforms = entity_response.findall(f'.//{{{self.admin_ns}}}Transform')
             results = []
             for transform in transforms:
@@ -752,9 +678,6 @@ class AdminAPI(AuthenticatedAPI):
                 results.append(transform_dict)
             return results
 
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.xml_transforms()
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "xml_transforms failed")
@@ -773,17 +696,14 @@ class AdminAPI(AuthenticatedAPI):
         :rtype: str
 
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
         for transform in self.xml_transforms():
             if (transform['FromSchemaUri'] == input_uri.strip()) and (transform['ToSchemaUri'] == output_uri.strip()):
-                request = self.session.get(
-                    f"{self.protocol}://{self.server}/api/admin/transforms/{transform['ApiId']}/content",
+                request = self._request(
+                    'GET', f"{self.protocol}://{self.server}/api/admin/transforms/{transform['ApiId']}/content",
                     headers=headers)
                 if request.status_code == requests.codes.ok:
-                    return str(request.content.decode('utf-8'))
-                elif request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.xml_transform(input_uri, output_uri)
+                    return request.content.decode('utf-8')
                 else:
                     logger.error(request.content.decode('utf-8'))
                     raise RuntimeError(request.status_code, "xml_transform failed")
@@ -806,18 +726,15 @@ class AdminAPI(AuthenticatedAPI):
 
         self._check_if_user_has_manager_role()
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
         for transform in self.xml_transforms():
             if (transform['FromSchemaUri'] == input_uri.strip()) and (transform['ToSchemaUri'] == output_uri.strip()):
-                request = self.session.delete(
-                    f"{self.protocol}://{self.server}/api/admin/transforms/{transform['ApiId']}",
+                request = self._request(
+                    'DELETE', f"{self.protocol}://{self.server}/api/admin/transforms/{transform['ApiId']}",
                     headers=headers)
                 if request.status_code == requests.codes.no_content:
                     return None
-                elif request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.delete_xml_transform(input_uri, output_uri)
                 else:
                     logger.error(request.content.decode('utf-8'))
                     raise RuntimeError(request.status_code, "delete_xml_transform failed")
@@ -862,16 +779,13 @@ class AdminAPI(AuthenticatedAPI):
         elif hasattr(xml_data, "read"):
             pass
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.post(f"{self.protocol}://{self.server}/api/admin/transforms", headers=headers,
-                                    params=params,
-                                    data=xml_data)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('POST', f"{self.protocol}://{self.server}/api/admin/transforms", headers=headers,
+                                params=params,
+                                data=xml_data)
         if request.status_code == requests.codes.created:
             return None
 
-        if request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_xml_transform(name, input_uri, output_uri, purpose, originalName, xml_data)
 
         logger.error(request.content.decode('utf-8'))
         raise RuntimeError(request.status_code, "add_xml_transform failed")
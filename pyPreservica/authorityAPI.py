@@ -57,12 +57,9 @@ class AuthorityAPI(AuthenticatedAPI):
           :type: reference:    str
 
           """
-        headers = {HEADER_TOKEN: self.token, 'accept': 'application/json;charset=UTF-8'}
-        response = self.session.delete(f'{self.protocol}://{self.server}{BASE_ENDPOINT}/records/{reference}',
-                                       headers=headers)
-        if response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.delete_record(reference)
+        headers = {'accept': 'application/json;charset=UTF-8'}
+        response = self._request('DELETE', f'{self.protocol}://{self.server}{BASE_ENDPOINT}/records/{reference}',
+                                 headers=headers)
         if response.status_code == requests.codes.no_content:
             return None
         else:
@@ -108,20 +105,17 @@ class AuthorityAPI(AuthenticatedAPI):
          :rtype: dict
 
          """
-        headers = {HEADER_TOKEN: self.token, 'accept': 'application/json;charset=UTF-8'}
+        headers = {'accept': 'application/json;charset=UTF-8'}
 
         body = {"securityDescriptor": "open", "fieldValues": []}
         for key, val in record.items():
             body["fieldValues"].append({"name": str(key).lower(), "value": val})
 
-        response = self.session.post(f'{self.protocol}://{self.server}{BASE_ENDPOINT}/tables/{table.reference}/records',
-                                     headers=headers, json=body)
+        response = self._request('POST', f'{self.protocol}://{self.server}{BASE_ENDPOINT}/tables/{table.reference}/records',
+                                 headers=headers, json=body)
 
-        if response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_record(table, record)
         if response.status_code == requests.codes.created:
-            return str(response.content.decode('utf-8'))
+            return response.content.decode('utf-8')
         else:
             exception = HTTPException("", response.status_code, response.url, "add_record",
                                       response.content.decode('utf-8'))
@@ -139,15 +133,11 @@ class AuthorityAPI(AuthenticatedAPI):
          :rtype: dict
 
          """
-        headers = {HEADER_TOKEN: self.token, 'accept': 'application/json;charset=UTF-8'}
-        response = self.session.get(f'{self.protocol}://{self.server}{BASE_ENDPOINT}/records/{reference}',
-                                    headers=headers)
-        if response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.record(reference)
+        headers = {'accept': 'application/json;charset=UTF-8'}
+        response = self._request('GET', f'{self.protocol}://{self.server}{BASE_ENDPOINT}/records/{reference}',
+                                 headers=headers)
         if response.status_code == requests.codes.ok:
-            json_response = str(response.content.decode('utf-8'))
-            return json.loads(json_response)
+            return json.loads(response.content)
         else:
             exception = HTTPException("", response.status_code, response.url, "record",
                                       response.content.decode('utf-8'))
@@ -165,15 +155,11 @@ class AuthorityAPI(AuthenticatedAPI):
          :rtype: list[dict]
 
          """
-        headers = {HEADER_TOKEN: self.token, 'accept': 'application/json;charset=UTF-8'}
-        response = self.session.get(f'{self.protocol}://{self.server}{BASE_ENDPOINT}/tables/{table.reference}/records',
-                                    headers=headers, params={"expand": "true"})
-        if response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.records(table)
+        headers = {'accept': 'application/json;charset=UTF-8'}
+        response = self._request('GET', f'{self.protocol}://{self.server}{BASE_ENDPOINT}/tables/{table.reference}/records',
+                                 headers=headers, params={"expand": "true"})
         if response.status_code == requests.codes.ok:
-            json_response = str(response.content.decode('utf-8'))
-            return json.loads(json_response)['records']
+            return json.loads(response.content)['records']
         else:
             exception = HTTPException("", response.status_code, response.url, "records",
                                       response.content.decode('utf-8'))
@@ -188,7 +174,7 @@ class AuthorityAPI(AuthenticatedAPI):
          :rtype: Table
 
          """
-        headers = {HEADER_TOKEN: self.token, 'accept': 'application/json;charset=UTF-8', 'Content-Type': 'application/json'}
+        headers = {'accept': 'application/json;charset=UTF-8', 'Content-Type': 'application/json'}
 
         table_data = {"name": new_table.name}
         if new_table.description is not None:
@@ -202,14 +188,10 @@ class AuthorityAPI(AuthenticatedAPI):
         if new_table.fields is not None:
             table_data['fields'] = new_table.fields
 
-        response = self.session.post(f'{self.protocol}://{self.server}{BASE_ENDPOINT}/tables', data=json.dumps(table_data), headers=headers)
+        response = self._request('POST', f'{self.protocol}://{self.server}{BASE_ENDPOINT}/tables', data=json.dumps(table_data), headers=headers)
 
-        if response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_table(new_table)
         if response.status_code == requests.codes.created:
-            json_response = str(response.content.decode('utf-8'))
-            doc = json.loads(json_response)
+            doc = json.loads(response.content)
             return self.table(doc['ref'])
         else:
             exception = HTTPException("", response.status_code, response.url, "add_table",
@@ -230,15 +212,11 @@ class AuthorityAPI(AuthenticatedAPI):
         :rtype: Table
 
         """
-        headers = {HEADER_TOKEN: self.token, 'accept': 'application/json;charset=UTF-8'}
-        response = self.session.get(f'{self.protocol}://{self.server}{BASE_ENDPOINT}/tables/{reference}',
-                                    headers=headers)
-        if response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.table(reference)
+        headers = {'accept': 'application/json;charset=UTF-8'}
+        response = self._request('GET', f'{self.protocol}://{self.server}{BASE_ENDPOINT}/tables/{reference}',
+                                 headers=headers)
         if response.status_code == requests.codes.ok:
-            json_response = str(response.content.decode('utf-8'))
-            doc = json.loads(json_response)
+            doc = json.loads(response.content)
             table = Table(doc['name'], doc['securityDescriptor'], doc.get('displayField', None), doc.get('metadataConnections', None))
             table.reference = doc['ref']
             if 'fields' in doc:
@@ -260,14 +238,10 @@ class AuthorityAPI(AuthenticatedAPI):
         :rtype: set(Table)
 
         """
-        headers = {HEADER_TOKEN: self.token, 'accept': 'application/json;charset=UTF-8'}
-        response = self.session.get(f'{self.protocol}://{self.server}{BASE_ENDPOINT}/tables', headers=headers)
-        if response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.tables()
+        headers = {'accept': 'application/json;charset=UTF-8'}
+        response = self._request('GET', f'{self.protocol}://{self.server}{BASE_ENDPOINT}/tables', headers=headers)
         if response.status_code == requests.codes.ok:
-            json_response = str(response.content.decode('utf-8'))
-            doc = json.loads(json_response)
+            doc = json.loads(response.content)
             results = set()
             for table in doc['tables']:
                 t = Table(table['name'], table['securityDescriptor'], table.get('displayField', None), table.get('metadataConnections', None))
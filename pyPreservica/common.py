@@ -10,8 +10,10 @@ licence:    Apache License 2.0
 import configparser
 import functools
 import hashlib
+import io
 import json
 import logging
+import mmap
 import os
 import platform
 import re
@@ -20,6 +22,7 @@ import threading
 import time
 import unicodedata
 import xml.etree.ElementTree
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 import pyotp
@@ -34,6 +37,17 @@ import dateutil.tz
 
 import pyPreservica
 
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+
+try:
+    import httpx
+    import h2  # HTTP/2 support for httpx
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
 NS_XIP_ROOT = "http://preservica.com/XIP/"
@@ -54,25 +68,74 @@ IO_PATH = "information-objects"
 SO_PATH = "structural-objects"
 CO_PATH = "content-objects"
 
-HASH_BLOCK_SIZE = 65536
+HASH_BLOCK_SIZE = 1 << 20
+MMAP_HASH_THRESHOLD = 16 * 1024 * 1024
+MULTI_HASH_BLOCK_SIZE = 4 * 1024 * 1024
+ZIP_BUFFER_SIZE = 1 << 20
 TIME_OUT = 62
-CHUNK_SIZE = 1024 * 4
+# give up on a connection attempt quickly, an unreachable server should not wait for the read timeout
+CONNECT_TIME_OUT = 10
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+# Preservica access tokens are valid for 15 minutes, renew them 30 seconds early
+TOKEN_LIFETIME = 900
+TOKEN_REFRESH_MARGIN = 30
+# throttled or unavailable responses which are retried with backoff, honouring any Retry-After header
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# server version number in the /api/entity/versiondetails/version response
+_VERSION_RE = re.compile(rb"<(?:\w+:)?CurrentVersion[^>]*>\s*([^<\s]+)\s*</")
+
+CHUNK_SIZE = 1024 * 1024
+# minimum number of seconds between console progress updates
+PROGRESS_INTERVAL = 0.1
+
+
+# True when hashlib is backed by OpenSSL, which uses SHA-NI instructions where the CPU has them
+_SHA_FAST = hashlib.sha256.__module__ == "_hashlib"
+
+
+@functools.lru_cache(maxsize=None)
+def _check_hash_acceleration():
+    if not _SHA_FAST:
+        logger.info("hashlib is not using OpenSSL, fixity hashing will be slower. "
+                    "Use a Python built with OpenSSL 1.1.1+ for SHA-NI hardware acceleration")
 
 
 class FileHash:
     """
     A wrapper around the hashlib hash algorithms that allows an entire file to
     be hashed in a chunked manner.
+
+    The algorithm can be either a hashlib name such as "sha256" or a hashlib constructor.
     """
 
     def __init__(self, algorithm):
         self.algorithm = algorithm
+        _check_hash_acceleration()
 
     def get_algorithm(self):
         return self.algorithm
 
+    def _new_hash(self):
+        if isinstance(self.algorithm, str):
+            return hashlib.new(self.algorithm, usedforsecurity=False)
+        return self.algorithm()
+
     def __call__(self, file):
-        hash_algorithm = self.algorithm()
+        if os.path.getsize(file) >= MMAP_HASH_THRESHOLD:
+            hash_algorithm = self._new_hash()
+            with open(file, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        # let the kernel read ahead aggressively and drop pages once they have been hashed
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hash_algorithm.update(mm)
+            return hash_algorithm.hexdigest()
+        if sys.version_info >= (3, 11):
+            with open(file, 'rb', buffering=0) as f:
+                return hashlib.file_digest(f, self._new_hash).hexdigest()
+        hash_algorithm = self._new_hash()
         with open(file, 'rb') as f:
             buf = f.read(HASH_BLOCK_SIZE)
             while len(buf) > 0:
@@ -80,6 +143,135 @@ class FileHash:
                 buf = f.read(HASH_BLOCK_SIZE)
         return hash_algorithm.hexdigest()
 
+    @staticmethod
+    def multi(file, algorithms: list) -> dict:
+        """
+        Hash a file with several algorithms while reading it only once
+
+        Each block is fed to all the hash objects in parallel, hashlib releases the GIL on large updates.
+
+        :param file: The path of the file to hash
+        :param algorithms: list of hashlib algorithm names, e.g. ["sha1", "sha256"]
+        :return: dict of algorithm name to hex digest
+        """
+        if len(algorithms) == 0:
+            logger.error("At least one hash algorithm is required")
+            raise RuntimeError("At least one hash algorithm is required")
+        if len(algorithms) == 1:
+            return {algorithms[0]: FileHash(algorithms[0])(file)}
+        hashes = {name: hashlib.new(name, usedforsecurity=False) for name in algorithms}
+        with open(file, 'rb') as f, ThreadPoolExecutor(max_workers=len(hashes)) as executor:
+            buf = f.read(MULTI_HASH_BLOCK_SIZE)
+            while len(buf) > 0:
+                list(executor.map(lambda h: h.update(buf), hashes.values()))
+                buf = f.read(MULTI_HASH_BLOCK_SIZE)
+        return {name: h.hexdigest() for name, h in hashes.items()}
+
+
+class HashingFileWrapper(io.RawIOBase):
+    """
+    Read only wrapper around a binary file which hashes the data as it is read
+
+    Once the whole file has been read, digests() returns the same values as hashing the file on its own.
+    """
+
+    def __init__(self, raw, algorithms=("sha256",)):
+        super().__init__()
+        self._raw = raw
+        self._hashes = {name: hashlib.new(name, usedforsecurity=False) for name in algorithms}
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = self._raw.readinto(b)
+        if n:
+            with memoryview(b) as view:
+                for h in self._hashes.values():
+                    h.update(view[:n])
+        return n
+
+    def digests(self) -> dict:
+        """
+        :return: dict of algorithm name to hex digest of the data read so far
+        """
+        return {name: h.hexdigest() for name, h in self._hashes.items()}
+
+    def close(self):
+        self._raw.close()
+        super().close()
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_credentials(path: str, stamp: tuple, interpolation: type) -> configparser.ConfigParser:
+    config = configparser.ConfigParser(interpolation=interpolation())
+    config.read(path, encoding='utf-8')
+    return config
+
+
+def _read_credentials(credentials_path: str,
+                      interpolation: type = configparser.BasicInterpolation) -> configparser.ConfigParser:
+    """
+    Parse a credentials properties file, the parsed file is re-used until the file is modified
+
+    The returned parser is shared and should only be read
+
+    :param credentials_path: The path of the properties file
+    :param interpolation: The configparser interpolation class used for the values
+    :return: The parsed file, empty if the file does not exist
+    """
+    path = os.path.abspath(credentials_path)
+    try:
+        stats = os.stat(path)
+        stamp = (stats.st_mtime_ns, stats.st_size)
+    except OSError:
+        stamp = None
+    return _parse_credentials(path, stamp, interpolation)
+
+
+def _xml_fromstring(xml_data):
+    """
+    Parse an XML document with lxml if it is installed, otherwise with the standard library ElementTree
+
+    The element type depends on which parser was used, so the result must stay internal: callers read the
+    text and attributes they need and never return the elements themselves.
+
+    :param xml_data: The XML document as str or bytes
+    :return: The root element
+    """
+    if isinstance(xml_data, str):
+        xml_data = xml_data.encode("utf-8")
+    if _lxml_etree is None:
+        return xml.etree.ElementTree.fromstring(xml_data)
+    return _lxml_etree.fromstring(xml_data, _lxml_etree.XMLParser(resolve_entities=False, no_network=True))
+
+
+def _xml_iterparse(source, events=("end",)):
+    """
+    Incrementally parse an XML document from a file like object, see _xml_fromstring
+
+    :param source: file like object containing the XML document
+    :param events: The parse events to report
+    :return: iterator of (event, element) tuples
+    """
+    if _lxml_etree is None:
+        return xml.etree.ElementTree.iterparse(source, events=events)
+    return _lxml_etree.iterparse(source, events=events, resolve_entities=False, no_network=True)
+
+
+def _xml_iterfind(xml_data: bytes, tag: str):
+    """
+    Yield each element with the given tag as soon as it has been parsed, the element is cleared afterwards
+
+    :param xml_data: The XML document as bytes
+    :param tag: The fully qualified tag to match
+    :return: iterator of elements
+    """
+    for _, element in _xml_iterparse(io.BytesIO(xml_data)):
+        if element.tag == tag:
+            yield element
+            element.clear()
+
 
 def identifiers_to_dict(identifiers: set) -> dict:
     """
@@ -93,6 +285,10 @@ def identifiers_to_dict(identifiers: set) -> dict:
     return result
 
 
+_STRTOBOOL = {'y': True, 'yes': True, 't': True, 'true': True, 'on': True, '1': True,
+              'n': False, 'no': False, 'f': False, 'false': False, 'off': False, '0': False}
+
+
 def strtobool(val) -> bool:
     """
     Convert a string representation of truth to true (1) or false (0).
@@ -101,59 +297,10 @@ def strtobool(val) -> bool:
     are 'n', 'no', 'f', 'false', 'off', and '0'.  Raises ValueError if
     'val' is anything else.
     """
-    val = val.lower()
-    if val in ('y', 'yes', 't', 'true', 'on', '1'):
-        return True
-    elif val in ('n', 'no', 'f', 'false', 'off', '0'):
-        return False
-    else:
-        raise ValueError("invalid truth value %r" % (val,))
-
-
-def _make_stored_zipfile(base_name, base_dir, owner, group, verbose=0, dry_run=0, logger=None):
-    """
-    Create a non compressed zip file from all the files under 'base_dir'.
-
-
-    The output zip file will be named 'base_name' + ".zip".  Returns the
-    name of the output zip file.
-    """
-    import zipfile  # late import for breaking circular dependency
-
-    zip_filename = base_name + ".zip"
-    archive_dir = os.path.dirname(base_name)
-
-    if archive_dir and not os.path.exists(archive_dir):
-        if logger is not None:
-            logger.info("creating %s", archive_dir)
-        if not dry_run:
-            os.makedirs(archive_dir)
-
-    if logger is not None:
-        logger.info("creating '%s' and adding '%s' to it",
-                    zip_filename, base_dir)
-
-    if not dry_run:
-        with zipfile.ZipFile(zip_filename, "w", compression=zipfile.ZIP_STORED) as zf:
-            path = os.path.normpath(base_dir)
-            if path != os.curdir:
-                zf.write(path, path)
-                if logger is not None:
-                    logger.info("adding '%s'", path)
-            for dirpath, dirnames, filenames in os.walk(base_dir):
-                for name in sorted(dirnames):
-                    path = os.path.normpath(os.path.join(dirpath, name))
-                    zf.write(path, path)
-                    if logger is not None:
-                        logger.info("adding '%s'", path)
-                for name in filenames:
-                    path = os.path.normpath(os.path.join(dirpath, name))
-                    if os.path.isfile(path):
-                        zf.write(path, path)
-                        if logger is not None:
-                            logger.info("adding '%s'", path)
-
-    return zip_filename
+    try:
+        return _STRTOBOOL[val.lower()]
+    except KeyError:
+        raise ValueError("invalid truth value %r" % (val,)) from None
 
 
 class PagedSet:
@@ -162,6 +309,8 @@ class PagedSet:
     The results object contains the list of objects of interest
     """
 
+    __slots__ = ("results", "has_more", "total", "next_page")
+
     def __init__(self, results, has_more: bool, total: int, next_page: str):
         self.results = results
         self.has_more = bool(has_more)
@@ -182,21 +331,73 @@ class PagedSet:
 
 
 class Sha1FixityCallBack:
+    hash_algorithm = "sha1"
+
     def __call__(self, filename, full_path):
-        sha = FileHash(hashlib.sha1)
-        return "SHA1", sha(full_path)
+        return "SHA1", FileHash(self.hash_algorithm)(full_path)
+
+    def from_digests(self, digests: dict):
+        """
+        Return the fixity from the digests of a HashingFileWrapper which has just read the whole file
+        """
+        return "SHA1", digests[self.hash_algorithm]
 
 
 class Sha256FixityCallBack:
+    hash_algorithm = "sha256"
+
     def __call__(self, filename, full_path):
-        sha = FileHash(hashlib.sha256)
-        return "SHA256", sha(full_path)
+        return "SHA256", FileHash(self.hash_algorithm)(full_path)
+
+    def from_digests(self, digests: dict):
+        return "SHA256", digests[self.hash_algorithm]
 
 
 class Sha512FixityCallBack:
+    hash_algorithm = "sha512"
+
+    def __call__(self, filename, full_path):
+        return "SHA512", FileHash(self.hash_algorithm)(full_path)
+
+    def from_digests(self, digests: dict):
+        return "SHA512", digests[self.hash_algorithm]
+
+
+class MultiFixityCallBack:
+    """
+    Fixity callback which returns several fixity values for each file, the file is only read once
+
+    :param algorithms: hashlib algorithm names, e.g. ("sha1", "sha256", "md5")
+    """
+    def __init__(self, algorithms=("sha1", "sha256", "md5")):
+        self.hash_algorithms = tuple(algorithms)
+        if not self.hash_algorithms:
+            logger.error("MultiFixityCallBack needs at least one hash algorithm")
+            raise RuntimeError("MultiFixityCallBack needs at least one hash algorithm")
+
     def __call__(self, filename, full_path):
-        sha = FileHash(hashlib.sha512)
-        return "SHA512", sha(full_path)
+        return self.from_digests(FileHash.multi(full_path, list(self.hash_algorithms)))
+
+    def from_digests(self, digests: dict):
+        return {name.upper(): digests[name] for name in self.hash_algorithms}
+
+
+class Blake3FixityCallBack:
+    """
+    Fixity callback using BLAKE3, which is much faster than SHA-2 on CPUs without SHA extensions.
+
+    Requires the blake3 package and a Preservica system which accepts BLAKE3 fixity values.
+    """
+
+    def __call__(self, filename, full_path):
+        try:
+            import blake3
+        except ImportError:
+            logger.error("Package blake3 is required for Blake3FixityCallBack. pip install blake3")
+            raise RuntimeError("Package blake3 is required for Blake3FixityCallBack. pip install blake3")
+        h = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        h.update_mmap(full_path)
+        return "BLAKE3", h.hexdigest()
 
 
 class ReportProgressConsoleCallback:
@@ -207,29 +408,35 @@ class ReportProgressConsoleCallback:
         self.length = length
         self.fill = fill
         self.printEnd = printEnd
+        self._bars = [self.fill * i + '-' * (self.length - i) for i in range(self.length + 1)]
         self._lock = threading.Lock()
+        self._last_print = 0.0
         self.print_progress_bar(0)
 
     def __call__(self, value):
+        values = value.split(":")
         with self._lock:
-            values = value.split(":")
             self.total = int(values[1])
             self.current = int(values[0])
             if self.total == 0:
                 percentage = 100.0
             else:
                 percentage = (self.current / self.total) * 100
-            self.print_progress_bar(percentage)
-            if int(percentage) == int(100):
-                self.print_progress_bar(100.0)
-                sys.stdout.write(self.printEnd)
-                sys.stdout.flush()
+        finished = int(percentage) == int(100)
+        now = time.monotonic()
+        if not finished and (now - self._last_print) < PROGRESS_INTERVAL:
+            return
+        self._last_print = now
+        self.print_progress_bar(percentage)
+        if finished:
+            self.print_progress_bar(100.0)
+            sys.stdout.write(self.printEnd)
+            sys.stdout.flush()
 
     def print_progress_bar(self, percentage):
-        filled_length = int(self.length * (percentage / 100.0))
-        bar_sym = self.fill * filled_length + '-' * (self.length - filled_length)
-        sys.stdout.write(
-            '\r%s |%s| (%.2f%%) %s ' % (self.prefix, bar_sym, percentage, self.suffix))
+        filled_length = min(int(self.length * (percentage / 100.0)), self.length)
+        bar_sym = self._bars[filled_length]
+        sys.stdout.write(f'\r{self.prefix} |{bar_sym}| ({percentage:.2f}%) {self.suffix} ')
         sys.stdout.flush()
 
 
@@ -241,32 +448,39 @@ class UploadProgressConsoleCallback:
         self.length = length
         self.fill = fill
         self.printEnd = printEnd
+        self._bars = [self.fill * i + '-' * (self.length - i) for i in range(self.length + 1)]
         self._filename = filename
         self._size = float(Path(filename).stat().st_size)
         self._seen_so_far = 0
         self.start = time.time()
         self._lock = threading.Lock()
+        self._last_print = 0.0
         self.print_progress_bar(0, 0)
 
     def __call__(self, bytes_amount):
         with self._lock:
-            seconds = time.time() - self.start
-            if seconds == 0:
-                seconds = 1.0
             self._seen_so_far += bytes_amount
-            percentage = (self._seen_so_far / self._size) * float(100.0)
-            rate = (self._seen_so_far / (1024 * 1024)) / seconds
-            self.print_progress_bar(percentage, rate)
-            if int(self._seen_so_far) == int(self._size):
-                self.print_progress_bar(100.0, rate)
-                sys.stdout.write(self.printEnd)
-                sys.stdout.flush()
+            seen_so_far = self._seen_so_far
+        finished = int(seen_so_far) == int(self._size)
+        now = time.monotonic()
+        if not finished and (now - self._last_print) < PROGRESS_INTERVAL:
+            return
+        self._last_print = now
+        seconds = time.time() - self.start
+        if seconds == 0:
+            seconds = 1.0
+        percentage = (seen_so_far / self._size) * float(100.0)
+        rate = (seen_so_far / (1024 * 1024)) / seconds
+        self.print_progress_bar(percentage, rate)
+        if finished:
+            self.print_progress_bar(100.0, rate)
+            sys.stdout.write(self.printEnd)
+            sys.stdout.flush()
 
     def print_progress_bar(self, percentage, rate):
-        filled_length = int(self.length * (percentage / 100.0))
-        bar_sym = self.fill * filled_length + '-' * (self.length - filled_length)
-        sys.stdout.write(
-            '\r%s |%s| (%.2f%%) (%.2f %s) %s ' % (self.prefix, bar_sym, percentage, rate, "Mb/s", self.suffix))
+        filled_length = min(int(self.length * (percentage / 100.0)), self.length)
+        bar_sym = self._bars[filled_length]
+        sys.stdout.write(f'\r{self.prefix} |{bar_sym}| ({percentage:.2f}%) ({rate:.2f} Mb/s) {self.suffix} ')
         sys.stdout.flush()
 
 
@@ -280,13 +494,19 @@ class UploadProgressCallback:
         self._size = float(os.path.getsize(filename))
         self._seen_so_far = 0
         self._lock = threading.Lock()
+        self._last_print = 0.0
 
     def __call__(self, bytes_amount):
         with self._lock:
             self._seen_so_far += bytes_amount
-            percentage = (self._seen_so_far / self._size) * 100
-            sys.stdout.write("\r%s  %s / %s  (%.2f%%)" % (self._filename, self._seen_so_far, self._size, percentage))
-            sys.stdout.flush()
+            seen_so_far = self._seen_so_far
+        now = time.monotonic()
+        if seen_so_far < self._size and (now - self._last_print) < PROGRESS_INTERVAL:
+            return
+        self._last_print = now
+        percentage = (seen_so_far / self._size) * 100
+        sys.stdout.write("\r%s  %s / %s  (%.2f%%)" % (self._filename, seen_so_far, self._size, percentage))
+        sys.stdout.flush()
 
 
 class RelationshipDirection(Enum):
@@ -338,6 +558,9 @@ class ReferenceNotFoundException(Exception):
 
 
 class Relationship:
+    __slots__ = ("api_id", "this_ref", "entity_type", "title", "other_ref", "direction", "relationship_type",
+                 "relationship_id")
+
     DCMI_hasFormat = "http://purl.org/dc/terms/hasFormat"
     DCMI_isFormatOf = "http://purl.org/dc/terms/isFormatOf"
     DCMI_hasPart = "http://purl.org/dc/terms/hasPart"
@@ -375,6 +598,8 @@ class IntegrityCheck:
     Class to hold information about completed integrity checks
     """
 
+    __slots__ = ("check_type", "success", "date", "adapter", "fixed", "reason")
+
     def __init__(self, check_type, success, date, adapter, fixed, reason):
         self.check_type = check_type
         self.success = bool(success)
@@ -404,6 +629,9 @@ class Bitstream:
         Class to represent the Bitstream Object or digital file in the Preservica data model
     """
 
+    __slots__ = ("filename", "length", "fixity", "content_url", "bs_index", "gen_index", "co_ref",
+                 "representation", "content_object", "generation")
+
     def __init__(self, filename: str, length: int, fixity: dict, content_url: str):
         self.filename = filename
         self.length = int(length)
@@ -449,6 +677,9 @@ class Generation:
          Class to represent the Generation Object in the Preservica data model
     """
 
+    __slots__ = ("original", "active", "content_object", "format_group", "effective_date", "bitstreams",
+                 "properties", "formats", "gen_index", "asset", "representation_type")
+
     def __init__(self, original: bool, active: bool, format_group: str, effective_date: str, bitstreams: list):
         self.original = bool(original)
         self.active = bool(active)
@@ -478,6 +709,9 @@ class Entity:
         Base Class of Assets, Folders and Content Objects
     """
 
+    __slots__ = ("reference", "title", "description", "security_tag", "parent", "metadata", "entity_type", "path",
+                 "tag", "custom_type")
+
     def __init__(self, reference: str, title: str, description: str, security_tag: str, parent: str, metadata: dict):
         self.reference = reference
         self.title = title
@@ -504,6 +738,14 @@ class Entity:
     def __repr__(self):
         return self.__str__()
 
+    def metadata_urls(self, schema: str) -> list:
+        """
+            The URLs of the metadata fragments with the given schema URI
+
+            The metadata dict is read on each call, so changes made to it in place are included
+        """
+        return [url for url, url_schema in (self.metadata or {}).items() if url_schema == schema]
+
     def has_metadata(self) -> bool:
         return bool(self.metadata)
 
@@ -516,6 +758,8 @@ class Folder(Entity):
        Class to represent the Structural Object or Folder in the Preservica data model
     """
 
+    __slots__ = ()
+
     def __init__(self, reference: str, title: str, description: str = None, security_tag: str = None,
                  parent: str = None, metadata: dict = None):
         super().__init__(reference, title, description, security_tag, parent, metadata)
@@ -529,6 +773,8 @@ class Asset(Entity):
         Class to represent the Information Object or Asset in the Preservica data model
     """
 
+    __slots__ = ()
+
     def __init__(self, reference: str, title: str, description: str = None, security_tag: str = None,
                  parent: str = None, metadata: dict = None):
         super().__init__(reference, title, description, security_tag, parent, metadata)
@@ -542,6 +788,8 @@ class ContentObject(Entity):
        Class to represent the Content Object in the Preservica data model
     """
 
+    __slots__ = ("representation_type", "asset")
+
     def __init__(self, reference: str, title: str, description: str = None, security_tag: str = None,
                  parent: str = None, metadata: dict = None):
         super().__init__(reference, title, description, security_tag, parent, metadata)
@@ -560,6 +808,8 @@ class Representation:
         Class to represent the Representation Object in the Preservica data model
     """
 
+    __slots__ = ("asset", "rep_type", "name", "url")
+
     def __init__(self, asset: Asset, rep_type: str, name: str, url: str):
         self.asset = asset
         self.rep_type = rep_type
@@ -611,6 +861,18 @@ class AsyncProgress(Enum):
     CANCELLED = "CANCELLED"
 
 
+# Reserved words on Windows
+_RESERVED = frozenset({
+    "CON", "PRN", "AUX", "NUL", "COM1", "COM2", "COM3", "COM4", "COM5",
+    "COM6", "COM7", "COM8", "COM9", "LPT1", "LPT2", "LPT3", "LPT4", "LPT5",
+    "LPT6", "LPT7", "LPT8", "LPT9",
+})
+
+# characters removed by sanitize(), the Windows blacklist and everything below code point 32
+_SANITIZE_TRANSLATE = {ord(c): None for c in "\\/:*?\"<>|\0"}
+_SANITIZE_TRANSLATE.update({i: None for i in range(32)})
+
+
 def sanitize(filename) -> str:
     """
     Return a fairly safe version of the filename.
@@ -620,21 +882,14 @@ def sanitize(filename) -> str:
     and make sure we do not exceed Windows filename length limits.
     Hence, a less safe blacklist, rather than a whitelist.
     """
-    blacklist = ["\\", "/", ":", "*", "?", "\"", "<", ">", "|", "\0"]
-    reserved = [
-        "CON", "PRN", "AUX", "NUL", "COM1", "COM2", "COM3", "COM4", "COM5",
-        "COM6", "COM7", "COM8", "COM9", "LPT1", "LPT2", "LPT3", "LPT4", "LPT5",
-        "LPT6", "LPT7", "LPT8", "LPT9",
-    ]  # Reserved words on Windows
-    filename = "".join(c for c in filename if c not in blacklist)
-    # Remove all characters below code point 32
-    filename = "".join(c for c in filename if 31 < ord(c))
+    filename = filename.translate(_SANITIZE_TRANSLATE)
     filename = unicodedata.normalize("NFKD", filename)
     filename = filename.rstrip(". ")  # Windows does not allow these at end
     filename = filename.strip()
-    if all([x == "." for x in filename]):
+    if filename.strip(".") == "":
         filename = "__" + filename
-    if filename in reserved:
+    # Windows reserves the names regardless of case or extension, e.g. "con.txt"
+    if filename.split(".", 1)[0].upper() in _RESERVED:
         filename = "__" + filename
     if len(filename) == 0:
         filename = "__"
@@ -681,17 +936,13 @@ class AuthenticatedAPI:
             Get a list of roles for the user
             :return list of roles:
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json'}
-        request = self.session.get(f"{self.protocol}://{self.server}/api/user/details", headers=headers)
+        headers = {'Content-Type': 'application/json'}
+        request = self._authed_get(f"{self.protocol}://{self.server}/api/user/details", headers=headers)
         logger.debug(request.headers)
         if request.status_code == requests.codes.ok:
-            json_document = str(request.content.decode('utf-8'))
-            logger.debug(json_document)
-            roles: list[str] = json.loads(json_document)['roles']
+            logger.debug(request.content)
+            roles: list[str] = request.json()['roles']
             return roles
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._find_user_roles_()
         return []
 
 
@@ -706,27 +957,24 @@ class AuthenticatedAPI:
         if (self.major_version < 7) and (self.minor_version < 4) and (self.patch_version < 1):
             raise RuntimeError("security_tags API call is only available with a Preservica v6.3.1 system or higher")
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
-        request = self.session.get(f'{self.protocol}://{self.server}/api/security/tags', headers=headers)
+        request = self._authed_get(f'{self.protocol}://{self.server}/api/security/tags', headers=headers,
+                                   stream=True)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
             security_tags = {}
-            tags = entity_response.findall(f'.//{{{self.sec_ns}}}Tag')
-            for tag in tags:
-                if with_permissions:
-                    permissions = []
-                    for p in tag.findall(f'.//{{{self.sec_ns}}}Permission'):
-                        permissions.append(p.text)
-                    security_tags[tag.attrib['name']] = permissions
-                else:
-                    security_tags[tag.attrib['name']] = tag.attrib['name']
+            permissions = []
+            request.raw.decode_content = True
+            with request:
+                for _, element in _xml_iterparse(request.raw):
+                    if element.tag == self._tag_permission:
+                        permissions.append(element.text)
+                    elif element.tag == self._tag_tag:
+                        name = element.attrib['name']
+                        security_tags[name] = permissions if with_permissions else name
+                        permissions = []
+                        element.clear()
             return security_tags
-        if request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.security_tags_base()
         else:
             logger.error(f'security_tags failed {request.status_code}')
             raise RuntimeError(request.status_code, "security_tags failed")
@@ -735,32 +983,32 @@ class AuthenticatedAPI:
         """
         Create a basic entity from XML data
 
-        :param xml_data:
+        :param xml_data: The XML document as str or bytes
         :return: dict
         """
-        entity_response = xml.etree.ElementTree.fromstring(xml_data)
-        reference = entity_response.find(f'.//{{{self.xip_ns}}}Ref')
-        title = entity_response.find(f'.//{{{self.xip_ns}}}Title')
-        security_tag = entity_response.find(f'.//{{{self.xip_ns}}}SecurityTag')
-        description = entity_response.find(f'.//{{{self.xip_ns}}}Description')
-        parent = entity_response.find(f'.//{{{self.xip_ns}}}Parent')
-        custom_type = entity_response.find(f'.//{{{self.xip_ns}}}CustomType')
-
-        if hasattr(parent, 'text'):
+        entity_response = _xml_fromstring(xml_data)
+        reference = entity_response.find(self._q_ref)
+        title = entity_response.find(self._q_title)
+        security_tag = entity_response.find(self._q_security_tag)
+        description = entity_response.find(self._q_description)
+        parent = entity_response.find(self._q_parent)
+        custom_type = entity_response.find(self._q_custom_type)
+
+        if parent is not None:
             parent = parent.text
         else:
             parent = None
 
-        fragments = entity_response.findall(f'.//{{{self.entity_ns}}}Metadata/{{{self.entity_ns}}}Fragment')
+        fragments = entity_response.findall(self._q_frag)
         metadata = {}
         for fragment in fragments:
             metadata[fragment.text] = fragment.attrib['schema']
 
-        entity_dict = {'reference': reference.text, 'title': title.text if hasattr(title, 'text') else None,
-                       'description': description.text if hasattr(description, 'text') else None,
+        entity_dict = {'reference': reference.text, 'title': title.text if title is not None else None,
+                       'description': description.text if description is not None else None,
                        'security_tag': security_tag.text, 'parent': parent, 'metadata': metadata}
 
-        if hasattr(custom_type, 'text'):
+        if custom_type is not None:
             entity_dict['CustomType'] = custom_type.text
 
         return entity_dict
@@ -772,15 +1020,12 @@ class AuthenticatedAPI:
         if self.major_version < 8 and self.minor_version < 3:
             raise RuntimeError("Entitlement API is only available when connected to a v7.3 System")
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json'}
+        headers = {'Content-Type': 'application/json'}
 
-        response = self.session.get(f'{self.protocol}://{self.server}/api/entitlement/edition', headers=headers)
+        response = self._request('GET', f'{self.protocol}://{self.server}/api/entitlement/edition', headers=headers)
 
         if response.status_code == requests.codes.ok:
             return response.json()['edition']
-        elif response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.edition()
         else:
             exception = HTTPException("", response.status_code, response.url,
                                       "edition", response.content.decode('utf-8'))
@@ -811,25 +1056,67 @@ class AuthenticatedAPI:
 
         xml.etree.ElementTree.register_namespace("xip", f"{self.xip_ns}")
 
+        # namespaced search paths used when parsing every entity response
+        self._q_ref = f'.//{{{self.xip_ns}}}Ref'
+        self._q_title = f'.//{{{self.xip_ns}}}Title'
+        self._q_security_tag = f'.//{{{self.xip_ns}}}SecurityTag'
+        self._q_description = f'.//{{{self.xip_ns}}}Description'
+        self._q_parent = f'.//{{{self.xip_ns}}}Parent'
+        self._q_custom_type = f'.//{{{self.xip_ns}}}CustomType'
+        self._q_frag = f'.//{{{self.entity_ns}}}Metadata/{{{self.entity_ns}}}Fragment'
+        self._tag_identifier = f'{{{self.xip_ns}}}Identifier'
+        self._tag_content_object = f'{{{self.xip_ns}}}ContentObject'
+        # child tags of an external identifier
+        self._tag_type = f'{{{self.xip_ns}}}Type'
+        self._tag_value = f'{{{self.xip_ns}}}Value'
+        self._tag_entity = f'{{{self.xip_ns}}}Entity'
+        self._tag_api_id = f'{{{self.xip_ns}}}ApiId'
+        # search paths used when parsing generations, bitstreams and paged listings
+        self._q_generation = f'.//{{{self.xip_ns}}}Generation'
+        self._q_format_group = f'.//{{{self.xip_ns}}}FormatGroup'
+        self._q_effective_date = f'.//{{{self.xip_ns}}}EffectiveDate'
+        self._q_formats = f'.//{{{self.xip_ns}}}Formats/{{{self.xip_ns}}}Format'
+        self._q_puid = f'.//{{{self.xip_ns}}}PUID'
+        self._q_priority = f'.//{{{self.xip_ns}}}Priority'
+        self._q_identification_method = f'.//{{{self.xip_ns}}}IdentificationMethod'
+        self._q_format_name = f'.//{{{self.xip_ns}}}FormatName'
+        self._q_format_version = f'.//{{{self.xip_ns}}}FormatVersion'
+        self._q_properties = f'.//{{{self.xip_ns}}}Properties/{{{self.xip_ns}}}Property'
+        self._q_property_name = f'.//{{{self.xip_ns}}}PropertyName'
+        self._q_value = f'.//{{{self.xip_ns}}}Value'
+        self._q_bitstreams = f'./{{{self.entity_ns}}}Bitstreams/{{{self.entity_ns}}}Bitstream'
+        self._q_filename = f'.//{{{self.xip_ns}}}Filename'
+        self._q_file_size = f'.//{{{self.xip_ns}}}FileSize'
+        self._q_content = f'.//{{{self.entity_ns}}}Content'
+        self._q_next = f'.//{{{self.entity_ns}}}Next'
+        self._q_total_results = f'.//{{{self.entity_ns}}}TotalResults'
+        # tags of repeated elements, matched with iter() rather than a './/' search path
+        self._tag_fixity = f'{{{self.xip_ns}}}Fixity'
+        self._tag_generation_url = f'{{{self.entity_ns}}}Generation'
+        self._tag_representation = f'{{{self.entity_ns}}}Representation'
+        # tags matched while stream parsing paged listings
+        self._tag_child = f'{{{self.entity_ns}}}Child'
+        self._tag_listed_entity = f'{{{self.entity_ns}}}Entity'
+        self._tag_next = f'{{{self.entity_ns}}}Next'
+        self._tag_total_results = f'{{{self.entity_ns}}}TotalResults'
+        if hasattr(self, "sec_ns"):
+            self._tag_tag = f'{{{self.sec_ns}}}Tag'
+            self._tag_permission = f'{{{self.sec_ns}}}Permission'
+
     def __version_number__(self):
         """
         Determine the version number of the server
         """
-        headers = {HEADER_TOKEN: self.token}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/entity/versiondetails/version',
-                                   headers=headers)
+        request = self._authed_get(f'{self._entity_base}/versiondetails/version')
         if request.status_code == requests.codes.ok:
-            xml_ = str(request.content.decode('utf-8'))
-            version = xml_[xml_.find("<CurrentVersion>") + len("<CurrentVersion>"):xml_.find("</CurrentVersion>")]
+            logger.debug(request.content)
+            version = _VERSION_RE.search(request.content).group(1).decode("ascii")
             version_numbers = version.split(".")
             self.major_version = int(version_numbers[0])
             self.minor_version = int(version_numbers[1])
             self.patch_version = int(version_numbers[2])
 
             return version
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.__version_number__()
         else:
             logger.error(f"version number failed with http response {request.status_code}")
             logger.error(str(request.content))
@@ -869,6 +1156,104 @@ class AuthenticatedAPI:
             RuntimeError(response.status_code, "Could not generate valid manager approval token")
             return ""
 
+    @property
+    def token(self) -> str:
+        """
+            The current API access token, setting it also makes it a default header of the session
+        """
+        return self._token
+
+    @token.setter
+    def token(self, value: str):
+        self._token = value
+        self._token_expiry = time.monotonic() + TOKEN_LIFETIME
+        self.session.headers[HEADER_TOKEN] = value
+        if self._client is not None and value is not None:
+            self._client.headers[HEADER_TOKEN] = value
+
+    def _refresh_token(self, stale_token: str = None) -> str:
+        """
+            Replace an expired token with a new one
+
+            Only one thread logs in at a time, if another thread has already replaced stale_token
+            its new token is returned without calling the login endpoint again.
+
+            :param stale_token: The token which was rejected or is about to expire
+            :return: API Token
+        """
+        with self._token_lock:
+            if stale_token is not None and self.token != stale_token:
+                return self.token
+            self.token = self.__token__()
+            return self.token
+
+    def _request(self, method: str, url: str, headers: dict = None, **kwargs) -> requests.Response:
+        """
+            Authenticated request
+
+            The token is refreshed before the call if it is close to expiry and the request is retried
+            once with a new token if the server returns 401. A file like request body is rewound before
+            the retry. Requests which carry their own token header, e.g. a manager token, are not retried.
+
+            Throttled (429) and unavailable (502, 503, 504) responses are retried by the session with an
+            exponential backoff which waits for at least the Retry-After time sent by the server.
+
+            If the client was created with use_http2=True, entity API GET requests which are not streamed are
+            sent over a single multiplexed HTTP/2 connection and return a httpx.Response.
+
+            :param method: The HTTP method
+            :param url: The request url
+            :param headers: Extra request headers, the access token is a default header of the session
+            :return: The response
+        """
+        headers = headers or {}
+        if HEADER_TOKEN in headers:
+            return self.session.request(method, url, headers=headers, **kwargs)
+        send = self.session.request
+        if self._client is not None and method == 'GET' and kwargs.keys() <= {'params'} \
+                and url.startswith(self._entity_base):
+            send = self._http2_request
+        data = kwargs.get('data')
+        position = data.tell() if hasattr(data, 'seek') else None
+        token = self.token
+        if time.monotonic() > self._token_expiry - TOKEN_REFRESH_MARGIN:
+            token = self._refresh_token(token)
+        response = send(method, url, headers=headers, **kwargs)
+        if response.status_code == requests.codes.unauthorized:
+            response.close()
+            if position is not None:
+                data.seek(position)
+            self._refresh_token(token)
+            response = send(method, url, headers=headers, **kwargs)
+        return response
+
+    def _http2_request(self, method: str, url: str, **kwargs):
+        """
+            Send a request over the HTTP/2 client
+
+            The HTTP/2 client only retries failed connection attempts, so if the request fails or the server is
+            throttled or unavailable it is sent again over the session, which backs off and retries.
+        """
+        try:
+            response = self._client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            logger.debug(f"HTTP/2 request failed, retrying over HTTP/1.1: {e!r}")
+            return self.session.request(method, url, **kwargs)
+        if response.status_code in RETRY_STATUS_CODES:
+            response.close()
+            return self.session.request(method, url, **kwargs)
+        return response
+
+    def _authed_get(self, url: str, headers: dict = None, **kwargs) -> requests.Response:
+        """
+            Authenticated GET request, see _request
+
+            :param url: The request url
+            :param headers: Extra request headers, the access token is a default header of the session
+            :return: The response
+        """
+        return self._request('GET', url, headers, **kwargs)
+
     def __token__(self) -> str:
         """
             Generate am API token to use to authenticate calls
@@ -942,29 +1327,53 @@ class AuthenticatedAPI:
 
     def __init__(self, username: str = None, password: str = None, tenant: str = None, server: str = None,
                  use_shared_secret: bool = False, two_fa_secret_key: str = None,
-                 protocol: str = "https", request_hook=None, credentials_path: str = 'credentials.properties'):
+                 protocol: str = "https", request_hook=None, credentials_path: str = 'credentials.properties',
+                 use_http2: bool = False):
 
-        config = configparser.ConfigParser(interpolation=configparser.Interpolation())
-        config.read(os.path.relpath(credentials_path), encoding='utf-8')
+        config = _read_credentials(credentials_path, configparser.Interpolation)
         self.session: Session = requests.Session()
 
         if request_hook is not None:
             self.session.hooks['response'].append(request_hook)
 
         retries = Retry(
-            total=3,
-            backoff_factor=0.1,
-            status_forcelist=[502, 503, 504],
-            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
         )
 
         self.shared_secret: bool = bool(use_shared_secret)
         self.protocol = protocol
         self.two_fa_secret_key = two_fa_secret_key
 
-        self.session.mount(f'{self.protocol}://', HTTPAdapter(max_retries=retries))
+        self.session.mount(f'{self.protocol}://', HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                                                              pool_maxsize=POOL_MAXSIZE, max_retries=retries))
+        self.session.headers['Connection'] = 'keep-alive'
+        self.session.headers['User-Agent'] = (f'pyPreservica SDK/({pyPreservica.__version__}) '
+                                              f' ({platform.platform()}/{os.name}/{sys.platform})')
+
+        self.session.request = functools.partial(self.session.request, timeout=(CONNECT_TIME_OUT, TIME_OUT))
 
-        self.session.request = functools.partial(self.session.request, timeout=TIME_OUT)
+        # optional HTTP/2 client for entity GET requests. It does not use the session proxies, cookies,
+        # certificate settings or response hooks, so it is only created when asked for
+        self._client = None
+        if use_http2:
+            if httpx is None:
+                msg = "Package httpx with HTTP/2 support is required for use_http2. pip install pyPreservica[http2]"
+                logger.error(msg)
+                raise RuntimeError(msg)
+            if request_hook is not None:
+                msg = "request_hook cannot be used together with use_http2"
+                logger.error(msg)
+                raise RuntimeError(msg)
+            limits = httpx.Limits(max_connections=POOL_CONNECTIONS, max_keepalive_connections=POOL_CONNECTIONS)
+            self._client = httpx.Client(transport=httpx.HTTPTransport(http2=True, limits=limits, retries=3),
+                                        timeout=httpx.Timeout(TIME_OUT, connect=CONNECT_TIME_OUT),
+                                        follow_redirects=True,
+                                        headers={'User-Agent': self.session.headers['User-Agent']})
 
         if not two_fa_secret_key:
             two_fa_secret_key = os.environ.get('PRESERVICA_2FA_TOKEN')
@@ -1028,14 +1437,17 @@ class AuthenticatedAPI:
         else:
             self.server = server
 
-        self.token = self.__token__()
+        # base URLs shared by most requests
+        self._entity_base = f'{self.protocol}://{self.server}/api/entity'
+        self._content_base = f'{self.protocol}://{self.server}/api/content'
+
+        self._token_lock = threading.Lock()
+        self.token = None
+        self._refresh_token()
         self.version = self.__version_number__()
         self.__version_namespace__()
         self.roles = self._find_user_roles_()
 
-        self.session.headers.update({'User-Agent': f'pyPreservica SDK/({pyPreservica.__version__}) '
-                                                   f' ({platform.platform()}/{os.name}/{sys.platform})'})
-
         logger.debug(self.xip_ns)
         logger.debug(self.entity_ns)
 
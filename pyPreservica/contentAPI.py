@@ -10,6 +10,7 @@ licence:    Apache License 2.0
 """
 
 import csv
+import shutil
 from io import BytesIO
 from typing import Generator, Callable, Optional, Union
 from pyPreservica.common import *
@@ -103,40 +104,34 @@ class ContentAPI(AuthenticatedAPI):
         :param reference:
         :return: Dictionary of object attributes
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json'}
+        headers = {'Content-Type': 'application/json'}
         if type(entity_type) == EntityType:
             params = {'id': f'sdb:{entity_type.value}|{reference}'}
         else:
             params = {'id': f'sdb:{entity_type}|{reference}'}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/content/object-details', params=params,
-                                   headers=headers)
+        request = self._request('GET', f'{self.protocol}://{self.server}/api/content/object-details', params=params,
+                                headers=headers)
         if request.status_code == requests.codes.ok:
             return request.json()["value"]
         elif request.status_code == requests.codes.not_found:
             logger.error(f"The requested reference is not found in the repository: {reference}")
             raise RuntimeError(reference, "The requested reference is not found in the repository")
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.object_details(entity_type, reference)
         else:
             logger.error(f"object_details failed with error code: {request.status_code}")
             raise RuntimeError(request.status_code, f"object_details failed with error code: {request.status_code}")
 
 
     def download_bytes(self, reference):
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/octet-stream'}
+        headers = {'Content-Type': 'application/octet-stream'}
         params = {'id': f'sdb:IO|{reference}'}
-        with self.session.get(f'{self.protocol}://{self.server}/api/content/download', params=params, headers=headers,
-                              stream=True) as req:
+        with self._request('GET', f'{self.protocol}://{self.server}/api/content/download', params=params, headers=headers,
+                           stream=True) as req:
             if req.status_code == requests.codes.ok:
                 file_bytes = BytesIO()
-                for chunk in req.iter_content(chunk_size=CHUNK_SIZE):
-                    file_bytes.write(chunk)
+                req.raw.decode_content = True
+                shutil.copyfileobj(req.raw, file_bytes, CHUNK_SIZE)
                 file_bytes.seek(0)
                 return file_bytes
-            elif req.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.download_bytes(reference)
             elif req.status_code == requests.codes.not_found:
                 logger.error(f"The requested asset reference is not found in the repository: {reference}")
                 raise RuntimeError(reference, "The requested reference is not found in the repository")
@@ -146,20 +141,15 @@ class ContentAPI(AuthenticatedAPI):
 
 
     def download(self, reference, filename):
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/octet-stream'}
+        headers = {'Content-Type': 'application/octet-stream'}
         params = {'id': f'sdb:IO|{reference}'}
-        with self.session.get(f'{self.protocol}://{self.server}/api/content/download', params=params, headers=headers,
-                              stream=True) as req:
+        with self._request('GET', f'{self.protocol}://{self.server}/api/content/download', params=params, headers=headers,
+                           stream=True) as req:
             if req.status_code == requests.codes.ok:
                 with open(filename, 'wb') as file:
-                    for chunk in req.iter_content(chunk_size=CHUNK_SIZE):
-                        file.write(chunk)
-                        file.flush()
-                file.close()
+                    req.raw.decode_content = True
+                    shutil.copyfileobj(req.raw, file, CHUNK_SIZE)
                 return filename
-            elif req.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.download(reference, filename)
             elif req.status_code == requests.codes.not_found:
                 logger.error(f"The requested asset reference is not found in the repository: {reference}")
                 raise RuntimeError(reference, "The requested reference is not found in the repository")
@@ -168,18 +158,15 @@ class ContentAPI(AuthenticatedAPI):
                 raise RuntimeError(req.status_code, f"download failed with error code: {req.status_code}")
 
     def thumbnail_bytes(self, entity_type, reference: str, size: Thumbnail = Thumbnail.LARGE) -> Union[BytesIO, None]:
-        headers = {HEADER_TOKEN: self.token, 'accept': 'image/png'}
+        headers = {'accept': 'image/png'}
         params = {'id': f'sdb:{entity_type}|{reference}', 'size': f'{size.value}'}
-        with self.session.get(f'{self.protocol}://{self.server}/api/content/thumbnail', params=params, headers=headers, stream=True) as req:
+        with self._request('GET', f'{self.protocol}://{self.server}/api/content/thumbnail', params=params, headers=headers, stream=True) as req:
             if req.status_code == requests.codes.ok:
                 file_bytes = BytesIO()
-                for chunk in req.iter_content(chunk_size=CHUNK_SIZE):
-                    file_bytes.write(chunk)
+                req.raw.decode_content = True
+                shutil.copyfileobj(req.raw, file_bytes, CHUNK_SIZE)
                 file_bytes.seek(0)
                 return file_bytes
-            elif req.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.thumbnail_bytes(entity_type, reference, size)
             elif req.status_code == requests.codes.not_found:
                 logger.error(req.content.decode("utf-8"))
                 logger.error(f"The requested reference is not found in the repository: {reference}")
@@ -189,19 +176,15 @@ class ContentAPI(AuthenticatedAPI):
                 raise RuntimeError(req.status_code, f"thumbnail failed with error code: {req.status_code}")
 
     def thumbnail(self, entity_type, reference, filename, size=Thumbnail.LARGE):
-        headers = {HEADER_TOKEN: self.token, 'accept': 'image/png'}
+        headers = {'accept': 'image/png'}
         params = {'id': f'sdb:{entity_type}|{reference}', 'size': f'{size.value}'}
-        with self.session.get(f'{self.protocol}://{self.server}/api/content/thumbnail', params=params, headers=headers,
-                              stream=True) as req:
+        with self._request('GET', f'{self.protocol}://{self.server}/api/content/thumbnail', params=params, headers=headers,
+                           stream=True) as req:
             if req.status_code == requests.codes.ok:
                 with open(filename, 'wb') as file:
-                    for chunk in req.iter_content(chunk_size=CHUNK_SIZE):
-                        file.write(chunk)
-                        file.flush()
+                    req.raw.decode_content = True
+                    shutil.copyfileobj(req.raw, file, CHUNK_SIZE)
                 return filename
-            elif req.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.thumbnail(entity_type, reference, filename, size)
             elif req.status_code == requests.codes.not_found:
                 logger.error(req.content.decode("utf-8"))
                 logger.error(f"The requested reference is not found in the repository: {reference}")
@@ -211,17 +194,13 @@ class ContentAPI(AuthenticatedAPI):
                 raise RuntimeError(req.status_code, f"thumbnail failed with error code: {req.status_code}")
 
     def indexed_fields(self):
-        headers = {HEADER_TOKEN: self.token}
-        results = self.session.get(f'{self.protocol}://{self.server}/api/content/indexed-fields', headers=headers)
+        results = self._request('GET', f'{self.protocol}://{self.server}/api/content/indexed-fields')
         if results.status_code == requests.codes.ok:
             fields = {}
             for ob in results.json()["value"]:
                 field = f'{ob["shortName"]}.{ob["index"]}'
                 fields[field] = ob["uri"]
             return fields
-        elif results.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.indexed_fields()
         else:
             logger.error(f"indexed_fields failed with error code: {results.status_code}")
             raise RuntimeError(results.status_code, f"indexed_fields failed with error code: {results.status_code}")
@@ -253,15 +232,15 @@ class ContentAPI(AuthenticatedAPI):
 
     def _simple_search(self, query: str = "%", start_index: int = 0, page_size: int = 10, list_indexes: list = None):
         start_from = str(start_index)
-        headers = {'Content-Type': 'application/x-www-form-urlencoded', HEADER_TOKEN: self.token}
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
         query_term = ('{ "q":  "%s" }' % query)
         if list_indexes is None or len(list_indexes) == 0:
             metadata_fields = "xip.title,xip.description,xip.document_type,xip.parent_ref,xip.security_descriptor"
         else:
             metadata_fields = ','.join(list_indexes)
         payload = {'start': start_from, 'max': str(page_size), 'metadata': metadata_fields, 'q': query_term}
-        results = self.session.post(f'{self.protocol}://{self.server}/api/content/search', data=payload,
-                                    headers=headers)
+        results = self._request('POST', f'{self.protocol}://{self.server}/api/content/search', data=payload,
+                                headers=headers)
         results_list = []
         if results.status_code == requests.codes.ok:
             json_doc = results.json()
@@ -283,9 +262,6 @@ class ContentAPI(AuthenticatedAPI):
 
             search_results = self.SearchResult(metadata, refs, hits, results_list, next_start)
             return search_results
-        elif results.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._simple_search(query, start_index, page_size, list_indexes)
         else:
             logger.error(f"search failed with error code: {results.status_code}")
             raise RuntimeError(results.status_code, f"simple_search failed with error code: {results.status_code}")
@@ -332,7 +308,7 @@ class ContentAPI(AuthenticatedAPI):
     def _search_fields(self, query: str = "%", fields: list[Field]=None, start_index: int = 0, page_size: int = 25):
 
         start_from = str(start_index)
-        headers = {'Content-Type': 'application/x-www-form-urlencoded', HEADER_TOKEN: self.token}
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
 
         if fields is None:
             fields = []
@@ -380,8 +356,8 @@ class ContentAPI(AuthenticatedAPI):
 
         payload = {'start': start_from, 'max': str(page_size), 'metadata': list(metadata_elements), 'q': query_term}
         logger.debug(payload)
-        results = self.session.post(f'{self.protocol}://{self.server}/api/content/search', data=payload,
-                                    headers=headers)
+        results = self._request('POST', f'{self.protocol}://{self.server}/api/content/search', data=payload,
+                                headers=headers)
         results_list = []
         if results.status_code == requests.codes.ok:
             json_doc = results.json()
@@ -403,9 +379,6 @@ class ContentAPI(AuthenticatedAPI):
 
             search_results = self.SearchResult(metadata, refs, hits, results_list, next_start)
             return search_results
-        elif results.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._search_fields(query, fields, start_index, page_size)
         else:
             logger.error(f"search failed with error code: {results.status_code}")
             raise RuntimeError(results.status_code, f"search_index_filter failed")
@@ -440,7 +413,7 @@ class ContentAPI(AuthenticatedAPI):
         :return: Number of search results
         """
         start_from = str(0)
-        headers = {'Content-Type': 'application/x-www-form-urlencoded', HEADER_TOKEN: self.token}
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
 
         field_list = []
         for key, value in filter_values.items():
@@ -459,14 +432,11 @@ class ContentAPI(AuthenticatedAPI):
         query_term = ('{ "q":  "%s",  "fields":  [ %s ] }' % (query, filter_terms))
 
         payload = {'start': start_from, 'max': str(10), 'metadata': list(filter_values.keys()), 'q': query_term}
-        results = self.session.post(f'{self.protocol}://{self.server}/api/content/search', data=payload,
-                                    headers=headers)
+        results = self._request('POST', f'{self.protocol}://{self.server}/api/content/search', data=payload,
+                                headers=headers)
         if results.status_code == requests.codes.ok:
             json_doc = results.json()
             return int(json_doc['value']['totalHits'])
-        elif results.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.search_index_filter_hits(query, filter_values)
         else:
             logger.error(f"search failed with error code: {results.status_code}")
             raise RuntimeError(results.status_code, f"_search_index_filter_hits failed")
@@ -474,7 +444,7 @@ class ContentAPI(AuthenticatedAPI):
     def _search_index_filter(self, query: str = "%", start_index: int = 0, page_size: int = 25,
                              filter_values: dict = None, sort_values: dict = None):
         start_from = str(start_index)
-        headers = {'Content-Type': 'application/x-www-form-urlencoded', HEADER_TOKEN: self.token}
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
 
         if filter_values is None:
             filter_values = {}
@@ -507,8 +477,8 @@ class ContentAPI(AuthenticatedAPI):
 
         payload = {'start': start_from, 'max': str(page_size), 'metadata': list(filter_values.keys()), 'q': query_term}
         logger.debug(payload)
-        results = self.session.post(f'{self.protocol}://{self.server}/api/content/search', data=payload,
-                                    headers=headers)
+        results = self._request('POST', f'{self.protocol}://{self.server}/api/content/search', data=payload,
+                                headers=headers)
         results_list = []
         if results.status_code == requests.codes.ok:
             json_doc = results.json()
@@ -530,9 +500,6 @@ class ContentAPI(AuthenticatedAPI):
 
             search_results = self.SearchResult(metadata, refs, hits, results_list, next_start)
             return search_results
-        elif results.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._search_index_filter(query, start_index, page_size, filter_values)
         else:
             logger.error(f"search failed with error code: {results.status_code}")
             raise RuntimeError(results.status_code, f"search_index_filter failed")
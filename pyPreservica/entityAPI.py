@@ -9,19 +9,90 @@ licence:    Apache License 2.0
 
 """
 
+import asyncio
 import os.path
+import random
+import shutil
+import threading
 import uuid
 import xml.etree.ElementTree
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta, timezone
 from io import BytesIO
-from time import sleep
+from time import monotonic, sleep
+from types import MappingProxyType
 from typing import Any, Generator, Tuple, Iterable, Union, Callable
+from xml.sax.saxutils import escape
 
 
 from pyPreservica.common import *
+from pyPreservica.common import _read_credentials, _xml_fromstring, _xml_iterfind, _xml_iterparse
 
 logger = logging.getLogger(__name__)
 
+FETCH_WORKERS = 16
+
+_POOL = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="pyPreservica")
+# bitstreams are fetched by generations which may already be running on _POOL, a separate
+# pool means those tasks never wait on work queued behind them
+_BITSTREAM_POOL = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="pyPreservica-bitstream")
+
+# request headers shared by every call, the access token is a default header of the session.
+# They are read-only, a call which adds headers of its own must copy them first
+_XML_HEADERS = MappingProxyType({'Content-Type': 'application/xml;charset=UTF-8'})
+_TEXT_HEADERS = MappingProxyType({'Content-Type': 'text/plain'})
+_OCTET_HEADERS = MappingProxyType({'Content-Type': 'application/octet-stream'})
+
+# delays in seconds between polls of a running workflow
+POLL_INITIAL_DELAY = 1.0
+POLL_BACKOFF = 1.7
+POLL_MAX_DELAY = 30.0
+
+# parsed entities can be kept for a short time so repeated lookups of the same reference
+# are served without a round trip. The cache is off by default (a TTL of zero) because a cached
+# entity does not show changes made by other clients or by workflows which are still running
+ENTITY_CACHE_SIZE = 512
+ENTITY_CACHE_TTL = 0.0
+# generation and bitstream documents can be cached in the same way. This is also off by default, the
+# documents hold fixity values which can be changed by other sessions, migrations and deletions
+DETAIL_CACHE_SIZE = 2048
+DETAIL_CACHE_TTL = 0.0
+
+
+def _poll_wait(delay: float) -> float:
+    """
+    Sleep before polling a workflow again and return the delay to use next time
+
+    Up to a quarter of the delay is added at random so clients started together do not poll in step.
+    """
+    sleep(delay + random.uniform(0, delay * 0.25))
+    return min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+
+
+# request bodies with a fixed shape are formatted directly rather than built as an element tree
+_ENTITY_TMPL = ('<{tag} xmlns="{ns}"><Ref>{ref}</Ref><Title>{title}</Title><Description>{description}</Description>'
+                '<SecurityTag>{security_tag}</SecurityTag>{optional}</{tag}>')
+_IDENTIFIER_TMPL = '<Identifier xmlns="{ns}"><Type>{type}</Type><Value>{value}</Value><Entity>{ref}</Entity></Identifier>'
+
+
+def _xml_text(value) -> str:
+    return "" if value is None else escape(str(value))
+
+
+def _xml_optional(tag: str, value) -> str:
+    return "" if value is None else f"<{tag}>{escape(str(value))}</{tag}>"
+
+
+# entity type -> (API path, class, name used in error messages)
+_ENTITY_SPEC = {
+    EntityType.ASSET: (IO_PATH, Asset, "asset"),
+    EntityType.FOLDER: (SO_PATH, Folder, "folder"),
+    EntityType.CONTENT_OBJECT: (CO_PATH, ContentObject, "content_object"),
+}
+# type attribute of a listed entity -> class
+_LISTED_TYPES = {entity_type.value: spec[1] for entity_type, spec in _ENTITY_SPEC.items()}
+
 
 class EntityAPI(AuthenticatedAPI):
     """
@@ -36,14 +107,92 @@ class EntityAPI(AuthenticatedAPI):
 
     def __init__(self, username: str = None, password: str = None, tenant: str = None, server: str = None,
                  use_shared_secret: bool = False, two_fa_secret_key: str = None,
-                 protocol: str = "https", request_hook: Callable = None, credentials_path: str = 'credentials.properties'):
+                 protocol: str = "https", request_hook: Callable = None, credentials_path: str = 'credentials.properties',
+                 use_http2: bool = False):
 
         super().__init__(username, password, tenant, server, use_shared_secret, two_fa_secret_key,
-                         protocol, request_hook, credentials_path)
+                         protocol, request_hook, credentials_path, use_http2)
 
         xml.etree.ElementTree.register_namespace("oai_dc", "http://www.openarchives.org/OAI/2.0/oai_dc/")
         xml.etree.ElementTree.register_namespace("ead", "urn:isbn:1-931666-22-9")
 
+        self._entity_cache = OrderedDict()
+        self._entity_cache_lock = threading.Lock()
+        self._entity_cache_generation = 0
+        self._detail_cache = OrderedDict()
+        self._detail_cache_lock = threading.Lock()
+
+    def _cached_entity(self, entity_type: EntityType, reference: str) -> Union[dict, None]:
+        key = (entity_type, reference)
+        with self._entity_cache_lock:
+            item = self._entity_cache.get(key)
+            if item is None:
+                return None
+            expires, entity = item
+            if expires < monotonic():
+                del self._entity_cache[key]
+                return None
+            self._entity_cache.move_to_end(key)
+            return entity
+
+    def _cache_entity(self, entity_type: EntityType, reference: str, entity: dict, generation: int):
+        if ENTITY_CACHE_TTL <= 0:
+            return
+        key = (entity_type, reference)
+        with self._entity_cache_lock:
+            # skip the store if the entity was changed while it was being fetched
+            if generation != self._entity_cache_generation:
+                return
+            self._entity_cache[key] = (monotonic() + ENTITY_CACHE_TTL, entity)
+            self._entity_cache.move_to_end(key)
+            while len(self._entity_cache) > ENTITY_CACHE_SIZE:
+                self._entity_cache.popitem(last=False)
+
+    def _forget_entity(self, entity: Entity):
+        """
+        Drop an entity from the cache after it has been changed on the server
+        """
+        with self._entity_cache_lock:
+            self._entity_cache_generation += 1
+            self._entity_cache.pop((entity.entity_type, entity.reference), None)
+
+    def _detail_content(self, url: str, name: str) -> bytes:
+        """
+        Fetch a generation or bitstream document
+
+        If DETAIL_CACHE_TTL is set, repeated requests for the same URL are served from a cache
+        """
+        with self._detail_cache_lock:
+            item = self._detail_cache.get(url)
+            if item is not None:
+                expires, content = item
+                if expires >= monotonic():
+                    self._detail_cache.move_to_end(url)
+                    return content
+                del self._detail_cache[url]
+        request = self._request('GET', url)
+        if request.status_code != requests.codes.ok:
+            exception = HTTPException(url, request.status_code, request.url, name, request.content.decode('utf-8'))
+            logger.error(exception)
+            raise exception
+        logger.debug(request.content)
+        if DETAIL_CACHE_TTL > 0:
+            with self._detail_cache_lock:
+                self._detail_cache[url] = (monotonic() + DETAIL_CACHE_TTL, request.content)
+                self._detail_cache.move_to_end(url)
+                while len(self._detail_cache) > DETAIL_CACHE_SIZE:
+                    self._detail_cache.popitem(last=False)
+        return request.content
+
+    def _forget_generations(self, content_object: ContentObject):
+        """
+        Drop the cached generation and bitstream documents of a content object whose generations have changed
+        """
+        prefix = f'{self._entity_base}/{CO_PATH}/{content_object.reference}/generations'
+        with self._detail_cache_lock:
+            for url in [url for url in self._detail_cache if url.startswith(prefix)]:
+                del self._detail_cache[url]
+
     def user_security_tags(self, with_permissions: bool = False) -> dict:
         """
              Return  security tags available for the  current user
@@ -72,11 +221,8 @@ class EntityAPI(AuthenticatedAPI):
         if not isinstance(bitstream, Bitstream):
             logger.error("bitstream_content argument is not a Bitstream object")
             raise RuntimeError("bitstream_bytes argument is not a Bitstream object")
-        with self.session.get(bitstream.content_url, headers={HEADER_TOKEN: self.token}, stream=True) as request:
-            if request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                yield from self.bitstream_chunks(bitstream)
-            elif request.status_code == requests.codes.ok:
+        with self._request('GET', bitstream.content_url, stream=True) as request:
+            if request.status_code == requests.codes.ok:
                 for chunk in request.iter_content(chunk_size=chunk_size):
                     yield chunk
             else:
@@ -102,14 +248,11 @@ class EntityAPI(AuthenticatedAPI):
         if not isinstance(bitstream, Bitstream):
             logger.error("bitstream_content argument is not a Bitstream object")
             raise RuntimeError("bitstream_bytes argument is not a Bitstream object")
-        with self.session.get(bitstream.content_url, headers={HEADER_TOKEN: self.token}, stream=True) as response:
-            if response.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.bitstream_bytes(bitstream)
-            elif response.status_code == requests.codes.ok:
+        with self._request('GET', bitstream.content_url, stream=True) as response:
+            if response.status_code == requests.codes.ok:
                 file_bytes = BytesIO()
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    file_bytes.write(chunk)
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, file_bytes, chunk_size)
                 file_bytes.seek(0)
                 if file_bytes.getbuffer().nbytes == bitstream.length:
                     logger.debug(f"Downloaded {bitstream.length} bytes from {bitstream.filename}")
@@ -138,21 +281,16 @@ class EntityAPI(AuthenticatedAPI):
 
         storage_locations = []
 
-        url: str = f'{self.protocol}://{self.server}/api/entity/content-objects/{bitstream.co_ref}/generations/{bitstream.gen_index}/bitstreams/{bitstream.bs_index}/storage-locations'
+        url: str = f'{self._entity_base}/content-objects/{bitstream.co_ref}/generations/{bitstream.gen_index}/bitstreams/{bitstream.bs_index}/storage-locations'
 
-        with self.session.get(url, headers={HEADER_TOKEN: self.token}, stream=True) as request:
+        with self._request('GET', url, stream=True) as request:
             if request.status_code == requests.codes.ok:
-                xml_response = str(request.content.decode('utf-8'))
-                entity_response = xml.etree.ElementTree.fromstring(xml_response)
-                logger.debug(xml_response)
+                entity_response = _xml_fromstring(request.content)
+                logger.debug(request.content)
                 locations = entity_response.find(f'.//{{{self.entity_ns}}}StorageLocation')
                 for adapter in locations:
                     storage_locations.append(adapter.attrib['name'])
                 return storage_locations
-
-            if request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.bitstream_location(bitstream)
             else:
                 exception = HTTPException(bitstream.filename, request.status_code, request.url, "bitstream_location",
                                           request.content.decode('utf-8'))
@@ -183,16 +321,13 @@ class EntityAPI(AuthenticatedAPI):
         if not isinstance(bitstream, Bitstream):
             logger.error("bitstream_content argument is not a Bitstream object")
             raise RuntimeError("bitstream_content argument is not a Bitstream object")
-        with self.session.get(bitstream.content_url, headers={HEADER_TOKEN: self.token}, stream=True) as request:
-            if request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.bitstream_content(bitstream, filename)
-            elif request.status_code == requests.codes.ok:
+        with self._request('GET', bitstream.content_url, stream=True) as request:
+            if request.status_code == requests.codes.ok:
                 with open(filename, 'wb') as file:
-                    for chunk in request.iter_content(chunk_size=chunk_size):
-                        file.write(chunk)
-                    file.flush()
-                if os.path.getsize(filename) == bitstream.length:
+                    request.raw.decode_content = True
+                    shutil.copyfileobj(request.raw, file, chunk_size)
+                    written = file.tell()
+                if written == bitstream.length:
                     logger.debug(f"Downloaded {bitstream.length} bytes into {filename}")
                     return bitstream.length
                 else:
@@ -217,19 +352,15 @@ class EntityAPI(AuthenticatedAPI):
         :rtype: str
 
         """
-        headers = {HEADER_TOKEN: self.__token__(), 'Content-Type': 'application/xml;charset=UTF-8'}
-        download = self.session.get(f'{self.protocol}://{self.server}/api/entity/actions/exports/{pid}/content',
-                                    stream=True, headers=headers)
+        headers = _XML_HEADERS
+        download = self._request('GET', f'{self._entity_base}/actions/exports/{pid}/content',
+                                 stream=True, headers=headers)
         if download.status_code == requests.codes.ok:
             with open(f'{pid}.zip', 'wb') as file:
-                for chunk in download.iter_content(chunk_size=CHUNK_SIZE):
-                    file.write(chunk)
-                file.flush()
+                download.raw.decode_content = True
+                shutil.copyfileobj(download.raw, file, CHUNK_SIZE)
             logger.debug(f"Downloaded open package into {pid}.zip")
             return f'{pid}.zip'
-        elif download.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.download_opex(pid)
         else:
             exception = HTTPException(pid, download.status_code, download.url, "download_opex",
                                       download.content.decode('utf-8'))
@@ -254,7 +385,7 @@ class EntityAPI(AuthenticatedAPI):
         if self.major_version < 7 and self.minor_version < 2:
             raise RuntimeError("export_opex API is only available when connected to a v6.2 system or above")
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = _XML_HEADERS
 
         include_content_options = ("Content", "NoContent")
         include_metadata_options = ("Metadata", "NoMetadata", "MetadataWithEvents")
@@ -294,17 +425,12 @@ class EntityAPI(AuthenticatedAPI):
 
         logger.debug(xml_request)
 
-        request = self.session.post(
-            f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/exports',
+        request = self._request(
+            'POST', f'{self._entity_base}/{entity.path}/{entity.reference}/exports',
             headers=headers, data=xml_request)
 
         if request.status_code == requests.codes.accepted:
-            return str(request.content.decode('utf-8'))
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.__export_opex_start__(entity, IncludeContent=include_content,
-                                              IncludeMetadata=include_metadata, IncludedGenerations=include_generation,
-                                              IncludeParentHierarchy=include_parent)
+            return request.content.decode('utf-8')
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "__export_opex_start__",
                                       request.content.decode('utf-8'))
@@ -380,19 +506,15 @@ class EntityAPI(AuthenticatedAPI):
         :return: The filename
         :rtype: str
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/octet-stream'}
+        headers = _OCTET_HEADERS
         params = {'id': f'sdb:{entity.entity_type.value}|{entity.reference}'}
-        with self.session.get(f'{self.protocol}://{self.server}/api/content/download', params=params, headers=headers,
-                              stream=True) as request:
+        with self._request('GET', f'{self._content_base}/download', params=params,
+                           headers=headers, stream=True) as request:
             if request.status_code == requests.codes.ok:
                 with open(filename, 'wb') as file:
-                    for chunk in request.iter_content(chunk_size=CHUNK_SIZE):
-                        file.write(chunk)
-                    file.flush()
+                    request.raw.decode_content = True
+                    shutil.copyfileobj(request.raw, file, CHUNK_SIZE)
                 return filename
-            elif request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.download(entity, filename)
             else:
                 exception = HTTPException(entity.reference, request.status_code, request.url, "download",
                                           request.content.decode('utf-8'))
@@ -406,17 +528,14 @@ class EntityAPI(AuthenticatedAPI):
 
             :param entity: The entity
          """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/octet-stream'}
+        headers = _OCTET_HEADERS
         params = {'id': f'sdb:{entity.entity_type.value}|{entity.reference}', 'size': f'{Thumbnail.SMALL.value}'}
-        with self.session.get(f'{self.protocol}://{self.server}/api/content/thumbnail', params=params,
-                              headers=headers) as request:
+        with self._request('GET', f'{self._content_base}/thumbnail', params=params,
+                           headers=headers) as request:
             if request.status_code == requests.codes.ok:
                 return True
             if request.status_code == requests.codes.not_found:
                 return False
-            elif request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.has_thumbnail(entity)
             else:
                 exception = HTTPException(entity.reference, request.status_code, request.url, "has_thumbnail",
                                           request.content.decode('utf-8'))
@@ -433,21 +552,17 @@ class EntityAPI(AuthenticatedAPI):
         :return: The filename
         :rtype: str
          """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/octet-stream'}
+        headers = _OCTET_HEADERS
         params = {'id': f'sdb:{entity.entity_type.value}|{entity.reference}', 'size': f'{size.value}'}
-        with self.session.get(f'{self.protocol}://{self.server}/api/content/thumbnail', params=params,
-                              headers=headers, stream=True) as request:
+        with self._request('GET', f'{self._content_base}/thumbnail', params=params,
+                           headers=headers, stream=True) as request:
             if request.status_code == requests.codes.ok:
                 with open(filename, 'wb') as file:
-                    for chunk in request.iter_content(chunk_size=CHUNK_SIZE):
-                        file.write(chunk)
-                    file.flush()
+                    request.raw.decode_content = True
+                    shutil.copyfileobj(request.raw, file, CHUNK_SIZE)
                 return filename
             elif request.status_code == requests.codes.not_found:
                 return None
-            elif request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.thumbnail(entity, filename, size=size)
             else:
                 exception = HTTPException(entity.reference, request.status_code, request.url, "thumbnail",
                                           request.content.decode('utf-8'))
@@ -468,40 +583,27 @@ class EntityAPI(AuthenticatedAPI):
         if (self.major_version < 7) and (self.minor_version < 1):
             raise RuntimeError("delete_identifiers API call is not available when connected to a v6.0 System")
 
-        headers = {HEADER_TOKEN: self.token}
-        request = self.session.get(
-            f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/identifiers',
-            headers=headers)
+        request = self._request(
+            'GET', f'{self._entity_base}/{entity.path}/{entity.reference}/identifiers')
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            identifier_list = entity_response.findall(f'.//{{{self.xip_ns}}}Identifier')
-            for identifier_element in identifier_list:
-                _ref = _type = _value = _aipid = None
-                for identifier in identifier_element:
-                    if identifier.tag.endswith("Entity"):
-                        _ref = identifier.text
-                    if identifier.tag.endswith("Type") and identifier_type is not None:
-                        _type = identifier.text
-                    if identifier.tag.endswith("Value") and identifier_value is not None:
-                        _value = identifier.text
-                    if identifier.tag.endswith("ApiId"):
-                        _aipid = identifier.text
+            identifier_urls = []
+            for identifier_element in _xml_iterfind(request.content, self._tag_identifier):
+                _ref = identifier_element.findtext(self._tag_entity)
+                _type = identifier_element.findtext(self._tag_type) if identifier_type is not None else None
+                _value = identifier_element.findtext(self._tag_value) if identifier_value is not None else None
+                _aipid = identifier_element.findtext(self._tag_api_id)
                 if _ref == entity.reference and _type == identifier_type and _value == identifier_value:
-                    del_req = self.session.delete(
-                        f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/identifiers/{_aipid}',
-                        headers=headers)
-                    if del_req.status_code == requests.codes.unauthorized:
-                        self.token = self.__token__()
-                        return self.delete_identifiers(entity, identifier_type, identifier_value)
-                    if del_req.status_code == requests.codes.no_content:
-                        pass
-                    else:
-                        return None
+                    identifier_urls.append(
+                        f'{self._entity_base}/{entity.path}/{entity.reference}/identifiers/{_aipid}')
+            # the matching identifiers are deleted concurrently on a pool of their own, the caller may itself
+            # be running on _POOL and waiting on it could deadlock
+            responses = []
+            if identifier_urls:
+                with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(identifier_urls))) as executor:
+                    responses = list(executor.map(lambda url: self._request('DELETE', url), identifier_urls))
+            if any(del_req.status_code != requests.codes.no_content for del_req in responses):
+                return None
             return entity
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.delete_identifiers(entity, identifier_type, identifier_value)
         else:
             logger.error(request)
             raise RuntimeError(request.status_code, "delete_identifier failed")
@@ -516,25 +618,15 @@ class EntityAPI(AuthenticatedAPI):
          :param external_identifier_type: Optional identifier type to filter the results
          :type  entity: Entity
         """
-        headers = {HEADER_TOKEN: self.token}
-        request = self.session.get(
-            f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/identifiers',
-            headers=headers)
+        request = self._request(
+            'GET', f'{self._entity_base}/{entity.path}/{entity.reference}/identifiers')
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            identifier_list = entity_response.findall(f'.//{{{self.xip_ns}}}Identifier')
+            logger.debug(request.content)
             result = set()
-            for identifier in identifier_list:
-                identifier_value = identifier_type = identifier_id = ""
-                for child in identifier:
-                    if child.tag.endswith("Type"):
-                        identifier_type = child.text
-                    if child.tag.endswith("Value"):
-                        identifier_value = child.text
-                    if child.tag.endswith("ApiId"):
-                        identifier_id = child.text
+            for identifier in _xml_iterfind(request.content, self._tag_identifier):
+                identifier_type = identifier.findtext(self._tag_type, "")
+                identifier_value = identifier.findtext(self._tag_value, "")
+                identifier_id = identifier.findtext(self._tag_api_id, "")
                 if external_identifier_type is None:
                     external_id: ExternIdentifier = ExternIdentifier(identifier_type, identifier_value)
                     external_id.identifier_id = identifier_id
@@ -545,9 +637,6 @@ class EntityAPI(AuthenticatedAPI):
                         external_id.identifier_id = identifier_id
                         result.add(external_id)
             return result
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.entity_identifiers(entity)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "identifiers_for_entity",
                                       request.content.decode('utf-8'))
@@ -562,28 +651,12 @@ class EntityAPI(AuthenticatedAPI):
             :return: Set of identifiers as tuples
             :rtype: set(Tuple)
           """
-        headers = {HEADER_TOKEN: self.token}
-        request = self.session.get(
-            f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/identifiers',
-            headers=headers)
+        request = self._request(
+            'GET', f'{self._entity_base}/{entity.path}/{entity.reference}/identifiers')
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            identifier_list = entity_response.findall(f'.//{{{self.xip_ns}}}Identifier')
-            result = set()
-            for identifier in identifier_list:
-                identifier_value = identifier_type = ""
-                for child in identifier:
-                    if child.tag.endswith("Type"):
-                        identifier_type = child.text
-                    if child.tag.endswith("Value"):
-                        identifier_value = child.text
-                result.add(tuple((identifier_type, identifier_value)))
-            return result
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.identifiers_for_entity(entity)
+            logger.debug(request.content)
+            return {(identifier.findtext(self._tag_type, ""), identifier.findtext(self._tag_value, ""))
+                    for identifier in _xml_iterfind(request.content, self._tag_identifier)}
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "identifiers_for_entity",
                                       request.content.decode('utf-8'))
@@ -599,14 +672,12 @@ class EntityAPI(AuthenticatedAPI):
         :return: Set of entity objects which have a reference and title attribute
         :rtype: set(Entity)
           """
-        headers = {HEADER_TOKEN: self.token}
         payload = {'type': identifier_type, 'value': identifier_value}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/entity/entities/by-identifier', params=payload,
-                                   headers=headers)
+        request = self._request('GET', f'{self._entity_base}/entities/by-identifier',
+                                params=payload)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             entity_list = entity_response.findall(f'.//{{{self.entity_ns}}}Entity')
             result = set()
             for entity in entity_list:
@@ -620,9 +691,6 @@ class EntityAPI(AuthenticatedAPI):
                     co = ContentObject(entity.attrib['ref'], entity.attrib['title'], None, None, None, None)
                     result.add(co)
             return result
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.identifier(identifier_type, identifier_value)
         else:
             exception = HTTPException(payload, request.status_code, request.url, "identifier",
                                       request.content.decode('utf-8'))
@@ -643,28 +711,22 @@ class EntityAPI(AuthenticatedAPI):
         if self.major_version < 7 and self.minor_version < 1:
             raise RuntimeError("add_identifier API call is not available when connected to a v6.0 System")
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = _XML_HEADERS
 
-        xml_object = xml.etree.ElementTree.Element('Identifier', {"xmlns": self.xip_ns})
-        xml.etree.ElementTree.SubElement(xml_object, "Type").text = identifier_type
-        xml.etree.ElementTree.SubElement(xml_object, "Value").text = identifier_value
-        xml.etree.ElementTree.SubElement(xml_object, "Entity").text = entity.reference
         end_point = f"/{entity.path}/{entity.reference}/identifiers"
-        xml_request = xml.etree.ElementTree.tostring(xml_object, encoding='utf-8')
+        xml_request = _IDENTIFIER_TMPL.format(ns=self.xip_ns, type=_xml_text(identifier_type),
+                                              value=_xml_text(identifier_value),
+                                              ref=_xml_text(entity.reference)).encode('utf-8')
         logger.debug(xml_request)
-        request = self.session.post(f'{self.protocol}://{self.server}/api/entity{end_point}', data=xml_request,
-                                    headers=headers)
+        request = self._request('POST', f'{self._entity_base}{end_point}', data=xml_request,
+                                headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_string = str(request.content.decode("utf-8"))
-            identifier_response = xml.etree.ElementTree.fromstring(xml_string)
+            identifier_response = _xml_fromstring(request.content)
             aip_id = identifier_response.find(f'.//{{{self.xip_ns}}}ApiId')
-            if hasattr(aip_id, 'text'):
+            if aip_id is not None:
                 return aip_id.text
             else:
                 return None
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_identifier(entity, identifier_type, identifier_value)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "add_identifier",
                                       request.content.decode('utf-8'))
@@ -685,29 +747,18 @@ class EntityAPI(AuthenticatedAPI):
         if (self.major_version < 7) and (self.minor_version < 1):
             raise RuntimeError("update_identifiers API call is not available when connected to a v6.0 System")
 
-        headers = {HEADER_TOKEN: self.token}
-        response = self.session.get(
-            f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/identifiers',
-            headers=headers)
+        response = self._request(
+            'GET', f'{self._entity_base}/{entity.path}/{entity.reference}/identifiers')
 
         if response.status_code == requests.codes.ok:
-            xml_response = str(response.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            identifier_list = entity_response.findall(f'.//{{{self.xip_ns}}}Identifier')
-            for identifier_element in identifier_list:
-                _ref = _type = _value = _aipid = None
-                for identifier in identifier_element:
-                    if identifier.tag.endswith("Entity"):
-                        _ref = identifier.text
-                    if identifier.tag.endswith("Type") and identifier_type is not None:
-                        _type = identifier.text
-                    if identifier.tag.endswith("Value") and identifier_value is not None:
-                        _value = identifier.text
-                    if identifier.tag.endswith("ApiId"):
-                        _aipid = identifier.text
+            for identifier_element in _xml_iterfind(response.content, self._tag_identifier):
+                _ref = identifier_element.findtext(self._tag_entity)
+                _type = identifier_element.findtext(self._tag_type) if identifier_type is not None else None
+                _value = identifier_element.findtext(self._tag_value) if identifier_value is not None else None
+                _aipid = identifier_element.findtext(self._tag_api_id)
                 if _ref == entity.reference and _type == identifier_type:
 
-                    headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+                    headers = _XML_HEADERS
 
                     xml_object = xml.etree.ElementTree.Element('Identifier', {"xmlns": self.xip_ns})
                     xml.etree.ElementTree.SubElement(xml_object, "Type").text = identifier_type
@@ -715,28 +766,22 @@ class EntityAPI(AuthenticatedAPI):
                     xml.etree.ElementTree.SubElement(xml_object, "Entity").text = entity.reference
                     xml_request = xml.etree.ElementTree.tostring(xml_object, encoding='utf-8')
 
-                    put_response = self.session.put(
-                        f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/identifiers/{_aipid}',
+                    put_response = self._request(
+                        'PUT',
+                        f'{self._entity_base}/{entity.path}/{entity.reference}/identifiers/{_aipid}',
                         headers=headers, data=xml_request)
                     if put_response.status_code == requests.codes.ok:
-                        xml_string = str(put_response.content.decode("utf-8"))
-                        identifier_response = xml.etree.ElementTree.fromstring(xml_string)
+                        identifier_response = _xml_fromstring(put_response.content)
                         aip_id = identifier_response.find(f'.//{{{self.xip_ns}}}ApiId')
-                        if hasattr(aip_id, 'text'):
+                        if aip_id is not None:
                             return aip_id.text
                         else:
                             return None
-                    if put_response.status_code == requests.codes.unauthorized:
-                        self.token = self.__token__()
-                        return self.update_identifiers(entity, identifier_type, identifier_value)
                     if put_response.status_code == requests.codes.no_content:
                         pass
                     else:
                         return None
             return entity
-        elif response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.update_identifiers(entity, identifier_type, identifier_value)
         else:
             logger.error(response)
             raise RuntimeError(response.status_code, "update_identifiers failed")
@@ -775,15 +820,11 @@ class EntityAPI(AuthenticatedAPI):
             :param relationship:
             :return:
         """
-        headers = {HEADER_TOKEN: self.token}
         entity = self.entity(relationship.entity_type, relationship.this_ref)
         end_point = f"{entity.path}/{entity.reference}/links/{relationship.api_id}"
-        request = self.session.delete(f'{self.protocol}://{self.server}/api/entity/{end_point}', headers=headers)
+        request = self._request('DELETE', f'{self._entity_base}/{end_point}')
         if request.status_code == requests.codes.no_content:
             return None
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.__delete_relationship(relationship)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "delete_relationships",
                                       request.content.decode('utf-8'))
@@ -830,20 +871,18 @@ class EntityAPI(AuthenticatedAPI):
             :rtype:  list
         """
 
-        headers = {HEADER_TOKEN: self.token}
         end_point = f"{entity.path}/{entity.reference}/links"
 
         if next_page is None:
             params = {'start': '0', 'max': str(maximum)}
-            request = self.session.get(f'{self.protocol}://{self.server}/api/entity/{end_point}', headers=headers,
-                                       params=params)
+            request = self._request('GET', f'{self._entity_base}/{end_point}',
+                                    params=params)
         else:
-            request = self.session.get(next_page, headers=headers)
+            request = self._request('GET', next_page)
 
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             links = entity_response.findall(f'.//{{{self.entity_ns}}}Link')
             next_url = entity_response.find(f'.//{{{self.entity_ns}}}Paging/{{{self.entity_ns}}}Next')
             total_hits = entity_response.find(f'.//{{{self.entity_ns}}}Paging/{{{self.entity_ns}}}TotalResults')
@@ -866,9 +905,6 @@ class EntityAPI(AuthenticatedAPI):
                 url = next_url.text
 
             return PagedSet(results, has_more, int(total_hits.text), url)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.__relationships__(entity=entity, maximum=maximum, next_page=next_page)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "relationships",
                                       request.content.decode('utf-8'))
@@ -898,7 +934,7 @@ class EntityAPI(AuthenticatedAPI):
         assert from_entity.entity_type is not EntityType.CONTENT_OBJECT
         assert to_entity.entity_type is not EntityType.CONTENT_OBJECT
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = _XML_HEADERS
 
         xml_object = xml.etree.ElementTree.Element('Link ', {"xmlns": self.xip_ns})
         xml.etree.ElementTree.SubElement(xml_object, "Type").text = relationship_type
@@ -908,18 +944,14 @@ class EntityAPI(AuthenticatedAPI):
         end_point = f"/{from_entity.path}/{from_entity.reference}/links"
         xml_request = xml.etree.ElementTree.tostring(xml_object, encoding='utf-8')
         logger.debug(xml_request)
-        request = self.session.post(f'{self.protocol}://{self.server}/api/entity{end_point}', data=xml_request,
-                                    headers=headers)
+        request = self._request('POST', f'{self._entity_base}{end_point}', data=xml_request,
+                                headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_string = str(request.content.decode("utf-8"))
-            logger.debug(xml_string)
-            link_response = xml.etree.ElementTree.fromstring(xml_string)
+            logger.debug(request.content)
+            link_response = _xml_fromstring(request.content)
             relation = link_response.find(f'.//{{{self.xip_ns}}}Link')
             relation_type = relation.find(f'.//{{{self.xip_ns}}}Type')
             return relation_type.text
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_relation(from_entity, relationship_type, to_entity)
         else:
             exception = HTTPException(from_entity.reference, request.status_code, request.url, "add_relation",
                                       request.content.decode('utf-8'))
@@ -937,21 +969,17 @@ class EntityAPI(AuthenticatedAPI):
         :rtype: Entity
         """
 
-        headers = {HEADER_TOKEN: self.token}
-        for url in entity.metadata:
-            if schema == entity.metadata[url]:
-                request = self.session.delete(url, headers=headers)
-                if request.status_code == requests.codes.no_content:
-                    pass
-                elif request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.delete_metadata(entity, schema)
-                else:
-                    exception = HTTPException(entity.reference, request.status_code, request.url, "delete_metadata",
-                                              request.content.decode('utf-8'))
-                    logger.error(exception)
-                    raise exception
+        for url in entity.metadata_urls(schema):
+            request = self._request('DELETE', url)
+            if request.status_code == requests.codes.no_content:
+                pass
+            else:
+                exception = HTTPException(entity.reference, request.status_code, request.url, "delete_metadata",
+                                          request.content.decode('utf-8'))
+                logger.error(exception)
+                raise exception
 
+        self._forget_entity(entity)
         return self.entity(entity.entity_type, entity.reference)
 
 
@@ -966,17 +994,14 @@ class EntityAPI(AuthenticatedAPI):
            :return: The process ID
            :rtype: str
            """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'text/csv;charset=UTF-8'}
+        headers = {'Content-Type': 'text/csv;charset=UTF-8'}
 
-        url = f'{self.protocol}://{self.server}/api/entity/actions/metadata-csv-edits'
+        url = f'{self._entity_base}/actions/metadata-csv-edits'
 
         with open(csv_file, 'rb') as fd:
-            with self.session.post(url, headers=headers, data=fd) as request:
-                if request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.add_group_metadata(csv_file)
-                elif request.status_code == requests.codes.accepted:
-                    return str(request.content.decode('utf-8'))
+            with self._request('POST', url, headers=headers, data=fd) as request:
+                if request.status_code == requests.codes.accepted:
+                    return request.content.decode('utf-8')
                 else:
                     exception = HTTPException(None, request.status_code, request.url, "add_group_metadata",
                                               request.content.decode('utf-8'))
@@ -994,40 +1019,38 @@ class EntityAPI(AuthenticatedAPI):
         :return: The updated Entity
         :rtype: Entity
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = _XML_HEADERS
 
-        if schema not in entity.metadata.values():
+        urls = entity.metadata_urls(schema)
+        if not urls:
             raise RuntimeError("Only existing schema's can be updated.")
 
-        for url in entity.metadata:
-            if schema == entity.metadata[url]:
-                mref = url[url.rfind(f"{entity.reference}/metadata/") + len(f"{entity.reference}/metadata/"):]
-                xml_object = xml.etree.ElementTree.Element('xip:MetadataContainer',
-                                                           {"schemaUri": schema, "xmlns:xip": self.xip_ns})
-                xml.etree.ElementTree.SubElement(xml_object, "xip:Ref").text = mref
-                xml.etree.ElementTree.SubElement(xml_object, "xip:Entity").text = entity.reference
-                content = xml.etree.ElementTree.SubElement(xml_object, "xip:Content")
-                if isinstance(data, str):
-                    ob = xml.etree.ElementTree.fromstring(data)
-                    content.append(ob)
-                elif hasattr(data, "read"):
-                    tree = xml.etree.ElementTree.parse(data)
-                    content.append(tree.getroot())
-                else:
-                    raise RuntimeError("Unknown data type")
-                xml_request = xml.etree.ElementTree.tostring(xml_object, encoding='utf-8').decode("utf-8")
-                logger.debug(xml_request)
-                request = self.session.put(url, data=xml_request, headers=headers)
-                if request.status_code == requests.codes.ok:
-                    pass
-                elif request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.update_metadata(entity, schema, data)
-                else:
-                    exception = HTTPException(entity.reference, request.status_code, request.url, "update_metadata",
-                                              request.content.decode('utf-8'))
-                    logger.error(exception)
-                    raise exception
+        if isinstance(data, str):
+            document = xml.etree.ElementTree.fromstring(data)
+        elif hasattr(data, "read"):
+            document = xml.etree.ElementTree.parse(data).getroot()
+        else:
+            raise RuntimeError("Unknown data type")
+
+        for url in urls:
+            mref = url.rsplit('/metadata/', 1)[-1]
+            xml_object = xml.etree.ElementTree.Element('xip:MetadataContainer',
+                                                       {"schemaUri": schema, "xmlns:xip": self.xip_ns})
+            xml.etree.ElementTree.SubElement(xml_object, "xip:Ref").text = mref
+            xml.etree.ElementTree.SubElement(xml_object, "xip:Entity").text = entity.reference
+            content = xml.etree.ElementTree.SubElement(xml_object, "xip:Content")
+            content.append(document)
+            xml_request = xml.etree.ElementTree.tostring(xml_object, encoding='utf-8')
+            logger.debug(xml_request)
+            request = self._request('PUT', url, data=xml_request, headers=headers)
+            if request.status_code == requests.codes.ok:
+                pass
+            else:
+                exception = HTTPException(entity.reference, request.status_code, request.url, "update_metadata",
+                                          request.content.decode('utf-8'))
+                logger.error(exception)
+                raise exception
+        self._forget_entity(entity)
         return self.entity(entity.entity_type, entity.reference)
 
     def add_metadata_as_fragment(self, entity: EntityT, schema: str, xml_fragment: str) -> EntityT:
@@ -1042,7 +1065,7 @@ class EntityAPI(AuthenticatedAPI):
         :param str schema: The schema URI of the XML document
         :rtype: Entity
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = _XML_HEADERS
 
         xml_doc = f"""<xip:MetadataContainer xmlns="{schema}" schemaUri="{schema}" xmlns:xip="{self.xip_ns}">
             <xip:Entity>{entity.reference}</xip:Entity>
@@ -1053,13 +1076,11 @@ class EntityAPI(AuthenticatedAPI):
 
         end_point = f"/{entity.path}/{entity.reference}/metadata"
         logger.debug(xml_doc)
-        request = self.session.post(f'{self.protocol}://{self.server}/api/entity{end_point}', data=xml_doc,
-                                    headers=headers)
+        request = self._request('POST', f'{self._entity_base}{end_point}',
+                                data=xml_doc.encode('utf-8'), headers=headers)
         if request.status_code == requests.codes.ok:
+            self._forget_entity(entity)
             return self.entity(entity_type=entity.entity_type, reference=entity.reference)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_metadata(entity, schema, xml_fragment)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "add_metadata",
                                       request.content.decode('utf-8'))
@@ -1076,7 +1097,7 @@ class EntityAPI(AuthenticatedAPI):
         :return: The updated entity with the new metadata
         :rtype: Entity
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = _XML_HEADERS
 
         xml_object = xml.etree.ElementTree.Element('xip:MetadataContainer', {"schemaUri": schema,
                                                                              "xmlns:xip": self.xip_ns})
@@ -1093,13 +1114,11 @@ class EntityAPI(AuthenticatedAPI):
         xml_request = xml.etree.ElementTree.tostring(xml_object, encoding='utf-8')
         end_point = f"/{entity.path}/{entity.reference}/metadata"
         logger.debug(xml_request)
-        request = self.session.post(f'{self.protocol}://{self.server}/api/entity{end_point}', data=xml_request,
-                                    headers=headers)
+        request = self._request('POST', f'{self._entity_base}{end_point}', data=xml_request,
+                                headers=headers)
         if request.status_code == requests.codes.ok:
+            self._forget_entity(entity)
             return self.entity(entity_type=entity.entity_type, reference=entity.reference)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_metadata(entity, schema, data)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "add_metadata",
                                       request.content.decode('utf-8'))
@@ -1117,27 +1136,20 @@ class EntityAPI(AuthenticatedAPI):
         :rtype: Entity
         """
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = _XML_HEADERS
 
-        xml_object = xml.etree.ElementTree.Element(entity.tag, {"xmlns": self.xip_ns})
-        xml.etree.ElementTree.SubElement(xml_object, "Ref").text = entity.reference
-        xml.etree.ElementTree.SubElement(xml_object, "Title").text = entity.title
-        xml.etree.ElementTree.SubElement(xml_object, "Description").text = entity.description
-        xml.etree.ElementTree.SubElement(xml_object, "SecurityTag").text = entity.security_tag
-
-        if entity.custom_type is not None:
-            xml.etree.ElementTree.SubElement(xml_object, "CustomType").text = entity.custom_type
-
-        if entity.parent is not None:
-            xml.etree.ElementTree.SubElement(xml_object, "Parent").text = entity.parent
-
-        xml_request = xml.etree.ElementTree.tostring(xml_object, encoding='utf-8')
+        optional = _xml_optional("CustomType", entity.custom_type) + _xml_optional("Parent", entity.parent)
+        xml_request = _ENTITY_TMPL.format(tag=entity.tag, ns=self.xip_ns, ref=_xml_text(entity.reference),
+                                          title=_xml_text(entity.title),
+                                          description=_xml_text(entity.description),
+                                          security_tag=_xml_text(entity.security_tag),
+                                          optional=optional).encode('utf-8')
         logger.debug(xml_request)
-        request = self.session.put(f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}',
-                                   data=xml_request, headers=headers)
+        request = self._request('PUT', f'{self._entity_base}/{entity.path}/{entity.reference}',
+                                data=xml_request, headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            response = self.entity_from_string(xml_response)
+            self._forget_entity(entity)
+            response = self.entity_from_string(request.content)
             if isinstance(entity, Asset):
                 asset = Asset(response['reference'], response['title'], response['description'],
                               response['security_tag'],
@@ -1161,9 +1173,6 @@ class EntityAPI(AuthenticatedAPI):
                     content_object.custom_type = response['CustomType']
                 return content_object
             return None
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.save(entity)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "save",
                                       request.content.decode('utf-8'))
@@ -1185,21 +1194,19 @@ class EntityAPI(AuthenticatedAPI):
         :return: Progress ID token
         :rtype: str
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'text/plain'}
+        headers = _TEXT_HEADERS
         if isinstance(entity, Asset) and dest_folder is None:
             raise RuntimeError(entity.reference, "Only folders can be moved to the root of the repository")
         if dest_folder is not None:
             data = dest_folder.reference
         else:
             data = "@root@"
-        request = self.session.put(
-            f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/parent-ref',
+        request = self._request(
+            'PUT', f'{self._entity_base}/{entity.path}/{entity.reference}/parent-ref',
             data=data, headers=headers)
         if request.status_code == requests.codes.accepted:
+            self._forget_entity(entity)
             return request.content.decode()
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.move_async(entity, dest_folder)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "move_async",
                                       request.content.decode('utf-8'))
@@ -1218,18 +1225,15 @@ class EntityAPI(AuthenticatedAPI):
         :return:  Workflow status
         :rtype: str
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'text/plain'}
-        request = self.session.get(f"{self.protocol}://{self.server}/api/entity/progress/{pid}", headers=headers)
+        headers = _TEXT_HEADERS
+        request = self._request('GET', f"{self._entity_base}/progress/{pid}", headers=headers)
         if request.status_code == requests.codes.ok:
-            entity_response = xml.etree.ElementTree.fromstring(request.content.decode("utf-8"))
+            entity_response = _xml_fromstring(request.content)
             status = entity_response.find(".//{http://status.preservica.com}Status")
-            if hasattr(status, 'text'):
+            if status is not None:
                 return status.text
             else:
                 return "UNKNOWN"
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.get_async_progress(pid)
         else:
             exception = HTTPException(pid, request.status_code, request.url, "get_async_progress",
                                       request.content.decode('utf-8'))
@@ -1246,29 +1250,26 @@ class EntityAPI(AuthenticatedAPI):
         :return: The updated entity
         :rtype: Entity
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'text/plain'}
+        headers = _TEXT_HEADERS
         if isinstance(entity, Asset) and dest_folder is None:
             raise RuntimeError(entity.reference, "Only folders can be moved to the root of the repository")
         if dest_folder is not None:
             data = dest_folder.reference
         else:
             data = "@root@"
-        request = self.session.put(
-            f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/parent-ref',
+        request = self._request(
+            'PUT', f'{self._entity_base}/{entity.path}/{entity.reference}/parent-ref',
             data=data, headers=headers)
         if request.status_code == requests.codes.accepted:
-            sleep_sec = 1
+            sleep_sec = POLL_INITIAL_DELAY
             while True:
                 status = self.get_async_progress(request.content.decode("utf-8"))
                 if status != "ACTIVE":
+                    self._forget_entity(entity)
                     return self.entity(entity.entity_type, entity.reference)
                 else:
-                    sleep(sleep_sec)
-                    sleep_sec = sleep_sec + 1
+                    sleep_sec = _poll_wait(sleep_sec)
 
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.move_sync(entity, dest_folder)
         else:
             exception = HTTPException(entity, request.status_code, request.url, "move_sync",
                                       request.content.decode('utf-8'))
@@ -1299,30 +1300,21 @@ class EntityAPI(AuthenticatedAPI):
         :param security_tag: The security_tag of the new folder
         :param parent:       The parent of the new folder, Can be None to create a root Folder
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-
-        structural_object = xml.etree.ElementTree.Element('StructuralObject', {"xmlns": self.xip_ns})
-        xml.etree.ElementTree.SubElement(structural_object, "Ref").text = str(uuid.uuid4())
-        xml.etree.ElementTree.SubElement(structural_object, "Title").text = title
-        xml.etree.ElementTree.SubElement(structural_object, "Description").text = description
-        xml.etree.ElementTree.SubElement(structural_object, "SecurityTag").text = security_tag
-        if parent is not None:
-            xml.etree.ElementTree.SubElement(structural_object, "Parent").text = parent
+        headers = _XML_HEADERS
 
-        xml_request = xml.etree.ElementTree.tostring(structural_object, encoding='utf-8')
+        xml_request = _ENTITY_TMPL.format(tag="StructuralObject", ns=self.xip_ns, ref=uuid.uuid4(),
+                                          title=_xml_text(title), description=_xml_text(description),
+                                          security_tag=_xml_text(security_tag),
+                                          optional=_xml_optional("Parent", parent)).encode('utf-8')
         logger.debug(xml_request)
-        request = self.session.post(f'{self.protocol}://{self.server}/api/entity/structural-objects', data=xml_request,
-                                    headers=headers)
+        request = self._request('POST', f'{self._entity_base}/structural-objects',
+                                data=xml_request, headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity = self.entity_from_string(xml_response)
+            entity = self.entity_from_string(request.content)
             return Folder(entity['reference'], entity['title'], entity['description'],
                           entity['security_tag'],
                           entity['parent'],
                           entity['metadata'])
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.create_folder(title, description, security_tag, parent=parent)
         else:
             exception = HTTPException(title, request.status_code, request.url, "create_folder",
                                       request.content.decode('utf-8'))
@@ -1357,9 +1349,9 @@ class EntityAPI(AuthenticatedAPI):
         if entity.metadata is None:
             entity = self.entity(entity.entity_type, entity.reference)
 
-        for uri, schema_name in entity.metadata.items():
-            if schema == schema_name:
-                return self.metadata(uri)
+        urls = entity.metadata_urls(schema)
+        if urls:
+            return self.metadata(urls[0])
         return None
 
     def metadata_tag_for_entity(self, entity: Entity, schema: str, tag: str, isXpath: bool = False) -> Union[str, None]:
@@ -1376,7 +1368,7 @@ class EntityAPI(AuthenticatedAPI):
 
         xml_doc = self.metadata_for_entity(entity, schema)
         if xml_doc:
-            xml_object = xml.etree.ElementTree.fromstring(xml_doc)
+            xml_object = _xml_fromstring(xml_doc)
             if not isXpath:
                 return xml_object.find(f'.//{{*}}{tag}').text
             else:
@@ -1395,23 +1387,20 @@ class EntityAPI(AuthenticatedAPI):
         :return: The updated entity
         :rtype: Entity
          """
-        self.token = self.__token__()
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'text/plain'}
+        headers = _TEXT_HEADERS
         end_point = f"/{entity.path}/{entity.reference}/security-descriptor"
-        request = self.session.put(f'{self.protocol}://{self.server}/api/entity{end_point}?includeDescendants=false',
-                                   data=new_tag, headers=headers)
+        request = self._request(
+            'PUT', f'{self._entity_base}{end_point}?includeDescendants=false',
+            data=new_tag, headers=headers)
         if request.status_code == requests.codes.accepted:
-            sleep_sec = 1
+            sleep_sec = POLL_INITIAL_DELAY
             while True:
                 status = self.get_async_progress(request.content.decode("utf-8"))
                 if status != "ACTIVE":
+                    self._forget_entity(entity)
                     return self.entity(entity.entity_type, entity.reference)
                 else:
-                    sleep(sleep_sec)
-                    sleep_sec = sleep_sec + 1
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.security_tag_sync(entity, new_tag)
+                    sleep_sec = _poll_wait(sleep_sec)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "security_tag_sync",
                                       request.content.decode('utf-8'))
@@ -1430,15 +1419,14 @@ class EntityAPI(AuthenticatedAPI):
         :return: A progress id which can be used to monitor the workflow
         :rtype: str
           """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'text/plain'}
+        headers = _TEXT_HEADERS
         end_point = f"/{entity.path}/{entity.reference}/security-descriptor"
-        request = self.session.put(f'{self.protocol}://{self.server}/api/entity{end_point}?includeDescendants=false',
-                                   data=new_tag, headers=headers)
+        request = self._request(
+            'PUT', f'{self._entity_base}{end_point}?includeDescendants=false',
+            data=new_tag, headers=headers)
         if request.status_code == requests.codes.accepted:
+            self._forget_entity(entity)
             return request.content.decode("utf-8")
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.security_tag_async(entity, new_tag)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url, "security_tag_async",
                                       request.content.decode('utf-8'))
@@ -1453,16 +1441,12 @@ class EntityAPI(AuthenticatedAPI):
         :return: An XML document as a string
         :rtype: str
         """
-        request = self.session.get(uri, headers={HEADER_TOKEN: self.token})
+        request = self._request('GET', uri)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = xml.etree.ElementTree.fromstring(request.content)
             content = entity_response.find(f'.//{{{self.xip_ns}}}Content')
             return xml.etree.ElementTree.tostring(content[0], encoding='utf-8', method='xml').decode('utf-8')
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.metadata(uri)
         else:
             exception = HTTPException(uri, request.status_code, request.url, "metadata",
                                       request.content.decode('utf-8'))
@@ -1481,13 +1465,46 @@ class EntityAPI(AuthenticatedAPI):
         :rtype: Entity
         :raises RuntimeError: if the identifier is incorrect
         """
-        if entity_type is EntityType.CONTENT_OBJECT:
-            return self.content_object(reference)
-        if entity_type is EntityType.FOLDER:
-            return self.folder(reference)
-        if entity_type is EntityType.ASSET:
-            return self.asset(reference)
-        return None
+        if entity_type not in _ENTITY_SPEC:
+            return None
+        return self._fetch_entity(entity_type, reference)
+
+    def _fetch_entity(self, entity_type: EntityType, reference: str) -> EntityT:
+        """
+        Fetch an asset, folder or content object by its reference identifier
+
+        :param  entity_type: The type of entity
+        :type  entity_type: EntityType
+        :param reference: The unique identifier for the entity
+        :type  reference: str
+        :return: The entity either Asset, Folder or ContentObject
+        :rtype: Entity
+        :raises RuntimeError: if the identifier is incorrect
+        """
+        path, entity_class, name = _ENTITY_SPEC[entity_type]
+        entity = self._cached_entity(entity_type, reference)
+        if entity is None:
+            generation = self._entity_cache_generation
+            request = self._request('GET', f'{self._entity_base}/{path}/{reference}')
+            if request.status_code == requests.codes.ok:
+                entity = self.entity_from_string(request.content)
+                self._cache_entity(entity_type, reference, entity, generation)
+            elif request.status_code == requests.codes.not_found:
+                exception = ReferenceNotFoundException(reference, request.status_code, request.url, name)
+                logger.error(exception)
+                raise exception
+            else:
+                exception = HTTPException(reference, request.status_code, request.url, name,
+                                          request.content.decode('utf-8'))
+                logger.error(exception)
+                raise exception
+        # callers get their own copy of the metadata map so the cached entry is never modified
+        result = entity_class(entity['reference'], entity['title'], entity['description'],
+                              entity['security_tag'], entity['parent'],
+                              dict(entity['metadata']))
+        if 'CustomType' in entity:
+            result.custom_type = entity['CustomType']
+        return result
 
     def add_physical_asset(self, title: str, description: str, parent: Folder, security_tag: str = "open") -> Asset:
         """
@@ -1507,7 +1524,7 @@ class EntityAPI(AuthenticatedAPI):
             raise RuntimeError(
                 "add_physical_asset API call is only available with a Preservica v6.4.0 system or higher")
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = _XML_HEADERS
 
         xip_object = xml.etree.ElementTree.Element('XIP ', {"xmlns": self.xip_ns})
         io_object = xml.etree.ElementTree.SubElement(xip_object, "InformationObject")
@@ -1520,17 +1537,13 @@ class EntityAPI(AuthenticatedAPI):
 
         xml_request = xml.etree.ElementTree.tostring(xip_object, encoding='utf-8')
 
-        request = self.session.post(f'{self.protocol}://{self.server}/api/entity/{IO_PATH}', data=xml_request,
-                                    headers=headers)
+        request = self._request('POST', f'{self._entity_base}/{IO_PATH}', data=xml_request,
+                                headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_string = str(request.content.decode("utf-8"))
-            entity = self.entity_from_string(xml_string)
+            entity = self.entity_from_string(request.content)
             return Asset(entity['reference'], entity['title'], entity['description'],
                          entity['security_tag'], entity['parent'],
                          entity['metadata'])
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_physical_asset(title, description, parent, security_tag)
         else:
             exception = HTTPException(title, request.status_code, request.url, "add_physical_asset",
                                       request.content.decode('utf-8'))
@@ -1546,7 +1559,6 @@ class EntityAPI(AuthenticatedAPI):
         """
 
         headers = {
-            HEADER_TOKEN: self.token,
             "Content-Type": "application/xml;charset=UTF-8",
             "accept": "text/plain;charset=UTF-8",
         }
@@ -1570,13 +1582,10 @@ class EntityAPI(AuthenticatedAPI):
   #          )
         xml_request = xml.etree.ElementTree.tostring(merge_object, encoding="utf-8")
         print(xml_request)
-        request = self.session.post(
-            f"{self.protocol}://{self.server}/api/entity/actions/merges", data=xml_request, headers=headers)
+        request = self._request(
+            'POST', f"{self._entity_base}/actions/merges", data=xml_request, headers=headers)
         if request.status_code == requests.codes.accepted:
             return request.content.decode('utf-8')
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.merge_assets(assets, title, description)
         else:
             exception = HTTPException(
                 "",
@@ -1598,20 +1607,18 @@ class EntityAPI(AuthenticatedAPI):
 
             The return value is the progress status of the merge operation.
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8', 'accept': 'text/plain;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8', 'accept': 'text/plain;charset=UTF-8'}
         payload = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
             <MergeAction xmlns="{self.entity_ns}" xmlns:xip="{self.xip_ns}">
                 <Title>{folder.title}</Title>
                 <Description>{folder.description}</Description>
                 <Entity excludeIdentifiers="true" excludeLinks="true" excludeMetadata="true" ref="{folder.reference}" type="SO"/>
             </MergeAction>"""
-        request = self.session.post(
-            f"{self.protocol}://{self.server}/api/entity/actions/merges", data=payload, headers=headers)
+        request = self._request(
+            'POST', f"{self._entity_base}/actions/merges", data=payload.encode('utf-8'),
+            headers=headers)
         if request.status_code == requests.codes.accepted:
             return request.content.decode('utf-8')
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.merge_folder(folder)
         else:
             exception = HTTPException(
                 folder.reference,
@@ -1632,15 +1639,11 @@ class EntityAPI(AuthenticatedAPI):
 
          :param reference:            The unique identifier of the entity
          """
-        headers = {HEADER_TOKEN: self.token}
         params = {"expand": "structure"}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/entity/{IO_PATH}/{reference}', params=params, headers=headers)
+        request = self._request('GET', f'{self._entity_base}/{IO_PATH}/{reference}',
+                                params=params)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            return xml_response
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.xml_asset(reference)
+            return request.content.decode('utf-8')
         elif request.status_code == requests.codes.not_found:
             exception = ReferenceNotFoundException(reference, request.status_code, request.url, "xml_asset")
             logger.error(exception)
@@ -1664,29 +1667,7 @@ class EntityAPI(AuthenticatedAPI):
         :raises RuntimeError: if the identifier is incorrect
 
          """
-        headers = {HEADER_TOKEN: self.token}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/entity/{IO_PATH}/{reference}', headers=headers)
-        if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity = self.entity_from_string(xml_response)
-            asset = Asset(entity['reference'], entity['title'], entity['description'],
-                          entity['security_tag'], entity['parent'],
-                          entity['metadata'])
-            if 'CustomType' in entity:
-                asset.custom_type = entity['CustomType']
-            return asset
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.asset(reference)
-        elif request.status_code == requests.codes.not_found:
-            exception = ReferenceNotFoundException(reference, request.status_code, request.url, "asset")
-            logger.error(exception)
-            raise exception
-        else:
-            exception = HTTPException(reference, request.status_code, request.url, "asset",
-                                      request.content.decode('utf-8'))
-            logger.error(exception)
-            raise exception
+        return self._fetch_entity(EntityType.ASSET, reference)
 
     def folder(self, reference: str) -> Folder:
         """
@@ -1698,29 +1679,7 @@ class EntityAPI(AuthenticatedAPI):
         :rtype: Folder
         :raises RuntimeError: if the identifier is incorrect
          """
-        headers = {HEADER_TOKEN: self.token}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/entity/{SO_PATH}/{reference}', headers=headers)
-        if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity = self.entity_from_string(xml_response)
-            folder = Folder(entity['reference'], entity['title'], entity['description'],
-                            entity['security_tag'], entity['parent'],
-                            entity['metadata'])
-            if 'CustomType' in entity:
-                folder.custom_type = entity['CustomType']
-            return folder
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.folder(reference)
-        elif request.status_code == requests.codes.not_found:
-            exception = ReferenceNotFoundException(reference, request.status_code, request.url, "folder")
-            logger.error(exception)
-            raise exception
-        else:
-            exception = HTTPException(reference, request.status_code, request.url, "folder",
-                                      request.content.decode('utf-8'))
-            logger.error(exception)
-            raise exception
+        return self._fetch_entity(EntityType.FOLDER, reference)
 
     def content_object(self, reference: str) -> ContentObject:
         """
@@ -1732,26 +1691,24 @@ class EntityAPI(AuthenticatedAPI):
         :rtype: ContentObject
         :raises RuntimeError: if the identifier is incorrect
          """
-        headers = {HEADER_TOKEN: self.token}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/entity/{CO_PATH}/{reference}', headers=headers)
+        return self._fetch_entity(EntityType.CONTENT_OBJECT, reference)
+
+    def _content_object_refs(self, representation: Representation) -> list[str]:
+        """
+         Return the references of the content objects within a representation
+
+        :param  representation: The representation
+        :type  representation: Representation
+        :return: List of content object references
+        :rtype: list(str)
+
+         """
+        request = self._request('GET', f'{representation.url}')
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity = self.entity_from_string(xml_response)
-            content_object = ContentObject(entity['reference'], entity['title'], entity['description'],
-                                           entity['security_tag'], entity['parent'],
-                                           entity['metadata'])
-            if 'CustomType' in entity:
-                content_object.custom_type = entity['CustomType']
-            return content_object
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.content_object(reference)
-        elif request.status_code == requests.codes.not_found:
-            exception = ReferenceNotFoundException(reference, request.status_code, request.url, "content_object")
-            logger.error(exception)
-            raise exception
+            logger.debug(request.content)
+            return [co.text for co in _xml_iterfind(request.content, self._tag_content_object)]
         else:
-            exception = HTTPException(reference, request.status_code, request.url, "content_object",
+            exception = HTTPException(representation.name, request.status_code, request.url, "content_objects",
                                       request.content.decode('utf-8'))
             logger.error(exception)
             raise exception
@@ -1766,32 +1723,46 @@ class EntityAPI(AuthenticatedAPI):
         :rtype: list(ContentObject)
 
          """
-        headers = {HEADER_TOKEN: self.token}
         if not isinstance(representation, Representation):
             logger.warning("representation is not of type Representation")
             return []
-        request = self.session.get(f'{representation.url}', headers=headers)
-        if request.status_code == requests.codes.ok:
-            results = []
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            content_objects = entity_response.findall(f'.//{{{self.xip_ns}}}Representation/'
-                                                      f'{{{self.xip_ns}}}ContentObjects/{{{self.xip_ns}}}ContentObject')
-            for co in content_objects:
-                content_object = self.content_object(co.text)
-                content_object.representation_type = representation.rep_type
-                content_object.asset = representation.asset
-                results.append(content_object)
-            return results
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.content_objects(representation)
-        else:
-            exception = HTTPException(representation.name, request.status_code, request.url, "content_objects",
-                                      request.content.decode('utf-8'))
-            logger.error(exception)
-            raise exception
+        results = list(_POOL.map(self.content_object, self._content_object_refs(representation)))
+        for content_object in results:
+            content_object.representation_type = representation.rep_type
+            content_object.asset = representation.asset
+        return results
+
+    async def content_objects_async(self, representation: Representation,
+                                    max_concurrency: int = POOL_CONNECTIONS) -> list[ContentObject]:
+        """
+         Return a list of content objects for a representation, fetching them concurrently
+
+         A coroutine version of content_objects() for use inside an event loop. The individual content
+         objects are requested in parallel over the shared session, at most max_concurrency at a time.
+
+        :param  representation: The representation
+        :type  representation: Representation
+        :param  max_concurrency: The maximum number of requests in flight
+        :type  max_concurrency: int
+        :return: List of content objects
+        :rtype: list(ContentObject)
+
+         """
+        if not isinstance(representation, Representation):
+            logger.warning("representation is not of type Representation")
+            return []
+        references = await asyncio.to_thread(self._content_object_refs, representation)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(reference: str) -> ContentObject:
+            async with semaphore:
+                return await asyncio.to_thread(self.content_object, reference)
+
+        results = await asyncio.gather(*[fetch(reference) for reference in references])
+        for content_object in results:
+            content_object.representation_type = representation.rep_type
+            content_object.asset = representation.asset
+        return list(results)
 
     def generation(self, url: str, content_ref: str = None) -> Generation:
         """
@@ -1804,84 +1775,65 @@ class EntityAPI(AuthenticatedAPI):
         :rtype:  Generation
         """
 
-        headers = {HEADER_TOKEN: self.token}
-        request = self.session.get(url, headers=headers)
-        if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            ge = entity_response.find(f'.//{{{self.xip_ns}}}Generation')
-            format_group = entity_response.find(f'.//{{{self.xip_ns}}}FormatGroup')
-            effective_date = entity_response.find(f'.//{{{self.xip_ns}}}EffectiveDate')
-
-            formats = entity_response.findall(f'.//{{{self.xip_ns}}}Formats/{{{self.xip_ns}}}Format')
-            formats_list = []
-            for tech_format in formats:
-                format_dict = {'Valid': tech_format.attrib['valid']}
-                puid = tech_format.find(f'.//{{{self.xip_ns}}}PUID')
-                format_dict['PUID'] = puid.text if hasattr(puid, 'text') else None
-                priority = tech_format.find(f'.//{{{self.xip_ns}}}Priority')
-                format_dict['Priority'] = priority.text if hasattr(priority, 'text') else None
-                method = tech_format.find(f'.//{{{self.xip_ns}}}IdentificationMethod')
-                format_dict['IdentificationMethod'] = method.text if hasattr(method, 'text') else None
-                name = tech_format.find(f'.//{{{self.xip_ns}}}FormatName')
-                format_dict['FormatName'] = name.text if hasattr(name, 'text') else None
-                version = tech_format.find(f'.//{{{self.xip_ns}}}FormatVersion')
-                format_dict['FormatVersion'] = version.text if hasattr(version, 'text') else None
-                formats_list.append(format_dict)
-
-            index = int(url.rsplit("/", 1)[-1])
-
-            properties = entity_response.findall(f'.//{{{self.xip_ns}}}Properties/{{{self.xip_ns}}}Property')
-            property_set = []
-            for tech_props in properties:
-                tech_props_dict = {}
-                puid = tech_props.find(f'.//{{{self.xip_ns}}}PUID')
-                tech_props_dict['PUID'] = puid.text if hasattr(puid, 'text') else None
-                name = tech_props.find(f'.//{{{self.xip_ns}}}PropertyName')
-                tech_props_dict['PropertyName'] = name.text if hasattr(name, 'text') else None
-                value = tech_props.find(f'.//{{{self.xip_ns}}}Value')
-                tech_props_dict['Value'] = value.text if hasattr(value, 'text') else None
-                property_set.append(tech_props_dict)
-
-            bitstreams = entity_response.findall(f'./{{{self.entity_ns}}}Bitstreams/{{{self.entity_ns}}}Bitstream')
-            bitstream_list = []
-            for bit in bitstreams:
-                bs: Bitstream = self.bitstream(bit.text)
-                bs.gen_index = index
-                if content_ref is not None:
-                    bs.co_ref = content_ref
-                bitstream_list.append(bs)
-            generation = Generation(strtobool(ge.attrib['original']), strtobool(ge.attrib['active']),
-                                    format_group.text if hasattr(format_group, 'text') else None,
-                                    effective_date.text if hasattr(effective_date, 'text') else None,
-                                    bitstream_list)
-            generation.formats = formats_list
-            generation.properties = property_set
-            generation.gen_index = index
-            return generation
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.generation(url)
-        else:
-            exception = HTTPException(url, request.status_code, request.url, "generation",
-                                      request.content.decode('utf-8'))
-            logger.error(exception)
-            raise exception
+        entity_response = _xml_fromstring(self._detail_content(url, "generation"))
+        ge = entity_response.find(self._q_generation)
+        format_group = entity_response.find(self._q_format_group)
+        effective_date = entity_response.find(self._q_effective_date)
+
+        formats_list = []
+        for tech_format in entity_response.iterfind(self._q_formats):
+            format_dict = {'Valid': tech_format.attrib['valid']}
+            puid = tech_format.find(self._q_puid)
+            format_dict['PUID'] = puid.text if puid is not None else None
+            priority = tech_format.find(self._q_priority)
+            format_dict['Priority'] = priority.text if priority is not None else None
+            method = tech_format.find(self._q_identification_method)
+            format_dict['IdentificationMethod'] = method.text if method is not None else None
+            name = tech_format.find(self._q_format_name)
+            format_dict['FormatName'] = name.text if name is not None else None
+            version = tech_format.find(self._q_format_version)
+            format_dict['FormatVersion'] = version.text if version is not None else None
+            formats_list.append(format_dict)
+
+        index = int(url.rsplit("/", 1)[-1])
+
+        property_set = []
+        for tech_props in entity_response.iterfind(self._q_properties):
+            tech_props_dict = {}
+            puid = tech_props.find(self._q_puid)
+            tech_props_dict['PUID'] = puid.text if puid is not None else None
+            name = tech_props.find(self._q_property_name)
+            tech_props_dict['PropertyName'] = name.text if name is not None else None
+            value = tech_props.find(self._q_value)
+            tech_props_dict['Value'] = value.text if value is not None else None
+            property_set.append(tech_props_dict)
+
+        bitstream_urls = [bit.text for bit in entity_response.iterfind(self._q_bitstreams)]
+        bitstream_list = list(_BITSTREAM_POOL.map(self.bitstream, bitstream_urls))
+        for bs in bitstream_list:
+            bs.gen_index = index
+            if content_ref is not None:
+                bs.co_ref = content_ref
+        generation = Generation(strtobool(ge.attrib['original']), strtobool(ge.attrib['active']),
+                                format_group.text if format_group is not None else None,
+                                effective_date.text if effective_date is not None else None,
+                                bitstream_list)
+        generation.formats = formats_list
+        generation.properties = property_set
+        generation.gen_index = index
+        return generation
 
     def _integrity_checks(self, bitstream: Bitstream, maximum: int = 10, next_page: str = None):
-        headers = {HEADER_TOKEN: self.token}
         if next_page is None:
             url = re.sub('content$', f'integrity-check-history', bitstream.content_url)
             params = {'start': '0', 'max': str(maximum)}
-            request = self.session.get(url, headers=headers, params=params)
+            request = self._request('GET', url, params=params)
         else:
-            request = self.session.get(next_page, headers=headers)
+            request = self._request('GET', next_page)
 
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             histories = entity_response.findall(f'.//{{{self.entity_ns}}}IntegrityCheckHistory')
 
             next_url = entity_response.find(f'.//{{{self.entity_ns}}}Paging/{{{self.entity_ns}}}Next')
@@ -1895,12 +1847,12 @@ class EntityAPI(AuthenticatedAPI):
                 xip_fixed = history.find(f'./{{{self.xip_ns}}}Fixed')
                 xip_reason = history.find(f'./{{{self.xip_ns}}}Reason')
 
-                check = IntegrityCheck(xip_type.text if hasattr(xip_type, 'text') else None,
-                                       xip_success.text if hasattr(xip_success, 'text') else None,
-                                       xip_date.text if hasattr(xip_date, 'text') else None,
-                                       xip_adapter_name.text if hasattr(xip_adapter_name, 'text') else None,
-                                       xip_fixed.text if hasattr(xip_fixed, 'text') else None,
-                                       xip_reason.text if hasattr(xip_reason, 'text') else None)
+                check = IntegrityCheck(xip_type.text if xip_type is not None else None,
+                                       xip_success.text if xip_success is not None else None,
+                                       xip_date.text if xip_date is not None else None,
+                                       xip_adapter_name.text if xip_adapter_name is not None else None,
+                                       xip_fixed.text if xip_fixed is not None else None,
+                                       xip_reason.text if xip_reason is not None else None)
                 results.append(check)
             has_more = True
             url = None
@@ -1911,9 +1863,6 @@ class EntityAPI(AuthenticatedAPI):
 
             return PagedSet(results, has_more, int(total_hits.text), url)
 
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._integrity_checks(bitstream, maximum, next_page)
         else:
             exception = HTTPException(bitstream.filename, request.status_code, request.url, "_integrity_checks",
                                       request.content.decode('utf-8'))
@@ -1943,36 +1892,20 @@ class EntityAPI(AuthenticatedAPI):
         :return: a bitstream object
         :rtype: Bitstream
          """
-        headers = {HEADER_TOKEN: self.token}
-        request = self.session.get(url, headers=headers)
-        if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            logger.debug(xml_response)
-            filename = entity_response.find(f'.//{{{self.xip_ns}}}Filename')
-            filesize = entity_response.find(f'.//{{{self.xip_ns}}}FileSize')
-            fixity_values = entity_response.findall(f'.//{{{self.xip_ns}}}Fixity')
-            content = entity_response.find(f'.//{{{self.entity_ns}}}Content')
-
-            index = int(url.rsplit("/", 1)[-1])
-
-            fixity = {}
-            for f in fixity_values:
-                fixity[f[0].text] = f[1].text
-            bitstream = Bitstream(filename.text if hasattr(filename, 'text') else None,
-                                  int(filesize.text) if hasattr(filesize, 'text') else None, fixity,
-                                  content.text if hasattr(content, 'text') else None)
-
-            bitstream.bs_index = index
-            return bitstream
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.bitstream(url)
-        else:
-            exception = HTTPException(url, request.status_code, request.url, "bitstream",
-                                      request.content.decode('utf-8'))
-            logger.error(exception)
-            raise exception
+        entity_response = _xml_fromstring(self._detail_content(url, "bitstream"))
+        filename = entity_response.find(self._q_filename)
+        filesize = entity_response.find(self._q_file_size)
+        content = entity_response.find(self._q_content)
+
+        index = int(url.rsplit("/", 1)[-1])
+
+        fixity = {f[0].text: f[1].text for f in entity_response.iter(self._tag_fixity)}
+        bitstream = Bitstream(filename.text if filename is not None else None,
+                              int(filesize.text) if filesize is not None else None, fixity,
+                              content.text if content is not None else None)
+
+        bitstream.bs_index = index
+        return bitstream
 
     def replace_generation_sync(self, content_object: ContentObject, file_name, fixity_algorithm=None,
                                 fixity_value=None) -> str:
@@ -1998,6 +1931,7 @@ class EntityAPI(AuthenticatedAPI):
         while status == "ACTIVE":
             status = self.get_async_progress(pid)
 
+        self._forget_generations(content_object)
         return status
 
     def replace_generation_async(self, content_object: ContentObject, file_name, fixity_algorithm=None,
@@ -2017,7 +1951,7 @@ class EntityAPI(AuthenticatedAPI):
         """
         if (self.major_version < 7) and (self.minor_version < 2) and (self.patch_version < 1):
             raise RuntimeError("replace API call is only available when connected to a v6.2.1 System")
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/octet-stream'}
+        headers = {**_OCTET_HEADERS}
 
         params = {"replaceType": "previous"}
 
@@ -2049,16 +1983,13 @@ class EntityAPI(AuthenticatedAPI):
         headers['Content-Length'] = str(os.path.getsize(file_name))
 
         with open(file_name, 'rb') as f:
-            request = self.session.post(
-                f'{self.protocol}://{self.server}/api/entity/{CO_PATH}/{content_object.reference}/generations',
+            request = self._request(
+                'POST', f'{self._entity_base}/{CO_PATH}/{content_object.reference}/generations',
                 params=params, data=f, headers=headers)
 
         if request.status_code == requests.codes.ok:
-            return str(request.content.decode('utf-8'))
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.replace_generation_async(content_object=content_object, file_name=file_name,
-                                                 fixity_algorithm=fixity_algorithm, fixity_value=fixity_value)
+            self._forget_generations(content_object)
+            return request.content.decode('utf-8')
         else:
             exception = HTTPException(content_object.reference, request.status_code, request.url,
                                       "replace_generation_async", request.content.decode('utf-8'))
@@ -2074,26 +2005,17 @@ class EntityAPI(AuthenticatedAPI):
         :return: list of generations
         :rtype: list(Generation)
         """
-        headers = {HEADER_TOKEN: self.token}
-        request = self.session.get(
-            f'{self.protocol}://{self.server}/api/entity/{CO_PATH}/{content_object.reference}/generations',
-            headers=headers)
+        request = self._request(
+            'GET', f'{self._entity_base}/{CO_PATH}/{content_object.reference}/generations')
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            generations = entity_response.findall(f'.//{{{self.entity_ns}}}Generation')
-            result = []
-            for g in generations:
-                if hasattr(g, 'text'):
-                    generation = self.generation(g.text, content_object.reference)
-                    generation.asset = content_object.asset
-                    generation.content_object = content_object
-                    generation.representation_type = content_object.representation_type
-                    result.append(generation)
+            entity_response = _xml_fromstring(request.content)
+            urls = [g.text for g in entity_response.iter(self._tag_generation_url)]
+            result = list(_POOL.map(lambda url: self.generation(url, content_object.reference), urls))
+            for generation in result:
+                generation.asset = content_object.asset
+                generation.content_object = content_object
+                generation.representation_type = content_object.representation_type
             return result
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.generations(content_object)
         else:
             exception = HTTPException(content_object.reference, request.status_code, request.url,
                                       "generations", request.content.decode('utf-8'))
@@ -2119,37 +2041,27 @@ class EntityAPI(AuthenticatedAPI):
                             bitstream.generation = generation
                             yield bitstream
 
-    def representations(self, asset: Asset) -> set[Representation]:
+    def representations(self, asset: Asset) -> list[Representation]:
         """
-        Return a set of representations for the asset
+        Return a list of representations for the asset
 
         Representations are used to define how the information object are composed in terms of technology and structure.
 
         :param asset: The asset containing the required representations
         :type  asset: Asset
-        :return: Set of Representation objects
-        :rtype: set(Representation)
+        :return: List of Representation objects in the order returned by the server
+        :rtype: list(Representation)
         """
-        headers = {HEADER_TOKEN: self.token}
         if not isinstance(asset, Asset):
-            return set()
-        request = self.session.get(
-            f'{self.protocol}://{self.server}/api/entity/{asset.path}/{asset.reference}/representations',
-            headers=headers)
+            return []
+        reference = asset.reference
+        request = self._request('GET', f'{self._entity_base}/{IO_PATH}/{reference}/representations')
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            representations = entity_response.findall(f'.//{{{self.entity_ns}}}Representation')
-            result = set()
-            for r in representations:
-                representation = Representation(asset, r.get('type'), r.get("name", None), r.text)
-                result.add(representation)
-            return result
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.representations(asset)
+            entity_response = _xml_fromstring(request.content)
+            return [Representation(asset, r.get('type'), r.get("name", None), r.text)
+                    for r in entity_response.iter(self._tag_representation)]
         else:
-            exception = HTTPException(asset.reference, request.status_code, request.url,
+            exception = HTTPException(reference, request.status_code, request.url,
                                       "representations", request.content.decode('utf-8'))
             logger.error(exception)
             raise exception
@@ -2167,16 +2079,10 @@ class EntityAPI(AuthenticatedAPI):
         if isinstance(entity, ContentObject):
             raise RuntimeError("Thumbnails cannot be added to Content Objects")
 
-        headers = {HEADER_TOKEN: self.token}
-
-        request = self.session.delete(
-            f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/preview',
-            headers=headers)
+        request = self._request(
+            'DELETE', f'{self._entity_base}/{entity.path}/{entity.reference}/preview')
         if request.status_code == requests.codes.no_content:
-            return str(request.content.decode('utf-8'))
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.remove_thumbnail(entity)
+            return request.content.decode('utf-8')
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url,
                                       "remove_thumbnail", request.content.decode('utf-8'))
@@ -2200,21 +2106,18 @@ class EntityAPI(AuthenticatedAPI):
         if isinstance(entity, Folder) or isinstance(entity, ContentObject):
             raise RuntimeError("Add Representation cannot be added to Folders and Content Objects")
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/octet-stream'}
+        headers = _OCTET_HEADERS
 
         filename = os.path.basename(access_file)
 
         params = {'type': 'Access', 'name': name, 'filename': filename}
 
         with open(access_file, 'rb') as fd:
-            request = self.session.post(
-                f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/representations',
+            request = self._request(
+                'POST', f'{self._entity_base}/{entity.path}/{entity.reference}/representations',
                 data=fd, headers=headers, params=params)
             if request.status_code == requests.codes.accepted:
-                return str(request.content.decode('utf-8'))
-            elif request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.add_access_representation(entity, access_file, name)
+                return request.content.decode('utf-8')
             else:
                 exception = HTTPException(entity.reference, request.status_code, request.url,
                                           "add_access_representation", request.content.decode('utf-8'))
@@ -2237,18 +2140,15 @@ class EntityAPI(AuthenticatedAPI):
         if isinstance(entity, ContentObject):
             raise RuntimeError("Thumbnails cannot be added to Content Objects")
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/octet-stream'}
+        headers = _OCTET_HEADERS
 
         with open(image_file, 'rb') as fd:
-            request = self.session.put(
-                f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/preview',
+            request = self._request(
+                'PUT', f'{self._entity_base}/{entity.path}/{entity.reference}/preview',
                 data=fd, headers=headers)
 
         if request.status_code == requests.codes.no_content:
-            return str(request.content.decode('utf-8'))
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_thumbnail(entity, image_file)
+            return request.content.decode('utf-8')
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url,
                                       "add_thumbnail", request.content.decode('utf-8'))
@@ -2263,18 +2163,14 @@ class EntityAPI(AuthenticatedAPI):
             logger.error("Entity events is only available when connected to a v6.1 System")
             raise RuntimeError("Entity events is only available when connected to a v6.1 System")
 
-        headers = {HEADER_TOKEN: self.token}
         params = {'start': str(0), 'max': str(maximum)}
 
-        request = self.session.get(
-            f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/event-actions',
-            params=params, headers=headers)
+        request = self._request(
+            'GET', f'{self._entity_base}/{entity.path}/{entity.reference}/event-actions',
+            params=params)
 
         if request.status_code == requests.codes.ok:
             return None
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._event_actions(entity, maximum=maximum)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url,
                                       "_event_actions", request.content.decode('utf-8'))
@@ -2297,6 +2193,35 @@ class EntityAPI(AuthenticatedAPI):
             if entity.entity_type == EntityType.FOLDER:
                 yield from self.all_descendants(folder=entity)
 
+    async def all_descendants_async(self, folder: Union[Folder, Entity] = None,
+                                    max_concurrency: int = POOL_CONNECTIONS) -> list[Entity]:
+        """
+         Return all child entities recursively of a folder or repository, listing sub-folders concurrently
+
+         A coroutine version of all_descendants() for use inside an event loop. Each folder is listed in a
+         worker thread over the shared session, at most max_concurrency folders at a time.
+         The entities are not returned in the same order as all_descendants().
+
+        :param folder: The parent folder, None for the children of root folders
+        :type folder: Folder
+        :param  max_concurrency: The maximum number of folders listed at once
+        :type  max_concurrency: int
+        :return: List of entity objects (Folders and Assets)
+        :rtype: list(Entity)
+
+         """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        results = []
+
+        async def walk(parent):
+            async with semaphore:
+                children = await asyncio.to_thread(lambda: list(self.descendants(folder=parent)))
+            results.extend(children)
+            await asyncio.gather(*[walk(child) for child in children if child.entity_type == EntityType.FOLDER])
+
+        await walk(folder)
+        return results
+
     def descendants(self, folder: Union[str, Folder] = None) -> Generator[Entity, None, None]:
 
         """
@@ -2331,11 +2256,10 @@ class EntityAPI(AuthenticatedAPI):
         :param str folder: The parent folder reference, None for the children of root folders
         :param int maximum: The maximum size of the result set in each page
         :param str next_page: A URL for the next page of results
-        :return: A set of entity objects
-        :rtype: set(Entity)
+        :return: A list of entity objects in the order returned by the server
+        :rtype: list(Entity)
         """
 
-        headers = {HEADER_TOKEN: self.token}
         data = {'start': str(0), 'max': str(maximum)}
 
         if isinstance(folder, Folder):
@@ -2344,42 +2268,38 @@ class EntityAPI(AuthenticatedAPI):
             folder_reference = folder
         if next_page is None:
             if folder_reference is None:
-                request = self.session.get(f'{self.protocol}://{self.server}/api/entity/root/children', params=data,
-                                           headers=headers)
+                request = self._request('GET', f'{self._entity_base}/root/children',
+                                        params=data, stream=True)
             else:
                 if hasattr(folder, "reference"):
                     folder_reference = folder.reference
-                request = self.session.get(
-                    f'{self.protocol}://{self.server}/api/entity/structural-objects/{folder_reference}/children',
-                    params=data, headers=headers)
+                request = self._request(
+                    'GET',
+                    f'{self._entity_base}/structural-objects/{folder_reference}/children',
+                    params=data, stream=True)
         else:
-            request = self.session.get(next_page, headers=headers)
+            request = self._request('GET', next_page, stream=True)
         logger.debug(request.url)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            children = entity_response.findall(f'.//{{{self.entity_ns}}}Child')
-            result = set()
-            next_url = entity_response.find(f'.//{{{self.entity_ns}}}Next')
-            total_hits = entity_response.find(f'.//{{{self.entity_ns}}}TotalResults')
-            for child in children:
-                if child.attrib['type'] == EntityType.FOLDER.value:
-                    folder = Folder(child.attrib['ref'], child.attrib['title'], None, None, folder_reference, None)
-                    result.add(folder)
-                else:
-                    asset = Asset(child.attrib['ref'], child.attrib['title'], None, None, folder_reference, None)
-                    result.add(asset)
-            has_more = True
+            result = []
             url = None
-            if next_url is None:
-                has_more = False
-            else:
-                url = next_url.text
-            return PagedSet(result, has_more, int(total_hits.text), url)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.children(folder_reference, maximum=maximum, next_page=next_page)
+            total_hits = None
+            append = result.append
+            tag_child = self._tag_child
+            folder_type = EntityType.FOLDER.value
+            request.raw.decode_content = True
+            with request:
+                for _, element in _xml_iterparse(request.raw):
+                    if element.tag == tag_child:
+                        attrib = element.attrib
+                        append((Folder if attrib['type'] == folder_type else Asset)(
+                            attrib['ref'], attrib['title'], None, None, folder_reference, None))
+                        element.clear()
+                    elif element.tag == self._tag_next:
+                        url = element.text
+                    elif element.tag == self._tag_total_results:
+                        total_hits = element.text
+            return PagedSet(result, url is not None, int(total_hits), url)
         else:
             exception = HTTPException(folder_reference, request.status_code, request.url,
                                       "children", request.content.decode('utf-8'))
@@ -2397,7 +2317,6 @@ class EntityAPI(AuthenticatedAPI):
         :rtype: Generator
         """
 
-        self.token = self.__token__()
         previous = datetime.utcnow() - timedelta(days=previous_days)
         from_date = previous.replace(tzinfo=timezone.utc).isoformat()
         to_date = datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
@@ -2420,7 +2339,6 @@ class EntityAPI(AuthenticatedAPI):
         :return: A generator of events
         :rtype: Generator
         """
-        self.token = self.__token__()
         paged_set = self._all_events_page()
         for entity in paged_set.results:
             yield entity
@@ -2430,18 +2348,14 @@ class EntityAPI(AuthenticatedAPI):
                 yield entity
 
     def _entity_from_event_page(self, event_id: str, maximum: int = 25, next_page: str = None):
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = _XML_HEADERS
         if next_page is None:
-            url = f'{self.protocol}://{self.server}/api/entity/events/{event_id}/event-actions'
-            response = requests.get(url, params={'start': 0, 'max': maximum}, headers=headers)
+            url = f'{self._entity_base}/events/{event_id}/event-actions'
+            response = self._request('GET', url, params={'start': 0, 'max': maximum}, headers=headers)
         else:
-            response = requests.get(next_page, headers=headers)
-        if response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._entity_from_event_page(event_id, maximum, next_page)
+            response = self._request('GET', next_page, headers=headers)
         if response.status_code == 200:
-            xml_response = str(response.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            entity_response = _xml_fromstring(response.content)
             actions = entity_response.findall(f'.//{{{self.xip_ns}}}EventAction')
             result_list = []
             for action in actions:
@@ -2454,8 +2368,8 @@ class EntityAPI(AuthenticatedAPI):
                 entity_ref = action.find(f'.//{{{self.xip_ns}}}Entity')
                 item['Entity'] = entity_ref.text
                 result_list.append(item)
-            next_url = entity_response.find(f'.//{{{self.entity_ns}}}Next')
-            total_hits = entity_response.find(f'.//{{{self.entity_ns}}}TotalResults')
+            next_url = entity_response.find(self._q_next)
+            total_hits = entity_response.find(self._q_total_results)
             has_more = True
             url = None
             if next_url is None:
@@ -2474,7 +2388,6 @@ class EntityAPI(AuthenticatedAPI):
         :rtype: Generator
         
         """
-        self.token = self.__token__()
         paged_set = self._entity_from_event_page(event_id, 25, None)
         for entity in paged_set.results:
             yield entity
@@ -2487,7 +2400,6 @@ class EntityAPI(AuthenticatedAPI):
         """
           event actions performed against this repository
          """
-        headers = {HEADER_TOKEN: self.token}
 
         params = {'start': str(0), 'max': str(maximum)}
         if "type" in kwargs:
@@ -2500,25 +2412,23 @@ class EntityAPI(AuthenticatedAPI):
             params["username"] = kwargs.get("username")
 
         if next_page is None:
-            request = self.session.get(f'{self.protocol}://{self.server}/api/entity/events', params=params,
-                                       headers=headers)
+            request = self._request('GET', f'{self._entity_base}/events', params=params)
         else:
-            request = self.session.get(next_page, headers=headers)
+            request = self._request('GET', next_page)
 
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             events = entity_response.findall(f'.//{{{self.xip_ns}}}Event')
             result_list = []
             for event in events:
                 result = {'eventType': event.attrib['type']}
                 date_node = event.find(f'.//{{{self.xip_ns}}}Date')
-                result['Date'] = date_node.text if hasattr(date_node, 'text') else None
+                result['Date'] = date_node.text if date_node is not None else None
                 user_node = event.find(f'.//{{{self.xip_ns}}}User')
-                result['User'] = user_node.text if hasattr(user_node, 'text') else None
+                result['User'] = user_node.text if user_node is not None else None
                 ref_node = event.find(f'.//{{{self.xip_ns}}}Ref')
-                result['Ref'] = ref_node.text if hasattr(ref_node, 'text') else None
+                result['Ref'] = ref_node.text if ref_node is not None else None
 
                 workflow_name = event.find(f'.//{{{self.xip_ns}}}WorkflowName')
                 if workflow_name is not None:
@@ -2533,8 +2443,8 @@ class EntityAPI(AuthenticatedAPI):
                     result['SerialisedCommand'] = serialised_command.text
 
                 result_list.append(result)
-            next_url = entity_response.find(f'.//{{{self.entity_ns}}}Next')
-            total_hits = entity_response.find(f'.//{{{self.entity_ns}}}TotalResults')
+            next_url = entity_response.find(self._q_next)
+            total_hits = entity_response.find(self._q_total_results)
             has_more = True
             url = None
             if next_url is None:
@@ -2543,9 +2453,6 @@ class EntityAPI(AuthenticatedAPI):
                 url = next_url.text
             return PagedSet(result_list, has_more, int(total_hits.text), url)
 
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._all_events_page(maximum, next_page, **kwargs)
         else:
             exception = HTTPException("", request.status_code, request.url,
                                       "_all_events_page", request.content.decode('utf-8'))
@@ -2560,19 +2467,17 @@ class EntityAPI(AuthenticatedAPI):
             logger.error("Entity events is only available when connected to a v6.1 System")
             raise RuntimeError("Entity events is only available when connected to a v6.1 System")
 
-        headers = {HEADER_TOKEN: self.token}
         params = {'start': str(0), 'max': str(maximum)}
         if next_page is None:
-            request = self.session.get(
-                f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/event-actions',
-                params=params, headers=headers)
+            request = self._request(
+                'GET', f'{self._entity_base}/{entity.path}/{entity.reference}/event-actions',
+                params=params)
         else:
-            request = self.session.get(next_page, headers=headers)
+            request = self._request('GET', next_page)
 
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             event_actions = entity_response.findall(f'.//{{{self.xip_ns}}}EventAction')
             result_list = []
             for event_action in event_actions:
@@ -2609,8 +2514,8 @@ class EntityAPI(AuthenticatedAPI):
                     result['SerialisedCommand'] = serialised_command.text
 
                 result_list.append(result)
-            next_url = entity_response.find(f'.//{{{self.entity_ns}}}Next')
-            total_hits = entity_response.find(f'.//{{{self.entity_ns}}}TotalResults')
+            next_url = entity_response.find(self._q_next)
+            total_hits = entity_response.find(self._q_total_results)
             has_more = True
             url = None
             if next_url is None:
@@ -2618,9 +2523,6 @@ class EntityAPI(AuthenticatedAPI):
             else:
                 url = next_url.text
             return PagedSet(result_list, has_more, int(total_hits.text), url)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._entity_events_page(entity)
         else:
             exception = HTTPException(entity.reference, request.status_code, request.url,
                                       "_all_events_page", request.content.decode('utf-8'))
@@ -2638,7 +2540,6 @@ class EntityAPI(AuthenticatedAPI):
         :rtype: list
 
         """
-        self.token = self.__token__()
         paged_set = self._entity_events_page(entity)
         for entity in paged_set.results:
             yield entity
@@ -2659,59 +2560,45 @@ class EntityAPI(AuthenticatedAPI):
 
         """
 
-        self.token = self.__token__()
         maximum = 25
-        paged_set = self._updated_entities_page(previous_days=previous_days, maximum=maximum, next_page=None)
+        since = (datetime.utcnow() - timedelta(days=previous_days)).replace(tzinfo=timezone.utc).isoformat()
+        paged_set = self._updated_entities_page(since, maximum=maximum, next_page=None)
         for entity in paged_set.results:
             yield entity
         while paged_set.has_more:
-            paged_set = self._updated_entities_page(previous_days=previous_days, maximum=maximum,
-                                                    next_page=paged_set.next_page)
+            paged_set = self._updated_entities_page(since, maximum=maximum, next_page=paged_set.next_page)
             for entity in paged_set.results:
                 yield entity
 
-    def _updated_entities_page(self, previous_days: int = 1, maximum: int = 50, next_page: str = None) -> PagedSet:
-        headers = {HEADER_TOKEN: self.token}
-        x = datetime.utcnow() - timedelta(days=previous_days)
-        today = x.replace(tzinfo=timezone.utc).isoformat()
+    def _updated_entities_page(self, since: str, maximum: int = 50, next_page: str = None) -> PagedSet:
         if next_page is None:
-            params = {'date': today, 'start': '0', 'max': str(maximum)}
-            request = self.session.get(f'{self.protocol}://{self.server}/api/entity/entities/updated-since',
-                                       headers=headers, params=params)
+            params = {'date': since, 'start': '0', 'max': str(maximum)}
+            request = self._request('GET', f'{self._entity_base}/entities/updated-since',
+                                    params=params, stream=True)
         else:
-            request = self.session.get(next_page, headers=headers)
+            request = self._request('GET', next_page, stream=True)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            entities = entity_response.findall(f'.//{{{self.entity_ns}}}Entity')
             result = []
-            for entity in entities:
-                if 'type' in entity.attrib:
-                    if entity.attrib['type'] == EntityType.FOLDER.value:
-                        folder = Folder(entity.attrib['ref'], entity.attrib['title'], None, None, None, None)
-                        result.append(folder)
-                    elif entity.attrib['type'] == EntityType.ASSET.value:
-                        asset = Asset(entity.attrib['ref'], entity.attrib['title'], None, None, None, None)
-                        result.append(asset)
-                    elif entity.attrib['type'] == EntityType.CONTENT_OBJECT.value:
-                        co = ContentObject(entity.attrib['ref'], entity.attrib['title'], None, None, None, None)
-                        result.append(co)
-            next_url = entity_response.find(f'.//{{{self.entity_ns}}}Next')
-            total_hits = entity_response.find(f'.//{{{self.entity_ns}}}TotalResults')
-            has_more = True
             url = None
-            if next_url is None:
-                has_more = False
-            else:
-                url = next_url.text
-            return PagedSet(result, has_more, int(total_hits.text), url)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._updated_entities_page(previous_days=previous_days, maximum=maximum,
-                                               next_page=next_page)
+            total_hits = None
+            append = result.append
+            tag_entity = self._tag_listed_entity
+            request.raw.decode_content = True
+            with request:
+                for _, element in _xml_iterparse(request.raw):
+                    if element.tag == tag_entity:
+                        attrib = element.attrib
+                        entity_class = _LISTED_TYPES.get(attrib.get('type'))
+                        if entity_class is not None:
+                            append(entity_class(attrib['ref'], attrib['title'], None, None, None, None))
+                        element.clear()
+                    elif element.tag == self._tag_next:
+                        url = element.text
+                    elif element.tag == self._tag_total_results:
+                        total_hits = element.text
+            return PagedSet(result, url is not None, int(total_hits), url)
         else:
-            exception = HTTPException(previous_days, request.status_code, request.url,
+            exception = HTTPException(since, request.status_code, request.url,
                                       "_updated_entities_page", request.content.decode('utf-8'))
             logger.error(exception)
             raise exception
@@ -2758,8 +2645,7 @@ class EntityAPI(AuthenticatedAPI):
         """
 
         # check manager password is available:
-        config = configparser.ConfigParser()
-        config.read(credentials_path, encoding='utf-8')
+        config = _read_credentials(credentials_path)
         try:
             manager_username = config['credentials']['manager.username']
             manager_password = config['credentials']['manager.password']
@@ -2767,9 +2653,7 @@ class EntityAPI(AuthenticatedAPI):
         except KeyError:
             raise RuntimeError("No manager password set in credentials.properties")
 
-        self.token = self.__token__()
-
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = _XML_HEADERS
         xml_object = xml.etree.ElementTree.Element('DeletionAction',
                                                    {"xmlns:xip": self.xip_ns, "xmlns": self.entity_ns})
         submission_el = xml.etree.ElementTree.SubElement(xml_object, "Submission")
@@ -2777,17 +2661,20 @@ class EntityAPI(AuthenticatedAPI):
         comment_el.text = operator_comment
         xml_request = xml.etree.ElementTree.tostring(xml_object, encoding='utf-8')
         logger.debug(xml_request)
-        request = self.session.delete(f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}',
-                                      data=xml_request, headers=headers)
+        request = self._request(
+            'DELETE', f'{self._entity_base}/{entity.path}/{entity.reference}',
+            data=xml_request, headers=headers)
         logger.debug(request.content.decode("utf-8"))
         if request.status_code == requests.codes.accepted:
+            self._forget_entity(entity)
             progress = request.content.decode("utf-8")
-            req = self.session.get(f"{self.protocol}://{self.server}/api/entity/progress/{progress}", headers=headers)
+            req = self._request('GET', f"{self._entity_base}/progress/{progress}",
+                                headers=headers)
             while True:
                 if req.status_code == requests.codes.ok:
-                    entity_response = xml.etree.ElementTree.fromstring(req.content.decode("utf-8"))
+                    entity_response = _xml_fromstring(req.content)
                     status = entity_response.find(".//{http://status.preservica.com}Status")
-                    if hasattr(status, 'text'):
+                    if status is not None:
                         if status.text == "COMPLETED":
                             return entity.reference
                         if status.text == "PENDING":
@@ -2800,8 +2687,8 @@ class EntityAPI(AuthenticatedAPI):
                             xml.etree.ElementTree.SubElement(approval_el, "Comment").text = supervisor_comment
                             xml_request = xml.etree.ElementTree.tostring(xml_object, encoding='utf-8')
                             logger.debug(xml_request)
-                            approve = self.session.put(
-                                f"{self.protocol}://{self.server}/api/entity/actions/deletions/{progress}",
+                            approve = self._request(
+                                'PUT', f"{self._entity_base}/actions/deletions/{progress}",
                                 data=xml_request, headers=headers)
                             if approve.status_code == requests.codes.accepted:
                                 return entity.reference
@@ -2809,11 +2696,8 @@ class EntityAPI(AuthenticatedAPI):
                                 logger.error(approve.content.decode('utf-8'))
                                 raise RuntimeError(approve.status_code, "delete_asset failed during approval")
                         sleep(2.0)
-                req = self.session.get(f"{self.protocol}://{self.server}/api/entity/progress/{progress}",
-                                       headers=headers)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._delete_entity(entity, operator_comment, supervisor_comment, credentials_path)
+                req = self._request('GET', f"{self._entity_base}/progress/{progress}",
+                                    headers=headers)
         if request.status_code == requests.codes.unprocessable:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "no active workflow context for full deletion exists in the system")
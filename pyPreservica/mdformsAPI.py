@@ -149,22 +149,17 @@ class MetadataGroupsAPI(AuthenticatedAPI):
         Download a template csv to allow bulk input of data
 
         """
-        headers = {HEADER_TOKEN: self.token}
         url = f'{self.protocol}://{self.server}/api/metadata/csv-templates/download'
 
         for form in self.forms():
             if form['title'] == form_name:
                 form_id: str = form['id']
                 params = {'ids': form_id}
-                with self.session.get(url, headers=headers, params=params) as response:
+                with self._request('GET', url, params=params) as response:
                     if response.status_code == requests.codes.ok:
                         with open(f"{form_name}.csv", mode="wt", encoding="utf-8") as fd:
                             fd.write(response.content.decode("utf-8"))
-                            fd.flush()
                             return f"{form_name}.csv"
-                    if response.status_code == requests.codes.unauthorized:
-                        self.token = self.__token__()
-                        return self.download_template(form_name)
                     else:
                         exception = HTTPException(None, response.status_code, response.url, "download_template",
                                                   response.content.decode('utf-8'))
@@ -198,13 +193,10 @@ class MetadataGroupsAPI(AuthenticatedAPI):
          :rtype: None
 
          """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
         url = f'{self.protocol}://{self.server}/api/metadata/groups/{group_id}'
-        with self.session.delete(url, headers=headers) as request:
-            if request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.delete_group(group_id)
-            elif request.status_code == requests.codes.no_content:
+        with self._request('DELETE', url, headers=headers) as request:
+            if request.status_code == requests.codes.no_content:
                 return None
             else:
                 exception = HTTPException(None, request.status_code, request.url, "delete_group",
@@ -237,14 +229,11 @@ class MetadataGroupsAPI(AuthenticatedAPI):
 
         doc = _json_from_object_(this_group)
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
         url = f'{self.protocol}://{self.server}/api/metadata/groups/{group_id}'
-        with self.session.put(url, headers=headers, json=doc) as request:
-            if request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.add_fields(group_id, new_fields)
-            elif request.status_code == requests.codes.created:
-                return json.loads(str(request.content.decode('utf-8')))
+        with self._request('PUT', url, headers=headers, json=doc) as request:
+            if request.status_code == requests.codes.created:
+                return request.json()
             else:
                 exception = HTTPException(None, request.status_code, request.url, "add_fields",
                                           request.content.decode('utf-8'))
@@ -278,16 +267,13 @@ class MetadataGroupsAPI(AuthenticatedAPI):
 
     def update_form(self, form_id: str, json_form: Union[dict, str]):
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
         url = f'{self.protocol}://{self.server}/api/metadata/forms/{form_id}'
 
         if isinstance(json_form, dict):
-            with self.session.put(url, headers=headers, json=json_form) as request:
-                if request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.add_form(json_form)
-                elif request.status_code == requests.codes.ok:
-                    return json.loads(str(request.content.decode('utf-8')))
+            with self._request('PUT', url, headers=headers, json=json_form) as request:
+                if request.status_code == requests.codes.ok:
+                    return request.json()
                 else:
                     exception = HTTPException(None, request.status_code, request.url, "add_form_json",
                                               request.content.decode('utf-8'))
@@ -295,12 +281,9 @@ class MetadataGroupsAPI(AuthenticatedAPI):
                     raise exception
 
         elif isinstance(json_form, str):
-            with self.session.put(url, headers=headers, data=json_form) as request:
-                if request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.add_form(json_form)
-                elif request.status_code == requests.codes.ok:
-                    return json.loads(str(request.content.decode('utf-8')))
+            with self._request('PUT', url, headers=headers, data=json_form) as request:
+                if request.status_code == requests.codes.ok:
+                    return request.json()
                 else:
                     exception = HTTPException(None, request.status_code, request.url, "add_form_json",
                                               request.content.decode('utf-8'))
@@ -320,16 +303,13 @@ class MetadataGroupsAPI(AuthenticatedAPI):
         :rtype: dict
 
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
         url = f'{self.protocol}://{self.server}/api/metadata/forms/'
 
         if isinstance(json_form, dict):
-            with self.session.post(url, headers=headers, json=json_form) as request:
-                if request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.add_form(json_form)
-                elif request.status_code == requests.codes.created:
-                    return json.loads(str(request.content.decode('utf-8')))
+            with self._request('POST', url, headers=headers, json=json_form) as request:
+                if request.status_code == requests.codes.created:
+                    return request.json()
                 else:
                     exception = HTTPException(None, request.status_code, request.url, "add_form_json",
                                               request.content.decode('utf-8'))
@@ -337,12 +317,9 @@ class MetadataGroupsAPI(AuthenticatedAPI):
                     raise exception
 
         elif isinstance(json_form, str):
-            with self.session.post(url, headers=headers, data=json_form) as request:
-                if request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.add_form(json_form)
-                elif request.status_code == requests.codes.created:
-                    return json.loads(str(request.content.decode('utf-8')))
+            with self._request('POST', url, headers=headers, data=json_form) as request:
+                if request.status_code == requests.codes.created:
+                    return request.json()
                 else:
                     exception = HTTPException(None, request.status_code, request.url, "add_form_json",
                                               request.content.decode('utf-8'))
@@ -368,7 +345,7 @@ class MetadataGroupsAPI(AuthenticatedAPI):
     #             self.token = self.__token__()
     #             return self.set_default_form(form_id)
     #         elif request.status_code == requests.codes.ok:
-    #             return json.loads(str(request.content.decode('utf-8')))
+    #             return request.json()
     #         else:
     #             exception = HTTPException(None, request.status_code, request.url, "set_default_form",
     #                                       request.content.decode('utf-8'))
@@ -389,16 +366,13 @@ class MetadataGroupsAPI(AuthenticatedAPI):
           :rtype: dict
 
           """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
         url = f'{self.protocol}://{self.server}/api/metadata/groups/'
 
         if isinstance(json_object, dict):
-            with self.session.post(url, headers=headers, json=json_object) as request:
-                if request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.add_group_json(json_object)
-                elif request.status_code == requests.codes.created:
-                    return json.loads(str(request.content.decode('utf-8')))
+            with self._request('POST', url, headers=headers, json=json_object) as request:
+                if request.status_code == requests.codes.created:
+                    return request.json()
                 else:
                     exception = HTTPException(None, request.status_code, request.url, "add_group_json",
                                               request.content.decode('utf-8'))
@@ -406,12 +380,9 @@ class MetadataGroupsAPI(AuthenticatedAPI):
                     raise exception
 
         elif isinstance(json_object, str):
-            with self.session.post(url, headers=headers, data=json_object) as request:
-                if request.status_code == requests.codes.unauthorized:
-                    self.token = self.__token__()
-                    return self.add_group_json(json_object)
-                elif request.status_code == requests.codes.created:
-                    return json.loads(str(request.content.decode('utf-8')))
+            with self._request('POST', url, headers=headers, data=json_object) as request:
+                if request.status_code == requests.codes.created:
+                    return request.json()
                 else:
                     exception = HTTPException(None, request.status_code, request.url, "add_group_json",
                                               request.content.decode('utf-8'))
@@ -431,14 +402,11 @@ class MetadataGroupsAPI(AuthenticatedAPI):
          :rtype: dict
 
          """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
         url = f'{self.protocol}://{self.server}/api/metadata/groups/{group_id}'
-        with self.session.get(url, headers=headers) as request:
-            if request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.group_json(group_id)
-            elif request.status_code == requests.codes.ok:
-                return json.loads(str(request.content.decode('utf-8')))
+        with self._request('GET', url, headers=headers) as request:
+            if request.status_code == requests.codes.ok:
+                return request.json()
             else:
                 exception = HTTPException(None, request.status_code, request.url, "group_json",
                                           request.content.decode('utf-8'))
@@ -468,14 +436,11 @@ class MetadataGroupsAPI(AuthenticatedAPI):
 
         """
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
         url = f'{self.protocol}://{self.server}/api/metadata/groups'
-        with self.session.get(url, headers=headers) as request:
-            if request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.groups_json()
-            elif request.status_code == requests.codes.ok:
-                return json.loads(str(request.content.decode('utf-8')))['groups']
+        with self._request('GET', url, headers=headers) as request:
+            if request.status_code == requests.codes.ok:
+                return request.json()['groups']
             else:
                 exception = HTTPException(None, request.status_code, request.url, "groups_json",
                                           request.content.decode('utf-8'))
@@ -494,17 +459,14 @@ class MetadataGroupsAPI(AuthenticatedAPI):
 
         """
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
         url = f'{self.protocol}://{self.server}/api/metadata/forms'
         params = {}
         if schema_uri is not None:
             params = {'schemaUri': schema_uri}
-        with self.session.get(url, headers=headers, params=params) as request:
-            if request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.forms()
-            elif request.status_code == requests.codes.ok:
-                return json.loads(str(request.content.decode('utf-8')))['metadataForms']
+        with self._request('GET', url, headers=headers, params=params) as request:
+            if request.status_code == requests.codes.ok:
+                return request.json()['metadataForms']
             else:
                 exception = HTTPException(None, request.status_code, request.url, "forms_json",
                                           request.content.decode('utf-8'))
@@ -516,13 +478,10 @@ class MetadataGroupsAPI(AuthenticatedAPI):
         """
         Delete a form by its ID
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
         url = f'{self.protocol}://{self.server}/api/metadata/forms/{form_id}'
-        with self.session.delete(url, headers=headers) as request:
-            if request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.delete_form(form_id)
-            elif request.status_code == requests.codes.no_content:
+        with self._request('DELETE', url, headers=headers) as request:
+            if request.status_code == requests.codes.no_content:
                 return None
             else:
                 exception = HTTPException(None, request.status_code, request.url, "delete_form",
@@ -543,14 +502,11 @@ class MetadataGroupsAPI(AuthenticatedAPI):
              :rtype: dict
 
          """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
         url = f'{self.protocol}://{self.server}/api/metadata/forms/{form_id}'
-        with self.session.get(url, headers=headers) as request:
-            if request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.form(form_id)
-            elif request.status_code == requests.codes.ok:
-                return json.loads(str(request.content.decode('utf-8')))
+        with self._request('GET', url, headers=headers) as request:
+            if request.status_code == requests.codes.ok:
+                return request.json()
             else:
                 exception = HTTPException(None, request.status_code, request.url, "form_json",
                                           request.content.decode('utf-8'))
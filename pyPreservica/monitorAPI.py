@@ -47,21 +47,21 @@ class MonitorAPI(AuthenticatedAPI):
        """
 
     def _messages_page_(self, monitor_id, maximum: int = 50, next_page: str = None, status: MessageStatus = None) -> PagedSet:
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
 
         if next_page is None:
             params = {'monitor': monitor_id, 'start': int(0), 'max': maximum}
             if status:
                 params['status'] = status.value
-            request = self.session.get(f'{self.protocol}://{self.server}/api/processmonitor/messages', headers=headers,
-                                       params=params)
+            request = self._request('GET', f'{self.protocol}://{self.server}/api/processmonitor/messages', headers=headers,
+                                    params=params)
         else:
             params = {'monitor': monitor_id}
             if status:
                 params['status'] = status.value
-            request = self.session.get(next_page, headers=headers, params=params)
+            request = self._request('GET', next_page, headers=headers, params=params)
         if request.status_code == requests.codes.ok:
-            response = json.loads(str(request.content.decode('utf-8')))
+            response = request.json()
             value = response['value']
             if 'next' in value['paging']:
                 url = value['paging']['next']
@@ -76,9 +76,6 @@ class MonitorAPI(AuthenticatedAPI):
                 m['MonitorId'] = m.pop('mappedMonitorId')
                 m['MessageId'] = m.pop('mappedId')
             return PagedSet(messages, has_more, int(total_hits), url)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self._messages_page_(monitor_id, maximum, next_page, status)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "messages failed")
@@ -110,15 +107,12 @@ class MonitorAPI(AuthenticatedAPI):
         :type monitor_id:   str
         :return:            List of timeseries information
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/processmonitor/monitors/{monitor_id}/timeseries',
-                                   headers=headers)
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
+        request = self._request('GET', f'{self.protocol}://{self.server}/api/processmonitor/monitors/{monitor_id}/timeseries',
+                                headers=headers)
         if request.status_code == requests.codes.ok:
-            response = json.loads(str(request.content.decode('utf-8')))
+            response = request.json()
             return response['value']['timeseries']
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.timeseries(monitor_id)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "timeseries failed")
@@ -133,21 +127,18 @@ class MonitorAPI(AuthenticatedAPI):
         :type category:   MonitorCategory
         :return: Generator for each monitor
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json;charset=UTF-8'}
+        headers = {'Content-Type': 'application/json;charset=UTF-8'}
         params = {}
         if status:
             params['status'] = status.value
         if category:
             params['category'] = category.value
-        request = self.session.get(f'{self.protocol}://{self.server}/api/processmonitor/monitors', headers=headers, params=params)
+        request = self._request('GET', f'{self.protocol}://{self.server}/api/processmonitor/monitors', headers=headers, params=params)
         if request.status_code == requests.codes.ok:
-            monitors = json.loads(str(request.content.decode('utf-8')))
+            monitors = request.json()
             for monitor in monitors['value']['monitors']:
                 monitor['MonitorId'] = monitor.pop('mappedId')
                 yield monitor
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            yield from self.monitors(status, category)
         else:
             logger.error(request.content.decode('utf-8'))
             raise RuntimeError(request.status_code, "monitors failed")
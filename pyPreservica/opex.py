@@ -7,10 +7,11 @@ author:     James Carr
 licence:    Apache License 2.0
 
 """
-import xml.etree.ElementTree
 from typing import Generator
 from zipfile import ZipFile
 
+from pyPreservica.common import _xml_fromstring
+
 
 class OpexAPI(object):
     class OPEXMetadata(object):
@@ -81,16 +82,15 @@ class OpexAPI(object):
                 if o.endswith(".pax.zip.opex"):
                     pax_file = o.replace(".pax.zip.opex", ".pax.zip")
                     with myzip.open(o) as myfile:
-                        xml_response = str(myfile.read().decode('utf-8'))
-                        entity_response = xml.etree.ElementTree.fromstring(xml_response)
+                        entity_response = _xml_fromstring(myfile.read())
                         source_id = entity_response.find(f'.//{{*}}SourceID')
                         title_node = entity_response.find(f'.//{{*}}Title')
                         description_node = entity_response.find(f'.//{{*}}Description')
                         tag_node = entity_response.find(f'.//{{*}}SecurityDescriptor')
 
-                        title = title_node.text if hasattr(title_node, 'text') else None
-                        description = description_node.text if hasattr(description_node, 'text') else None
-                        tag = tag_node.text if hasattr(tag_node, 'text') else None
+                        title = title_node.text if title_node is not None else None
+                        description = description_node.text if description_node is not None else None
+                        tag = tag_node.text if tag_node is not None else None
 
                         opex_metadata = self.OPEXMetadata(source_id.text, title, description, tag)
                         opex_metadata.pax_file = pax_file
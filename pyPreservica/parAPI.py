@@ -160,8 +160,17 @@ class PreservationActionRegistry(AuthenticatedAPI):
     def delete_rule_set(self, guid) -> str:
         return self.__delete__(guid, "rulesets")
 
+    def _basic_auth_request(self, method: str, url: str, **kwargs):
+        """
+            Registry changes are authenticated with HTTP basic auth, so they are sent without the access token
+            header and a 401 is returned to the caller rather than retried with a new token
+        """
+        headers = kwargs.pop('headers', {})
+        return self.session.request(method, url, auth=HTTPBasicAuth(self.username, self.password),
+                                    headers={**headers, HEADER_TOKEN: None}, **kwargs)
+
     def __guid__(self, guid: str, endpoint: str) -> str:
-        request = self.session.get(f'{self.protocol}://{self.server}/Registry/par/{endpoint}/{guid}')
+        request = self._request('GET', f'{self.protocol}://{self.server}/Registry/par/{endpoint}/{guid}')
         if request.status_code == requests.codes.ok:
             return request.content.decode('utf-8')
         else:
@@ -172,7 +181,7 @@ class PreservationActionRegistry(AuthenticatedAPI):
         headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
         if action_type is not None:
             headers['preservation-action-type'] = action_type
-        request = self.session.get(f'{self.protocol}://{self.server}/Registry/par/{endpoint}')
+        request = self._request('GET', f'{self.protocol}://{self.server}/Registry/par/{endpoint}')
         if request.status_code == requests.codes.ok:
             return request.content.decode('utf-8')
         else:
@@ -186,8 +195,8 @@ class PreservationActionRegistry(AuthenticatedAPI):
             raise RuntimeError(f"add {endpoint}  is an authenticated call, please provide credentials")
 
         contents = __get_contents__(document)
-        request = self.session.post(f'{self.protocol}://{self.server}/Registry/par/{endpoint}',
-                                    auth=HTTPBasicAuth(self.username, self.password), headers=headers, data=contents)
+        request = self._basic_auth_request('POST', f'{self.protocol}://{self.server}/Registry/par/{endpoint}',
+                                           headers=headers, data=contents)
 
         if request.status_code == requests.codes.created:
             return request.content.decode('utf-8')
@@ -203,8 +212,8 @@ class PreservationActionRegistry(AuthenticatedAPI):
 
         contents = __get_contents__(document)
 
-        request = self.session.put(f'{self.protocol}://{self.server}/Registry/par/{endpoint}/{guid}',
-                                   auth=HTTPBasicAuth(self.username, self.password), headers=headers, data=contents)
+        request = self._basic_auth_request('PUT', f'{self.protocol}://{self.server}/Registry/par/{endpoint}/{guid}',
+                                           headers=headers, data=contents)
 
         if request.status_code == requests.codes.created:
             return request.content.decode('utf-8')
@@ -217,8 +226,8 @@ class PreservationActionRegistry(AuthenticatedAPI):
             logger.error(f"delete {endpoint} is an authenticated call, please provide credentials")
             raise RuntimeError(f"delete {endpoint}  is an authenticated call, please provide credentials")
 
-        request = self.session.delete(f'{self.protocol}://{self.server}/Registry/par/{endpoint}/{guid}',
-                                      auth=HTTPBasicAuth(self.username, self.password))
+        request = self._basic_auth_request('DELETE',
+                                           f'{self.protocol}://{self.server}/Registry/par/{endpoint}/{guid}')
         if request.status_code == requests.codes.no_content:
             return request.content.decode('utf-8')
         else:
@@ -13,6 +13,7 @@ import xml.etree.ElementTree
 from typing import Set, Callable
 
 from pyPreservica.common import *
+from pyPreservica.common import _xml_fromstring
 
 logger = logging.getLogger(__name__)
 
@@ -76,13 +77,12 @@ class RetentionAPI(AuthenticatedAPI):
         :rtype: RetentionPolicy
 
          """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/entity/retention-policies/{reference}',
-                                   headers=headers)
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request('GET', f'{self._entity_base}/retention-policies/{reference}',
+                                headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             ref = entity_response.find(f'.//{{{self.rm_ns}}}RetentionPolicy/{{{self.rm_ns}}}Ref').text
             assert ref == reference
             name = entity_response.find(f'.//{{{self.rm_ns}}}RetentionPolicy/{{{self.rm_ns}}}Name').text
@@ -120,9 +120,6 @@ class RetentionAPI(AuthenticatedAPI):
             assignable = entity_response.find(f'.//{{{self.rm_ns}}}RetentionPolicy/{{{self.rm_ns}}}Assignable')
             rp.assignable = strtobool(assignable.text)
             return rp
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.policy(reference)
         else:
             logger.error(f"policy failed with error code {request.status_code}")
             raise RuntimeError(request.status_code, "policy failed")
@@ -140,16 +137,13 @@ class RetentionAPI(AuthenticatedAPI):
 
         :return:
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'text/plain;charset=UTF-8'}
+        headers = {'Content-Type': 'text/plain;charset=UTF-8'}
         data = str(status)
-        request = self.session.put(
-            f'{self.protocol}://{self.server}/api/entity/retention-policies/{reference}/assignable',
+        request = self._request(
+            'PUT', f'{self._entity_base}/retention-policies/{reference}/assignable',
             headers=headers, data=data)
         if request.status_code == requests.codes.ok:
             pass
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.assignable_policy(reference, status)
         else:
             logger.error(f"assignable_policy failed with error code {request.status_code}")
             raise RuntimeError(request.status_code, "assignable_policy failed")
@@ -171,7 +165,7 @@ class RetentionAPI(AuthenticatedAPI):
         Restriction
         Assignable
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
         retention_policy = xml.etree.ElementTree.Element('RetentionPolicy ', {"xmlns": self.rm_ns})
 
@@ -239,14 +233,11 @@ class RetentionAPI(AuthenticatedAPI):
 
         xml_request = xml.etree.ElementTree.tostring(retention_policy, encoding='utf-8')
 
-        request = self.session.put(f'{self.protocol}://{self.server}/api/entity/retention-policies/{reference}',
-                                   data=xml_request,
-                                   headers=headers)
+        request = self._request('PUT', f'{self._entity_base}/retention-policies/{reference}',
+                                data=xml_request,
+                                headers=headers)
         if request.status_code == requests.codes.ok:
             return self.policy(reference)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.update_policy(reference, **kwargs)
         else:
             logger.error(str(request.content.decode('utf-8')))
             raise RuntimeError(request.status_code, "update_policy failed " + str(request.content.decode('utf-8')))
@@ -268,7 +259,7 @@ class RetentionAPI(AuthenticatedAPI):
         Restriction
         Assignable
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
         retention_policy = xml.etree.ElementTree.Element('RetentionPolicy ', {"xmlns": self.rm_ns})
 
@@ -335,17 +326,13 @@ class RetentionAPI(AuthenticatedAPI):
 
         xml_request = xml.etree.ElementTree.tostring(retention_policy, encoding='utf-8')
 
-        request = self.session.post(f'{self.protocol}://{self.server}/api/entity/retention-policies', data=xml_request,
-                                    headers=headers)
+        request = self._request('POST', f'{self._entity_base}/retention-policies', data=xml_request,
+                                headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            entity_response = _xml_fromstring(request.content)
             retention_policy = entity_response.find(f'.//{{{self.rm_ns}}}RetentionPolicy')
             ref = retention_policy.find(f'.//{{{self.rm_ns}}}Ref').text
             return self.policy(ref)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.create_policy(**kwargs)
         else:
             logger.error(f'create_policy failed {request.status_code}')
             logger.error(str(request.content.decode('utf-8')))
@@ -359,14 +346,9 @@ class RetentionAPI(AuthenticatedAPI):
         :type reference: str
 
         """
-        headers = {HEADER_TOKEN: self.token}
-        request = self.session.delete(f'{self.protocol}://{self.server}/api/entity/retention-policies/{reference}',
-                                      headers=headers)
+        request = self._request('DELETE', f'{self._entity_base}/retention-policies/{reference}')
         if request.status_code == requests.codes.no_content:
             pass
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.delete_policy(reference)
         else:
             logger.error(f'delete_policy failed {request.status_code}')
             raise RuntimeError(request.status_code, "delete_policy failed")
@@ -382,22 +364,18 @@ class RetentionAPI(AuthenticatedAPI):
         :rtype: RetentionPolicy
 
          """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
         data = {'start': str(0), 'max': "250"}
-        request = self.session.get(f'{self.protocol}://{self.server}/api/entity/retention-policies', data=data,
-                                   headers=headers)
+        request = self._request('GET', f'{self._entity_base}/retention-policies', data=data,
+                                headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             for assignment in entity_response.findall(f'.//{{{self.entity_ns}}}RetentionPolicy'):
                 ref = assignment.attrib['ref']
                 policy_name = assignment.attrib['name']
                 if policy_name == name:
                     return self.policy(reference=ref)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.policy_by_name(name)
         else:
             raise RuntimeError(request.status_code, "policies failed")
 
@@ -411,19 +389,18 @@ class RetentionAPI(AuthenticatedAPI):
         :rtype: Set[RetentionPolicy]
 
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
         if next_page is None:
             params = {'start': '0', 'max': str(maximum)}
-            request = self.session.get(f'{self.protocol}://{self.server}/api/entity/retention-policies', params=params,
-                                       headers=headers)
+            request = self._request('GET', f'{self._entity_base}/retention-policies', params=params,
+                                    headers=headers)
         else:
-            request = self.session.get(next_page, headers=headers)
+            request = self._request('GET', next_page, headers=headers)
 
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
-            logger.debug(xml_response)
+            entity_response = _xml_fromstring(request.content)
+            logger.debug(request.content)
             result = set()
             next_url = entity_response.find(f'.//{{{self.entity_ns}}}Paging/{{{self.entity_ns}}}Next')
             total_results = int(entity_response.find(
@@ -439,9 +416,6 @@ class RetentionAPI(AuthenticatedAPI):
             else:
                 url = next_url.text
             return PagedSet(result, has_more, total_results, url)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.policies()
         else:
             raise RuntimeError(request.status_code, "policies failed")
 
@@ -459,7 +433,7 @@ class RetentionAPI(AuthenticatedAPI):
         :rtype: RetentionAssignment
 
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
         if not isinstance(entity, Asset):
             raise RuntimeError("Retention policies can only be assigned to Assets")
 
@@ -467,13 +441,12 @@ class RetentionAPI(AuthenticatedAPI):
         xml.etree.ElementTree.SubElement(assignment, "RetentionPolicy").text = policy.reference
         xml_request = xml.etree.ElementTree.tostring(assignment, encoding='utf-8').decode('utf-8')
         logger.debug(xml_request)
-        request = self.session.post(
-            f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/retention-assignments',
+        request = self._request(
+            'POST', f'{self._entity_base}/{entity.path}/{entity.reference}/retention-assignments',
             headers=headers, data=xml_request)
 
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            entity_response = _xml_fromstring(request.content)
             api_id = entity_response.find(f'.//{{{self.rm_ns}}}ApiId').text
             policy_ref = entity_response.find(f'.//{{{self.rm_ns}}}RetentionPolicy').text
             entity_ref = entity_response.find(f'.//{{{self.rm_ns}}}Entity').text
@@ -485,9 +458,6 @@ class RetentionAPI(AuthenticatedAPI):
             assert entity_ref == entity.reference
             assert policy_ref == policy.reference
             return RetentionAssignment(entity_ref, policy_ref, api_id, start_date)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.add_assignments(entity, policy)
         else:
             logger.debug(f"add_assignments failed {request.status_code}")
             logger.error(str(request.content.decode('utf-8')))
@@ -506,16 +476,12 @@ class RetentionAPI(AuthenticatedAPI):
 
         """
 
-        headers = {HEADER_TOKEN: self.token}
 
-        request = self.session.delete(
-            f'{self.protocol}://{self.server}/api/entity/information-objects/{retention_assignment.entity_reference}/retention'
-            f'-assignments/{retention_assignment.api_id}', headers=headers)
+        request = self._request(
+            'DELETE', f'{self._entity_base}/information-objects/{retention_assignment.entity_reference}/retention'
+            f'-assignments/{retention_assignment.api_id}')
         if request.status_code == requests.codes.no_content:
             return retention_assignment.entity_reference
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.remove_assignments(retention_assignment)
         else:
             raise RuntimeError(request.status_code, "remove_assignments failed")
 
@@ -530,13 +496,12 @@ class RetentionAPI(AuthenticatedAPI):
           :rtype: Set[RetentionAssignment]
 
         """
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
-        request = self.session.get(
-            f'{self.protocol}://{self.server}/api/entity/{entity.path}/{entity.reference}/retention-assignments',
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
+        request = self._request(
+            'GET', f'{self._entity_base}/{entity.path}/{entity.reference}/retention-assignments',
             headers=headers)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            entity_response = _xml_fromstring(request.content)
             result = set()
             for assignment in entity_response.findall(f'.//{{{self.rm_ns}}}RetentionAssignment'):
                 entity_ref = assignment.find(f'.//{{{self.rm_ns}}}Entity').text
@@ -552,8 +517,5 @@ class RetentionAPI(AuthenticatedAPI):
                 ra = RetentionAssignment(entity_ref, policy, api_id, start_date, expired)
                 result.add(ra)
             return result
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.assignments(entity)
         else:
             raise RuntimeError(request.status_code, "assignments failed")
@@ -68,19 +68,18 @@ class SettingsAPI(AuthenticatedAPI):
 
         """
         headers = {
-            HEADER_TOKEN: self.token,
             "Accept": "application/json",
             "Content-Type": "application/json;charset=UTF-8",
         }
 
         endpoint: str = "/metadata-enrichment/config/rules"
 
-        request = self.session.get(
-            f"{self.protocol}://{self.server}/{self.base_url}{endpoint}",
+        request = self._request(
+            'GET', f"{self.protocol}://{self.server}/{self.base_url}{endpoint}",
             headers=headers)
 
         if request.status_code == requests.codes.ok:
-            rules: dict = json.loads(request.content.decode("utf-8"))
+            rules: dict = request.json()
             if profile_id is None:
                 return rules
             else:
@@ -105,15 +104,14 @@ class SettingsAPI(AuthenticatedAPI):
 
         """
         headers = {
-            HEADER_TOKEN: self.token,
             "Accept": "application/json",
             "Content-Type": "application/json;charset=UTF-8",
         }
 
         endpoint: str = f"/metadata-enrichment/config/rules/{rule_id}"
 
-        request = self.session.delete(
-            f"{self.protocol}://{self.server}/{self.base_url}{endpoint}", headers=headers)
+        request = self._request(
+            'DELETE', f"{self.protocol}://{self.server}/{self.base_url}{endpoint}", headers=headers)
 
         if request.status_code == requests.codes.no_content:
             return
@@ -141,7 +139,6 @@ class SettingsAPI(AuthenticatedAPI):
         """
 
         headers = {
-            HEADER_TOKEN: self.token,
             "Accept": "application/json",
             "Content-Type": "application/json;charset=UTF-8",
         }
@@ -154,13 +151,13 @@ class SettingsAPI(AuthenticatedAPI):
             "selectorSettings": {},
         }
 
-        request = self.session.post(
-            f"{self.protocol}://{self.server}/{self.base_url}/{endpoint}",
+        request = self._request(
+            'POST', f"{self.protocol}://{self.server}/{self.base_url}/{endpoint}",
             headers=headers,
             json=rule,
         )
         if request.status_code == requests.codes.created:
-            return json.loads(request.content.decode("utf-8"))
+            return request.json()
         else:
             logger.debug(request.content.decode("utf-8"))
             raise RuntimeError(
@@ -187,7 +184,6 @@ class SettingsAPI(AuthenticatedAPI):
         """
 
         headers = {
-            HEADER_TOKEN: self.token,
             "Accept": "application/json",
             "Content-Type": "application/json;charset=UTF-8",
         }
@@ -196,12 +192,12 @@ class SettingsAPI(AuthenticatedAPI):
 
         profile: dict = {"name": name, "piiSettings": {"active": str(active).lower()}}
 
-        request = self.session.post(
-            f"{self.protocol}://{self.server}/{self.base_url}{endpoint}",
+        request = self._request(
+            'POST', f"{self.protocol}://{self.server}/{self.base_url}{endpoint}",
             headers=headers, json=profile)
 
         if request.status_code == requests.codes.created:
-            return json.loads(request.content.decode("utf-8"))
+            return request.json()
         else:
             logger.debug(request.content.decode("utf-8"))
             raise RuntimeError(request.status_code, f"metadata_enrichment_add_profile failed")
@@ -221,18 +217,17 @@ class SettingsAPI(AuthenticatedAPI):
 
         """
         headers = {
-            HEADER_TOKEN: self.token,
             "Accept": "application/json",
             "Content-Type": "application/json;charset=UTF-8",
         }
 
         endpoint: str = f"/metadata-enrichment/config/profiles/{profile_id}"
 
-        request = self.session.get(
-            f"{self.protocol}://{self.server}/{self.base_url}{endpoint}", headers=headers)
+        request = self._request(
+            'GET', f"{self.protocol}://{self.server}/{self.base_url}{endpoint}", headers=headers)
 
         if request.status_code == requests.codes.ok:
-            return json.loads(request.content.decode("utf-8"))
+            return request.json()
         else:
             logger.debug(request.content.decode("utf-8"))
             raise RuntimeError(request.status_code, f"metadata_enrichment_profile failed")
@@ -249,15 +244,14 @@ class SettingsAPI(AuthenticatedAPI):
 
         """
         headers = {
-            HEADER_TOKEN: self.token,
             "Accept": "application/json",
             "Content-Type": "application/json;charset=UTF-8",
         }
 
         endpoint: str = f"/metadata-enrichment/config/profiles/{profile_id}"
 
-        request = self.session.delete(
-            f"{self.protocol}://{self.server}/{self.base_url}{endpoint}", headers=headers)
+        request = self._request(
+            'DELETE', f"{self.protocol}://{self.server}/{self.base_url}{endpoint}", headers=headers)
 
         if request.status_code == requests.codes.forbidden:
             logger.debug(request.content.decode("utf-8"))
@@ -278,18 +272,17 @@ class SettingsAPI(AuthenticatedAPI):
         """
 
         headers = {
-            HEADER_TOKEN: self.token,
             "Accept": "application/json",
             "Content-Type": "application/json;charset=UTF-8",
         }
 
         endpoint: str = "/metadata-enrichment/config/profiles"
 
-        request = self.session.get(
-            f"{self.protocol}://{self.server}/{self.base_url}{endpoint}", headers=headers)
+        request = self._request(
+            'GET', f"{self.protocol}://{self.server}/{self.base_url}{endpoint}", headers=headers)
 
         if request.status_code == requests.codes.ok:
-            return json.loads(request.content.decode("utf-8"))
+            return request.json()
         else:
             logger.debug(request.content.decode("utf-8"))
             raise RuntimeError(request.status_code, f"metadata_enrichment_profiles failed")
@@ -8,14 +8,18 @@ licence:    Apache License 2.0
 
 """
 
+import copy
 import csv
 import shutil
 import tempfile
+import threading
 import uuid
 import xml
+import zipfile
 from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
-from xml.dom import minidom
+from typing import Callable
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element, SubElement
 
@@ -32,13 +36,74 @@ from s3transfer import S3UploadFailedError
 from tqdm import tqdm
 
 from pyPreservica.common import *
-from pyPreservica.common import _make_stored_zipfile
+
+# user supplied metadata documents are parsed with defusedxml if it is installed, which rejects entity expansion
+# attacks, otherwise with the standard library parser
+try:
+    from defusedxml.ElementTree import parse as _parse_metadata, fromstring as _metadata_fromstring
+except ImportError:
+    from xml.etree.ElementTree import parse as _parse_metadata, fromstring as _metadata_fromstring
 
 logger = logging.getLogger(__name__)
 
 MB = 1024 * 1024
 GB = 1024 ** 3
-transfer_config = TransferConfig(multipart_threshold=int(32 * MB))
+
+
+def get_transfer_config(multipart_threshold=32 * MB, multipart_chunksize=8 * MB, max_concurrency=16,
+                        max_io_queue=100, io_chunksize=1 * MB, use_threads=True):
+    """
+    Create a new boto3 TransferConfig for package uploads
+
+    :param int multipart_threshold: Packages larger than this are uploaded in parts
+    :param int multipart_chunksize: The size of each part
+    :param int max_concurrency: The number of parts uploaded at the same time
+    :param int max_io_queue: The maximum number of reads queued while parts are uploading
+    :param int io_chunksize: The size of each read from the package file
+    :param bool use_threads: Upload the parts using threads
+    :return: TransferConfig
+    """
+    return TransferConfig(multipart_threshold=multipart_threshold, multipart_chunksize=multipart_chunksize,
+                          max_concurrency=max_concurrency, max_io_queue=max_io_queue, io_chunksize=io_chunksize,
+                          use_threads=use_threads)
+
+
+# the S3 client connection pool is sized from max_concurrency, use upload_config() to change it
+transfer_config = get_transfer_config()
+
+# characters removed from CSV column names to make XML element names
+XML_TAG_TRANSLATION = str.maketrans("", "", " -")
+
+# escapes for XML element text
+XML_TEXT_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# number of files copied into a package and hashed at the same time
+FIXITY_WORKERS = 8
+
+# the library fixity callbacks keep no state, custom callbacks are only called from several threads
+# at once if Fixity_Workers is given
+_THREAD_SAFE_CALLBACKS = (Sha1FixityCallBack, Sha256FixityCallBack, Sha512FixityCallBack, MultiFixityCallBack,
+                          Blake3FixityCallBack)
+
+# number of concurrent repository lookups made by crawl_filesystem when checking which files already exist
+LOOKUP_WORKERS = 8
+
+# number of video fragments downloaded at the same time by ingest_web_video when yt-dlp is installed
+WEB_VIDEO_FRAGMENT_WORKERS = 8
+
+# file types which are already compressed, these are stored in the package zip without deflating them again
+COMPRESSED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".jp2", ".mp3", ".mp4", ".m4a",
+                                   ".m4v", ".mov", ".mkv", ".webm", ".ogg", ".pdf", ".zip", ".gz", ".bz2", ".xz",
+                                   ".7z", ".docx", ".xlsx", ".pptx", ".epub"})
+
+# write buffer for package metadata documents which are built up from many small writes
+XML_BUFFER_SIZE = 1 * MB
+
+# deflate level of the package zip, level 1 is several times faster than the zlib default for a few percent more bytes
+ZIP_COMPRESS_LEVEL = 1
+
+# read buffer for the CSV files used to create metadata documents
+CSV_BUFFER_SIZE = 1 * MB
 
 CONTENT_FOLDER = "content"
 PRESERVATION_CONTENT_FOLDER = "p1"
@@ -92,13 +157,23 @@ s3transfer.upload.CompleteMultipartUploadTask = CompleteMultipartUploadTask
 
 def prettify(elem):
     """Return a pretty-printed XML string for the Element.
+
+    The element is indented on a copy and is not changed.
     """
-    rough_string = xml.etree.ElementTree.tostring(elem, 'utf-8')
-    re_parsed = minidom.parseString(rough_string)
-    return re_parsed.toprettyxml(indent="  ")
+    elem = copy.deepcopy(elem)
+    xml.etree.ElementTree.indent(elem, space="  ")
+    return xml.etree.ElementTree.tostring(elem, encoding="unicode", xml_declaration=True)
 
 
-def __create_io__(xip=None, file_name=None, parent_folder=None, **kwargs):
+def _write_xip_elements(file, xip):
+    """Append the children of the Element to an open XIP document, indented one level below the root.
+    """
+    for element in xip:
+        xml.etree.ElementTree.indent(element, space="  ", level=1)
+        file.write("  " + xml.etree.ElementTree.tostring(element, encoding="unicode") + "\n")
+
+
+def __create_io__(xip=None, file_name=None, parent_folder=None, io_ref=None, **kwargs):
     if xip is None:
         xip = Element('xip:XIP')
         xip.set('xmlns:xip', 'http://preservica.com/XIP/v6.0')
@@ -109,6 +184,8 @@ def __create_io__(xip=None, file_name=None, parent_folder=None, **kwargs):
     if 'IO_Identifier_callback' in kwargs:
         ident_callback = kwargs.get('IO_Identifier_callback')
         ref.text = ident_callback()
+    elif io_ref is not None:
+        ref.text = io_ref
     else:
         ref.text = str(uuid.uuid4())
 
@@ -179,24 +256,26 @@ def __make_generation__(xip, filename, co_ref, generation_label, location=None):
     SubElement(generation, "xip:Properties")
 
 
-def __make_bitstream__(xip, file_name, full_path, callback, location=None):
+def __make_bitstream__(xip, file_name, full_path, callback, location=None, fixity_result=None, file_stats=None):
     bitstream = SubElement(xip, 'xip:Bitstream')
     filename_element = SubElement(bitstream, "xip:Filename")
     filename_element.text = file_name
     filesize = SubElement(bitstream, "xip:FileSize")
-    file_stats = os.stat(full_path)
+    if file_stats is None:
+        file_stats = os.stat(full_path)
     filesize.text = str(file_stats.st_size)
     physical_location = SubElement(bitstream, "xip:PhysicalLocation")
     physical_location.text = location
     fixities = SubElement(bitstream, "xip:Fixities")
-    fixity_result = callback(file_name, full_path)
-    if type(fixity_result) == tuple:
+    if fixity_result is None:
+        fixity_result = callback(file_name, full_path)
+    if isinstance(fixity_result, tuple):
         fixity = SubElement(fixities, "xip:Fixity")
         fixity_algorithm_ref = SubElement(fixity, "xip:FixityAlgorithmRef")
         fixity_value = SubElement(fixity, "xip:FixityValue")
         fixity_algorithm_ref.text = fixity_result[0]
         fixity_value.text = fixity_result[1]
-    elif type(fixity_result) == dict:
+    elif isinstance(fixity_result, dict):
         for key, val in fixity_result.items():
             fixity = SubElement(fixities, "xip:Fixity")
             fixity_algorithm_ref = SubElement(fixity, "xip:FixityAlgorithmRef")
@@ -208,6 +287,144 @@ def __make_bitstream__(xip, file_name, full_path, callback, location=None):
         raise RuntimeError("Could Not Find Fixity Value")
 
 
+def __measure_fixity__(files, workers=None):
+    """
+    Stat the package files and measure their fixity, several files at a time
+
+    hashlib releases the GIL while hashing, so the files are read and hashed in parallel.
+    The stat results are returned so the files are only stat'ed once, which matters on network file systems.
+
+    :param files: list of (source path, fixity callback) tuples
+    :param workers: The number of files to hash at the same time. By default FIXITY_WORKERS if all the callbacks
+                    are library callbacks, otherwise the files are hashed one after another
+    :return: list of (os.stat_result, fixity callback result) tuples in the same order as files
+    """
+    def measure(paths):
+        src_file, callback = paths
+        return os.stat(src_file), callback(os.path.basename(src_file), src_file)
+
+    if workers is None:
+        thread_safe = all(type(callback) in _THREAD_SAFE_CALLBACKS for _, callback in files)
+        workers = FIXITY_WORKERS if thread_safe else 1
+    if workers <= 1 or len(files) <= 1:
+        return [measure(paths) for paths in files]
+    with ThreadPoolExecutor(max_workers=min(workers, len(files))) as executor:
+        return list(executor.map(measure, files))
+
+
+def __set_compress_level__(zinfo):
+    """
+    Set the deflate level of a zip entry which is written through ZipFile.open(zinfo)
+
+    The compresslevel given to ZipFile only applies to entries added by name, an entry opened from a ZipInfo
+    takes its level from the ZipInfo. ZipInfo.compress_level is public from Python 3.13, older versions
+    only have the private _compresslevel slot, which 3.13 keeps as an alias.
+    """
+    if hasattr(zipfile.ZipInfo, "compress_level"):
+        zinfo.compress_level = ZIP_COMPRESS_LEVEL
+    else:
+        zinfo._compresslevel = ZIP_COMPRESS_LEVEL
+
+
+def __check_unique_names__(arcnames):
+    """
+    Raise a RuntimeError if two package files would be written to the same zip entry
+
+    The XIP document would reference one file twice and the other file would be missing from the package.
+    """
+    seen = set()
+    for arcname in arcnames:
+        if arcname in seen:
+            logger.error(f"Duplicate file name in package {arcname}")
+            raise RuntimeError(arcname, "Duplicate file name in package")
+        seen.add(arcname)
+
+
+def __zip_folder__(zf, arcname, date_time):
+    """
+    Add a folder entry to the package zip
+    """
+    zinfo = zipfile.ZipInfo(arcname, date_time)
+    zinfo.external_attr = (0o40755 << 16) | 0x10
+    zf.writestr(zinfo, b"")
+
+
+def __zip_file__(zf, src_file, arcname, file_stats, compression, callback=None):
+    """
+    Stream a file into the package zip, files which are already compressed are always stored
+
+    If the fixity callback is one of the library hashlib callbacks the file is hashed as it is written and its
+    fixity is returned, so the file is not read from disk a second time. Otherwise None is returned and the
+    callback is called as usual, this includes subclasses of the library callbacks which may override __call__.
+    """
+    zinfo = zipfile.ZipInfo(arcname, datetime.fromtimestamp(file_stats.st_mtime).timetuple()[:6])
+    zinfo.external_attr = (file_stats.st_mode & 0xFFFF) << 16
+    zinfo.file_size = file_stats.st_size
+    if os.path.splitext(src_file)[1].lower() in COMPRESSED_EXTENSIONS:
+        zinfo.compress_type = zipfile.ZIP_STORED
+    else:
+        zinfo.compress_type = compression
+        __set_compress_level__(zinfo)
+    algorithms = None
+    if type(callback) in _THREAD_SAFE_CALLBACKS and hasattr(callback, "from_digests"):
+        algorithms = getattr(callback, "hash_algorithms", None) or (callback.hash_algorithm,)
+    with open(src_file, "rb") as src, zf.open(zinfo, "w") as dst:
+        if not algorithms:
+            shutil.copyfileobj(src, dst, ZIP_BUFFER_SIZE)
+            return None
+        with HashingFileWrapper(src, algorithms) as reader:
+            shutil.copyfileobj(reader, dst, ZIP_BUFFER_SIZE)
+            return callback.from_digests(reader.digests())
+
+
+def __write_package__(zip_path, io_ref, xip, content_files, compress):
+    """
+    Write the package zip straight from the source files without copying them into a staging folder first
+
+    The files are not hashed while they are written. The XIP document needs their fixity first, and that is
+    measured beforehand by __measure_fixity__, several files at a time. Only multi_asset_package hashes each
+    file as it is zipped.
+
+    :param zip_path: The path of the zip file
+    :param io_ref: The reference of the asset, used as the top level folder of the package
+    :param xip: The XIP document written as metadata.xml
+    :param content_files: list of (source path, location, os.stat_result) tuples, location is the folder below content
+    :param compress: Bool, compress the package
+    :raises RuntimeError: if two files in the same representation have the same file name
+    """
+    arcnames = [f"{io_ref}/{CONTENT_FOLDER}/{location}/{os.path.basename(src_file)}"
+                for src_file, location, _ in content_files]
+    __check_unique_names__(arcnames)
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    date_time = datetime.now().timetuple()[:6]
+    folders = [f"{io_ref}/", f"{io_ref}/{CONTENT_FOLDER}/"]
+    folders.extend(sorted({f"{io_ref}/{CONTENT_FOLDER}/{location}/" for _, location, _ in content_files}))
+    with zipfile.ZipFile(zip_path, "w", compression=compression, allowZip64=True,
+                         compresslevel=ZIP_COMPRESS_LEVEL) as zf:
+        for folder in folders:
+            __zip_folder__(zf, folder, date_time)
+        for (src_file, _, file_stats), arcname in zip(content_files, arcnames):
+            __zip_file__(zf, src_file, arcname, file_stats, compression)
+        zinfo = zipfile.ZipInfo(f"{io_ref}/metadata.xml", date_time)
+        zinfo.external_attr = 0o100644 << 16
+        zinfo.compress_type = compression
+        __set_compress_level__(zinfo)
+        xml.etree.ElementTree.indent(xip, space="  ")
+        # serialise the XIP document straight into the zip entry rather than building the whole document in memory
+        with zf.open(zinfo, "w") as dst, io.TextIOWrapper(dst, encoding="utf-8", errors="xmlcharrefreplace",
+                                                          newline="\n") as metadata:
+            metadata.write("<?xml version='1.0' encoding='utf-8'?>\n")
+            xml.etree.ElementTree.ElementTree(xip).write(metadata, encoding="unicode")
+
+
+def __new_refs__(count):
+    """
+    Return a list of new random (version 4) UUID references, reading the random bytes with a single os.urandom call
+    """
+    random_bytes = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=random_bytes[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
 def __make_representation_multiple_co__(xip, rep_name, rep_type, rep_files, io_ref):
     representation = SubElement(xip, 'xip:Representation')
     io_link = SubElement(representation, 'xip:InformationObject')
@@ -218,9 +435,8 @@ def __make_representation_multiple_co__(xip, rep_name, rep_type, rep_files, io_r
     access_type.text = rep_type
     content_objects = SubElement(representation, 'xip:ContentObjects')
     refs_dict = {}
-    for f in rep_files:
+    for f, content_object_ref in zip(rep_files, __new_refs__(len(rep_files))):
         content_object = SubElement(content_objects, 'xip:ContentObject')
-        content_object_ref = str(uuid.uuid4())
         content_object.text = content_object_ref
         refs_dict[content_object_ref] = f
     return refs_dict
@@ -241,16 +457,9 @@ def csv_to_cmis_xslt(csv_file, xml_namespace, root_element, title="Metadata Titl
             Create a custom CMIS transform to display metadata within UA.
 
     """
-    headers = set()
-    with open(csv_file, encoding='utf-8-sig', newline='') as csvfile:
+    with open(csv_file, buffering=CSV_BUFFER_SIZE, encoding='utf-8-sig', newline='') as csvfile:
         reader = csv.reader(csvfile)
-        for row in reader:
-            for header in row:
-                xml_tag = header.strip()
-                xml_tag = xml_tag.replace(" ", "")
-                xml_tag = xml_tag.replace("-", "")
-                headers.add(xml_tag)
-            break
+        headers = {header.strip().translate(XML_TAG_TRANSLATION) for header in next(reader, [])}
 
     namespaces = {"version": "2.0", "xmlns:xsl": "http://www.w3.org/1999/XSL/Transform",
                   "xmlns:fn": "http://www.w3.org/2005/xpath-functions", "xmlns:xs": "http://www.w3.org/2001/XMLSchema",
@@ -298,13 +507,10 @@ def csv_to_cmis_xslt(csv_file, xml_namespace, root_element, title="Metadata Titl
     xml_type_value = xml.etree.ElementTree.SubElement(xml_type, "xsl:value-of", {
         "select": "fn:replace(translate(local-name(), '_', ' '), '([a-z])([A-Z])', '$1 $2')"})
 
-    xml_request = xml.etree.ElementTree.tostring(xml_stylesheet, encoding='utf-8', xml_declaration=True)
     cmis_xslt = root_element + "-cmis.xslt"
     if export_folder is not None:
         cmis_xslt = os.path.join(export_folder, cmis_xslt)
-    file = open(cmis_xslt, "wt", encoding="utf-8")
-    file.write(xml_request.decode("utf-8"))
-    file.close()
+    xml.etree.ElementTree.ElementTree(xml_stylesheet).write(cmis_xslt, encoding='utf-8', xml_declaration=True)
     return cmis_xslt
 
 
@@ -319,16 +525,9 @@ def csv_to_xsd(csv_file, xml_namespace, root_element, export_folder=None, additi
         Create a XSD definition based on the csv file
 
     """
-    headers = set()
-    with open(csv_file, encoding='utf-8-sig', newline='') as csvfile:
+    with open(csv_file, buffering=CSV_BUFFER_SIZE, encoding='utf-8-sig', newline='') as csvfile:
         reader = csv.reader(csvfile)
-        for row in reader:
-            for header in row:
-                xml_tag = header.strip()
-                xml_tag = xml_tag.replace(" ", "")
-                xml_tag = xml_tag.replace("-", "")
-                headers.add(xml_tag)
-            break
+        headers = {header.strip().translate(XML_TAG_TRANSLATION) for header in next(reader, [])}
 
     namespaces = {"xmlns:xs": "http://www.w3.org/2001/XMLSchema", "attributeFormDefault": "unqualified",
                   "elementFormDefault": "qualified",
@@ -360,14 +559,10 @@ def csv_to_xsd(csv_file, xml_namespace, root_element, export_folder=None, additi
         else:
             xml.etree.ElementTree.SubElement(xml_sequence, "xs:element", {"type": "xs:string", "name": header})
 
-    xml_request = xml.etree.ElementTree.tostring(xml_schema, encoding='utf-8', xml_declaration=True)
-
     xsd_file = root_element + ".xsd"
     if export_folder is not None:
         xsd_file = os.path.join(export_folder, xsd_file)
-    file = open(xsd_file, "wt", encoding="utf-8")
-    file.write(xml_request.decode("utf-8"))
-    file.close()
+    xml.etree.ElementTree.ElementTree(xml_schema).write(xsd_file, encoding='utf-8', xml_declaration=True)
     return xsd_file
 
 
@@ -378,16 +573,9 @@ def csv_to_search_xml(csv_file, xml_namespace, root_element, title="Metadata Tit
         Create a custom Preservica search index based on the columns in a csv file
 
     """
-    headers = set()
-    with open(csv_file, encoding='utf-8-sig', newline='') as csvfile:
+    with open(csv_file, buffering=CSV_BUFFER_SIZE, encoding='utf-8-sig', newline='') as csvfile:
         reader = csv.reader(csvfile)
-        for row in reader:
-            for header in row:
-                xml_tag = header.strip()
-                xml_tag = xml_tag.replace(" ", "")
-                xml_tag = xml_tag.replace("-", "")
-                headers.add(xml_tag)
-            break
+        headers = {header.strip().translate(XML_TAG_TRANSLATION) for header in next(reader, [])}
 
     xml_index = xml.etree.ElementTree.Element("index", {"xmlns": "http://www.preservica.com/customindex/v1"})
 
@@ -413,13 +601,10 @@ def csv_to_search_xml(csv_file, xml_namespace, root_element, title="Metadata Tit
         for prefix, uri in additional_namespaces.items():
             xml.etree.ElementTree.SubElement(xml_index, "namespaceMapping", {"key": prefix, "value": uri})
 
-    xml_request = xml.etree.ElementTree.tostring(xml_index, encoding='utf-8', xml_declaration=True)
     search_xml = root_element + "-index.xml"
     if export_folder is not None:
         search_xml = os.path.join(export_folder, search_xml)
-    file = open(search_xml, "wt", encoding="utf-8")
-    file.write(xml_request.decode("utf-8"))
-    file.close()
+    xml.etree.ElementTree.ElementTree(xml_index).write(search_xml, encoding='utf-8', xml_declaration=True)
     return search_xml
 
 def cvs_to_xml(csv_file, xml_namespace, root_element, file_name_column="filename", export_folder=None,
@@ -443,42 +628,37 @@ def csv_to_xml(csv_file, xml_namespace, root_element, file_name_column="filename
         :param dict additional_namespaces: A map of prefix, uris to use as additional namespaces
 
     """
-    headers = list()
     link_column_id = 0
-    with open(csv_file, encoding='utf-8-sig', newline='') as csvfile:
+    with open(csv_file, buffering=CSV_BUFFER_SIZE, encoding='utf-8-sig', newline='') as csvfile:
         reader = csv.reader(csvfile)
-        for row in reader:
-            col_id = 0
-            for header in row:
-                col_id += 1
-                if header == file_name_column:
-                    link_column_id = col_id
-                xml_tag = header.strip()
-                xml_tag = xml_tag.replace(" ", "")
-                xml_tag = xml_tag.replace("-", "")
-                headers.append(xml_tag)
-            break
+        header_row = next(reader, [])
+        for col_id, header in enumerate(header_row, start=1):
+            if header == file_name_column:
+                link_column_id = col_id
+        headers = [header.strip().translate(XML_TAG_TRANSLATION) for header in header_row]
         if link_column_id > 0:
             namespaces = {"xmlns": xml_namespace}
             if additional_namespaces is not None:
                 for prefix, uri in additional_namespaces.items():
                     namespaces["xmlns:" + prefix] = uri
+            # the documents all have the same shape, so serialise the root start tag once with ElementTree
+            # and write the column elements straight from the row values, escaped the way ElementTree does it
+            root_tag = xml.etree.ElementTree.tostring(xml.etree.ElementTree.Element(root_element, namespaces),
+                                                      encoding="unicode")
+            document_start = "<?xml version='1.0' encoding='utf-8'?>\n" + root_tag[:-len(" />")] + ">"
+            document_end = f"</{root_element}>"
+            columns = [(f"<{header}>", f"</{header}>", f"<{header} />") for header in headers]
             for row in reader:
-                col_id = 0
-                xml_object = xml.etree.ElementTree.Element(root_element, namespaces)
-                for value, header in zip(row, headers):
-                    col_id += 1
-                    xml.etree.ElementTree.SubElement(xml_object, header).text = value
-                    if col_id == link_column_id:
-                        file_name = value
-                xml_request = xml.etree.ElementTree.tostring(xml_object, encoding='utf-8', xml_declaration=True)
+                if len(row) >= link_column_id:
+                    file_name = row[link_column_id - 1]
                 name = file_name + ".xml"
                 name = sanitize(name)
                 if export_folder is not None:
                     name = os.path.join(export_folder, name)
-                file = open(name, "wt", encoding="utf-8")
-                file.write(xml_request.decode("utf-8"))
-                file.close()
+                elements = [f"{start}{value.translate(XML_TEXT_ESCAPE)}{end}" if value else empty
+                            for value, (start, end, empty) in zip(row, columns)]
+                with open(name, "w", encoding="utf-8", errors="xmlcharrefreplace") as xml_file:
+                    xml_file.write(document_start + "".join(elements) + document_end)
                 yield name
 
 
@@ -503,9 +683,7 @@ def generic_asset_package(preservation_files_dict=None, access_files_dict=None,
 
     security_tag = kwargs.get('SecurityTag', "open")
     content_type = kwargs.get('CustomType', "")
-
-    if not compress:
-        shutil.register_archive_format(name="szip", function=_make_stored_zipfile, extra_args=None, description="UnCompressed ZIP file")
+    fixity_workers = kwargs.get('Fixity_Workers')
 
     has_preservation_files = bool((preservation_files_dict is not None) and (len(preservation_files_dict) > 0))
     has_access_files = bool((access_files_dict is not None) and (len(access_files_dict) > 0))
@@ -546,63 +724,8 @@ def generic_asset_package(preservation_files_dict=None, access_files_dict=None,
                                                                    rep_files=access_files_list, io_ref=io_ref)
             access_representation_refs_dict[representation_name] = access_refs_dict
 
-    if has_preservation_files:
-        for representation_name in preservation_representation_refs_dict.keys():
-            preservation_refs_dict = preservation_representation_refs_dict[representation_name]
-            for content_ref, filename in preservation_refs_dict.items():
-                default_content_objects_title = os.path.splitext(os.path.basename(filename))[0]
-
-                preservation_content_title = kwargs.get('Preservation_Content_Title', default_content_objects_title)
-                preservation_content_description = kwargs.get('Preservation_Content_Description',
-                                                              default_content_objects_title)
-
-                if isinstance(preservation_content_title, dict):
-                    preservation_content_title = preservation_content_title.get("filename",
-                                                                                default_content_objects_title)
-
-                if isinstance(preservation_content_description, dict):
-                    preservation_content_description = preservation_content_description.get("filename",
-                                                                                            default_content_objects_title)
-
-                __make_content_objects__(xip, preservation_content_title, content_ref, io_ref, security_tag,
-                                         preservation_content_description, content_type)
-
-    if has_access_files:
-        for representation_name in access_representation_refs_dict.keys():
-            access_refs_dict = access_representation_refs_dict[representation_name]
-            for content_ref, filename in access_refs_dict.items():
-                default_content_objects_title = os.path.splitext(os.path.basename(filename))[0]
-
-                access_content_title = kwargs.get('Access_Content_Title', default_content_objects_title)
-                access_content_description = kwargs.get('Access_Content_Description', default_content_objects_title)
-
-                if isinstance(access_content_title, dict):
-                    access_content_title = access_content_title.get("filename", default_content_objects_title)
-
-                if isinstance(access_content_description, dict):
-                    access_content_description = access_content_title.get("filename", default_content_objects_title)
-
-                __make_content_objects__(xip, access_content_title, content_ref, io_ref, security_tag,
-                                         access_content_description,
-                                         content_type)
-
-    if has_preservation_files:
-        for representation_name in preservation_representation_refs_dict.keys():
-            location = sanitize(representation_name)
-            preservation_refs_dict = preservation_representation_refs_dict[representation_name]
-            preservation_generation_label = kwargs.get('Preservation_Generation_Label', "")
-            for content_ref, filename in preservation_refs_dict.items():
-                preservation_file_name = os.path.basename(filename)
-                __make_generation__(xip, preservation_file_name, content_ref, preservation_generation_label, location)
-
-    if has_access_files:
-        for representation_name in access_representation_refs_dict.keys():
-            location = sanitize(representation_name)
-            access_refs_dict = access_representation_refs_dict[representation_name]
-            access_generation_label = kwargs.get('Access_Generation_Label', "")
-            for content_ref, filename in access_refs_dict.items():
-                access_file_name = os.path.basename(filename)
-                __make_generation__(xip, access_file_name, content_ref, access_generation_label, location)
+    # one entry per content object, the ContentObject, Generation and Bitstream elements are written in this order
+    content_files = []
 
     if has_preservation_files:
 
@@ -610,12 +733,11 @@ def generic_asset_package(preservation_files_dict=None, access_files_dict=None,
             callback = kwargs.get('Preservation_files_fixity_callback')
         else:
             callback = Sha1FixityCallBack()
-        for representation_name in preservation_representation_refs_dict.keys():
+        for representation_name, preservation_refs_dict in preservation_representation_refs_dict.items():
             location = sanitize(representation_name)
-            preservation_refs_dict = preservation_representation_refs_dict[representation_name]
             for content_ref, filename in preservation_refs_dict.items():
-                preservation_file_name = os.path.basename(filename)
-                __make_bitstream__(xip, preservation_file_name, filename, callback, location)
+                content_files.append(("Preservation", content_ref, filename, os.path.basename(filename), location,
+                                      callback))
 
     if has_access_files:
 
@@ -623,13 +745,40 @@ def generic_asset_package(preservation_files_dict=None, access_files_dict=None,
             callback = kwargs.get('Access_files_fixity_callback')
         else:
             callback = Sha1FixityCallBack()
-
-        for representation_name in access_representation_refs_dict.keys():
+        for representation_name, access_refs_dict in access_representation_refs_dict.items():
             location = sanitize(representation_name)
-            access_refs_dict = access_representation_refs_dict[representation_name]
             for content_ref, filename in access_refs_dict.items():
-                access_file_name = os.path.basename(filename)
-                __make_bitstream__(xip, access_file_name, filename, callback, location)
+                content_files.append(("Access", content_ref, filename, os.path.basename(filename), location, callback))
+
+    # the title, description and generation label options of each kind, looked up once for all the content objects
+    content_options = {kind: (kwargs.get(f'{kind}_Content_Title'), kwargs.get(f'{kind}_Content_Description'),
+                              kwargs.get(f'{kind}_Generation_Label', "")) for kind in ("Preservation", "Access")}
+
+    for kind, content_ref, filename, file_name, location, callback in content_files:
+        default_content_objects_title = os.path.splitext(file_name)[0]
+        content_title, content_description, _ = content_options[kind]
+
+        if content_title is None:
+            content_title = default_content_objects_title
+        elif isinstance(content_title, dict):
+            content_title = content_title.get("filename", default_content_objects_title)
+
+        if content_description is None:
+            content_description = default_content_objects_title
+        elif isinstance(content_description, dict):
+            content_description = content_description.get("filename", default_content_objects_title)
+
+        __make_content_objects__(xip, content_title, content_ref, io_ref, security_tag, content_description,
+                                 content_type)
+
+    for kind, content_ref, filename, file_name, location, callback in content_files:
+        __make_generation__(xip, file_name, content_ref, content_options[kind][2], location)
+
+    # hash the preservation and access files in one pool, the bitstreams keep the original order
+    fixity_results = __measure_fixity__([(entry[2], entry[5]) for entry in content_files], fixity_workers)
+    for (kind, content_ref, filename, file_name, location, callback), (file_stats, fixity_result) in zip(
+            content_files, fixity_results):
+        __make_bitstream__(xip, file_name, filename, callback, location, fixity_result, file_stats)
 
     if 'Identifiers' in kwargs:
         identifier_map = kwargs.get('Identifiers')
@@ -650,7 +799,7 @@ def generic_asset_package(preservation_files_dict=None, access_files_dict=None,
             if metadata_ns:
                 if metadata_path:
                     if os.path.exists(metadata_path) and os.path.isfile(metadata_path):
-                        descriptive_metadata = xml.etree.ElementTree.parse(source=metadata_path)
+                        descriptive_metadata = _parse_metadata(source=metadata_path)
                         metadata = SubElement(xip, 'xip:Metadata', {'schemaUri': metadata_ns})
                         metadata_ref = SubElement(metadata, 'xip:Ref')
                         metadata_ref.text = str(uuid.uuid4())
@@ -660,7 +809,7 @@ def generic_asset_package(preservation_files_dict=None, access_files_dict=None,
                         content.append(descriptive_metadata.getroot())
                     elif isinstance(metadata_path, str):
                         try:
-                            descriptive_metadata = xml.etree.ElementTree.fromstring(metadata_path)
+                            descriptive_metadata = _metadata_fromstring(metadata_path)
                             metadata = SubElement(xip, 'xip:Metadata', {'schemaUri': metadata_ns})
                             metadata_ref = SubElement(metadata, 'xip:Ref')
                             metadata_ref.text = str(uuid.uuid4())
@@ -672,39 +821,10 @@ def generic_asset_package(preservation_files_dict=None, access_files_dict=None,
                             logging.info(f"Could not parse asset metadata in namespace {metadata_ns}")
 
     if xip is not None:
-        export_folder = export_folder
-        top_level_folder = os.path.join(export_folder, io_ref)
-        os.mkdir(top_level_folder)
-        inner_folder = os.path.join(top_level_folder, io_ref)
-        os.mkdir(inner_folder)
-        content_folder = os.path.join(inner_folder, CONTENT_FOLDER)
-        os.mkdir(content_folder)
-        metadata_path = os.path.join(inner_folder, "metadata.xml")
-        metadata = open(metadata_path, "wt", encoding='utf-8')
-        metadata.write(prettify(xip))
-        metadata.close()
-        for representation_name in preservation_representation_refs_dict.keys():
-            location = sanitize(representation_name)
-            Path(os.path.join(content_folder, location)).mkdir(parents=True, exist_ok=True)
-            preservation_refs_dict = preservation_representation_refs_dict[representation_name]
-            for content_ref, filename in preservation_refs_dict.items():
-                src_file = filename
-                dst_file = os.path.join(os.path.join(content_folder, location), os.path.basename(filename))
-                shutil.copyfile(src_file, dst_file)
-        for representation_name in access_representation_refs_dict.keys():
-            location = sanitize(representation_name)
-            Path(os.path.join(content_folder, location)).mkdir(parents=True, exist_ok=True)
-            access_refs_dict = access_representation_refs_dict[representation_name]
-            for content_ref, filename in access_refs_dict.items():
-                src_file = filename
-                dst_file = os.path.join(os.path.join(content_folder, location), os.path.basename(filename))
-                shutil.copyfile(src_file, dst_file)
-        if compress:
-            shutil.make_archive(top_level_folder, 'zip', top_level_folder)
-        else:
-            shutil.make_archive(top_level_folder, 'szip', top_level_folder)
-        shutil.rmtree(top_level_folder)
-        return top_level_folder + ".zip"
+        zip_path = os.path.join(export_folder, io_ref) + ".zip"
+        __write_package__(zip_path, io_ref, xip, [(entry[2], entry[4], file_stats) for entry, (file_stats, _) in
+                                                  zip(content_files, fixity_results)], compress)
+        return zip_path
 
 
 def multi_asset_package(asset_file_list=None, export_folder=None, parent_folder=None, compress=True, **kwargs):
@@ -732,126 +852,135 @@ def multi_asset_package(asset_file_list=None, export_folder=None, parent_folder=
 
     security_tag = kwargs.get('SecurityTag', "open")
     content_type = kwargs.get('CustomType', "")
-
-    if not compress:
-        shutil.register_archive_format("szip", _make_stored_zipfile, None, "UnCompressed ZIP file")
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
 
     if 'Preservation_files_fixity_callback' in kwargs:
         fixity_callback = kwargs.get('Preservation_files_fixity_callback')
     else:
         fixity_callback = Sha1FixityCallBack()
 
+    # all the content files are written to the same folder
+    __check_unique_names__(os.path.basename(file) for file in asset_file_list)
+
     package_id = str(uuid.uuid4())
-    export_folder = export_folder
-    top_level_folder = os.path.join(export_folder, package_id)
-    os.mkdir(top_level_folder)
-    inner_folder = os.path.join(top_level_folder, package_id)
-    os.mkdir(inner_folder)
-    os.mkdir(os.path.join(inner_folder, CONTENT_FOLDER))
+    zip_path = os.path.join(export_folder, package_id) + ".zip"
+    date_time = datetime.now().timetuple()[:6]
 
     asset_map = dict()
-    xip = Element('xip:XIP')
-    xip.set('xmlns:xip', 'http://preservica.com/XIP/v6.0')
-    for file in asset_file_list:
-        default_asset_title = os.path.splitext(os.path.basename(file))[0]
-        xip, io_ref = __create_io__(xip, file_name=default_asset_title, parent_folder=parent_folder, **kwargs)
-        asset_map[file] = io_ref
-        representation = SubElement(xip, 'xip:Representation')
-        io_link = SubElement(representation, 'xip:InformationObject')
-        io_link.text = io_ref
-        access_name = SubElement(representation, 'xip:Name')
-        access_name.text = "Preservation"
-        access_type = SubElement(representation, 'xip:Type')
-        access_type.text = "Preservation"
-        content_objects = SubElement(representation, 'xip:ContentObjects')
-        content_object = SubElement(content_objects, 'xip:ContentObject')
-        content_object_ref = str(uuid.uuid4())
-        content_object.text = content_object_ref
-
-        default_content_objects_title = os.path.splitext(os.path.basename(file))[0]
-        content_object = SubElement(xip, 'xip:ContentObject')
-        ref_element = SubElement(content_object, "xip:Ref")
-        ref_element.text = content_object_ref
-        title = SubElement(content_object, "xip:Title")
-        title.text = default_content_objects_title
-        description = SubElement(content_object, "xip:Description")
-        description.text = default_content_objects_title
-        security_tag_element = SubElement(content_object, "xip:SecurityTag")
-        security_tag_element.text = security_tag
-        custom_type = SubElement(content_object, "xip:CustomType")
-        custom_type.text = content_type
-        parent = SubElement(content_object, "xip:Parent")
-        parent.text = io_ref
-
-        generation = SubElement(xip, 'xip:Generation', {"original": "true", "active": "true"})
-        content_object = SubElement(generation, "xip:ContentObject")
-        content_object.text = content_object_ref
-        label = SubElement(generation, "xip:Label")
-        label.text = os.path.splitext(os.path.basename(file))[0]
-        effective_date = SubElement(generation, "xip:EffectiveDate")
-        effective_date.text = datetime.now().isoformat()
-        bitstreams = SubElement(generation, "xip:Bitstreams")
-        bitstream = SubElement(bitstreams, "xip:Bitstream")
-        bitstream.text = os.path.basename(file)
-        SubElement(generation, "xip:Formats")
-        SubElement(generation, "xip:Properties")
-
-        bitstream = SubElement(xip, 'xip:Bitstream')
-        filename_element = SubElement(bitstream, "xip:Filename")
-        filename_element.text = os.path.basename(file)
-        filesize = SubElement(bitstream, "xip:FileSize")
-        file_stats = os.stat(file)
-        filesize.text = str(file_stats.st_size)
-        physical_location = SubElement(bitstream, "xip:PhysicalLocation")
-        fixities = SubElement(bitstream, "xip:Fixities")
-        fixity_result = fixity_callback(filename_element.text, file)
-        if type(fixity_result) == tuple:
-            fixity = SubElement(fixities, "xip:Fixity")
-            fixity_algorithm_ref = SubElement(fixity, "xip:FixityAlgorithmRef")
-            fixity_value = SubElement(fixity, "xip:FixityValue")
-            fixity_algorithm_ref.text = fixity_result[0]
-            fixity_value.text = fixity_result[1]
-        elif type(fixity_result) == dict:
-            for key, val in fixity_result.items():
+    # the content files are streamed straight into the zip and each asset is written out to metadata.xml as soon
+    # as it is complete, so only one asset is held in memory at a time
+    metadata_path = os.path.join(export_folder, package_id + ".xml")
+    with zipfile.ZipFile(zip_path, "w", compression=compression, allowZip64=True,
+                         compresslevel=ZIP_COMPRESS_LEVEL) as zf, \
+            open(metadata_path, "wt", buffering=XML_BUFFER_SIZE, encoding="utf-8",
+                 errors="xmlcharrefreplace") as metadata:
+        __zip_folder__(zf, f"{package_id}/", date_time)
+        __zip_folder__(zf, f"{package_id}/{CONTENT_FOLDER}/", date_time)
+        metadata.write("<?xml version='1.0' encoding='utf-8'?>\n")
+        metadata.write('<xip:XIP xmlns:xip="http://preservica.com/XIP/v6.0">\n')
+        for file, new_io_ref, content_object_ref in zip(asset_file_list, __new_refs__(len(asset_file_list)),
+                                                         __new_refs__(len(asset_file_list))):
+            file_name = os.path.basename(file)
+            default_asset_title = os.path.splitext(file_name)[0]
+            xip, io_ref = __create_io__(file_name=default_asset_title, parent_folder=parent_folder, io_ref=new_io_ref,
+                                        **kwargs)
+            asset_map[file] = io_ref
+            representation = SubElement(xip, 'xip:Representation')
+            io_link = SubElement(representation, 'xip:InformationObject')
+            io_link.text = io_ref
+            access_name = SubElement(representation, 'xip:Name')
+            access_name.text = "Preservation"
+            access_type = SubElement(representation, 'xip:Type')
+            access_type.text = "Preservation"
+            content_objects = SubElement(representation, 'xip:ContentObjects')
+            content_object = SubElement(content_objects, 'xip:ContentObject')
+            content_object.text = content_object_ref
+
+            default_content_objects_title = default_asset_title
+            content_object = SubElement(xip, 'xip:ContentObject')
+            ref_element = SubElement(content_object, "xip:Ref")
+            ref_element.text = content_object_ref
+            title = SubElement(content_object, "xip:Title")
+            title.text = default_content_objects_title
+            description = SubElement(content_object, "xip:Description")
+            description.text = default_content_objects_title
+            security_tag_element = SubElement(content_object, "xip:SecurityTag")
+            security_tag_element.text = security_tag
+            custom_type = SubElement(content_object, "xip:CustomType")
+            custom_type.text = content_type
+            parent = SubElement(content_object, "xip:Parent")
+            parent.text = io_ref
+
+            generation = SubElement(xip, 'xip:Generation', {"original": "true", "active": "true"})
+            content_object = SubElement(generation, "xip:ContentObject")
+            content_object.text = content_object_ref
+            label = SubElement(generation, "xip:Label")
+            label.text = default_asset_title
+            effective_date = SubElement(generation, "xip:EffectiveDate")
+            effective_date.text = datetime.now().isoformat()
+            bitstreams = SubElement(generation, "xip:Bitstreams")
+            bitstream = SubElement(bitstreams, "xip:Bitstream")
+            bitstream.text = file_name
+            SubElement(generation, "xip:Formats")
+            SubElement(generation, "xip:Properties")
+
+            file_stats = os.stat(file)
+            fixity_result = __zip_file__(zf, file, f"{package_id}/{CONTENT_FOLDER}/{file_name}", file_stats,
+                                         compression, fixity_callback)
+
+            bitstream = SubElement(xip, 'xip:Bitstream')
+            filename_element = SubElement(bitstream, "xip:Filename")
+            filename_element.text = file_name
+            filesize = SubElement(bitstream, "xip:FileSize")
+            filesize.text = str(file_stats.st_size)
+            physical_location = SubElement(bitstream, "xip:PhysicalLocation")
+            fixities = SubElement(bitstream, "xip:Fixities")
+            if fixity_result is None:
+                fixity_result = fixity_callback(file_name, file)
+            if isinstance(fixity_result, tuple):
                 fixity = SubElement(fixities, "xip:Fixity")
                 fixity_algorithm_ref = SubElement(fixity, "xip:FixityAlgorithmRef")
                 fixity_value = SubElement(fixity, "xip:FixityValue")
-                fixity_algorithm_ref.text = key
-                fixity_value.text = val
-        else:
-            logger.error("Could Not Find Fixity Value")
-            raise RuntimeError("Could Not Find Fixity Value")
-
-        if 'Identifiers' in kwargs:
-            identifier_map = kwargs.get('Identifiers')
-            if str(file) in identifier_map:
-                identifier_map_values = identifier_map[str(file)]
-                for identifier_key, identifier_value in identifier_map_values.items():
-                    if identifier_key:
-                        if identifier_value:
-                            identifier = SubElement(xip, 'xip:Identifier')
-                            id_type = SubElement(identifier, "xip:Type")
-                            id_type.text = identifier_key
-                            id_value = SubElement(identifier, "xip:Value")
-                            id_value.text = identifier_value
-                            id_io = SubElement(identifier, "xip:Entity")
-                            id_io.text = io_ref
-
-        src_file = file
-        dst_file = os.path.join(os.path.join(inner_folder, CONTENT_FOLDER), os.path.basename(file))
-        shutil.copyfile(src_file, dst_file)
+                fixity_algorithm_ref.text = fixity_result[0]
+                fixity_value.text = fixity_result[1]
+            elif isinstance(fixity_result, dict):
+                for key, val in fixity_result.items():
+                    fixity = SubElement(fixities, "xip:Fixity")
+                    fixity_algorithm_ref = SubElement(fixity, "xip:FixityAlgorithmRef")
+                    fixity_value = SubElement(fixity, "xip:FixityValue")
+                    fixity_algorithm_ref.text = key
+                    fixity_value.text = val
+            else:
+                logger.error("Could Not Find Fixity Value")
+                raise RuntimeError("Could Not Find Fixity Value")
 
-    if xip is not None:
-        metadata_path = os.path.join(inner_folder, "metadata.xml")
-        metadata = open(metadata_path, "wt", encoding='utf-8')
-        metadata.write(prettify(xip))
+            if 'Identifiers' in kwargs:
+                identifier_map = kwargs.get('Identifiers')
+                if str(file) in identifier_map:
+                    identifier_map_values = identifier_map[str(file)]
+                    for identifier_key, identifier_value in identifier_map_values.items():
+                        if identifier_key:
+                            if identifier_value:
+                                identifier = SubElement(xip, 'xip:Identifier')
+                                id_type = SubElement(identifier, "xip:Type")
+                                id_type.text = identifier_key
+                                id_value = SubElement(identifier, "xip:Value")
+                                id_value.text = identifier_value
+                                id_io = SubElement(identifier, "xip:Entity")
+                                id_io.text = io_ref
+
+            _write_xip_elements(metadata, xip)
+        metadata.write("</xip:XIP>")
         metadata.close()
-        if compress:
-            shutil.make_archive(top_level_folder, 'zip', top_level_folder)
-        else:
-            shutil.make_archive(top_level_folder, 'szip', top_level_folder)
-        shutil.rmtree(top_level_folder)
-        return top_level_folder + ".zip"
+
+        zinfo = zipfile.ZipInfo(f"{package_id}/metadata.xml", date_time)
+        zinfo.external_attr = 0o100644 << 16
+        zinfo.compress_type = compression
+        __set_compress_level__(zinfo)
+        with open(metadata_path, "rb") as src, zf.open(zinfo, "w") as dst:
+            shutil.copyfileobj(src, dst, ZIP_BUFFER_SIZE)
+    os.remove(metadata_path)
+    return zip_path
 
 
 def complex_asset_package(preservation_files_list=None, access_files_list=None, export_folder=None, parent_folder=None,
@@ -925,9 +1054,6 @@ def complex_asset_package(preservation_files_list=None, access_files_list=None,
     security_tag = kwargs.get('SecurityTag', "open")
     content_type = kwargs.get('CustomType', "")
 
-    if not compress:
-        shutil.register_archive_format("szip", _make_stored_zipfile, None, "UnCompressed ZIP file")
-
     has_preservation_files = bool((preservation_files_list is not None) and (len(preservation_files_list) > 0))
     has_access_files = bool((access_files_list is not None) and (len(access_files_list) > 0))
 
@@ -964,79 +1090,57 @@ def complex_asset_package(preservation_files_list=None, access_files_list=None,
                                                                rep_files=access_files_list,
                                                                io_ref=io_ref)
 
-    if has_preservation_files:
-
-        for content_ref, filename in preservation_refs_dict.items():
-            default_content_objects_title = os.path.splitext(os.path.basename(filename))[0]
-            preservation_content_title = kwargs.get('Preservation_Content_Title', default_content_objects_title)
-            preservation_content_description = kwargs.get('Preservation_Content_Description',
-                                                          default_content_objects_title)
-
-            if isinstance(preservation_content_title, dict):
-                preservation_content_title = preservation_content_title[filename]
-
-            if isinstance(preservation_content_description, dict):
-                preservation_content_description = preservation_content_description[filename]
-
-            __make_content_objects__(xip, preservation_content_title, content_ref, io_ref, security_tag,
-                                     preservation_content_description,
-                                     content_type)
-
-    if has_access_files:
-
-        for content_ref, filename in access_refs_dict.items():
-            default_content_objects_title = os.path.splitext(os.path.basename(filename))[0]
-
-            access_content_title = kwargs.get('Access_Content_Title', default_content_objects_title)
-            access_content_description = kwargs.get('Access_Content_Description', default_content_objects_title)
+    # one entry per content object, each file name is parsed once for its ContentObject, Generation and Bitstream
+    content_files = []
 
-            if isinstance(access_content_title, dict):
-                access_content_title = access_content_title[filename]
+    for kind, refs_dict, location in (("Preservation", preservation_refs_dict, PRESERVATION_CONTENT_FOLDER),
+                                      ("Access", access_refs_dict, ACCESS_CONTENT_FOLDER)):
+        if not refs_dict:
+            continue
 
-            if isinstance(access_content_description, dict):
-                access_content_title = access_content_title[filename]
-
-            __make_content_objects__(xip, access_content_title, content_ref, io_ref, security_tag,
-                                     access_content_description, content_type)
-
-    if has_preservation_files:
-
-        preservation_generation_label = kwargs.get('Preservation_Generation_Label', "")
-
-        for content_ref, filename in preservation_refs_dict.items():
-            preservation_file_name = os.path.basename(filename)
-            __make_generation__(xip, preservation_file_name, content_ref, preservation_generation_label,
-                                PRESERVATION_CONTENT_FOLDER)
-
-    if has_access_files:
-
-        access_generation_label = kwargs.get('Access_Generation_Label', "")
-
-        for content_ref, filename in access_refs_dict.items():
-            access_file_name = os.path.basename(filename)
-            __make_generation__(xip, access_file_name, content_ref, access_generation_label, ACCESS_CONTENT_FOLDER)
-
-    if has_preservation_files:
-
-        if 'Preservation_files_fixity_callback' in kwargs:
-            callback = kwargs.get('Preservation_files_fixity_callback')
+        if f'{kind}_files_fixity_callback' in kwargs:
+            callback = kwargs.get(f'{kind}_files_fixity_callback')
         else:
             callback = Sha1FixityCallBack()
+        content_title_option = kwargs.get(f'{kind}_Content_Title')
+        content_description_option = kwargs.get(f'{kind}_Content_Description')
+        generation_label = kwargs.get(f'{kind}_Generation_Label', "")
+
+        for content_ref, filename in refs_dict.items():
+            file_name = os.path.basename(filename)
+            default_content_objects_title = os.path.splitext(file_name)[0]
+
+            if content_title_option is None:
+                content_title = default_content_objects_title
+            elif isinstance(content_title_option, dict):
+                content_title = content_title_option[filename]
+            else:
+                content_title = content_title_option
 
-        for content_ref, filename in preservation_refs_dict.items():
-            preservation_file_name = os.path.basename(filename)
-            __make_bitstream__(xip, preservation_file_name, filename, callback, PRESERVATION_CONTENT_FOLDER)
+            if content_description_option is None:
+                content_description = default_content_objects_title
+            elif isinstance(content_description_option, dict):
+                content_description = content_description_option[filename]
+            else:
+                content_description = content_description_option
 
-    if has_access_files:
+            content_files.append((content_ref, filename, file_name, location, callback, content_title,
+                                  content_description, generation_label))
 
-        if 'Access_files_fixity_callback' in kwargs:
-            callback = kwargs.get('Access_files_fixity_callback')
-        else:
-            callback = Sha1FixityCallBack()
+    # the XIP schema wants all the ContentObjects, then the Generations, then the Bitstreams
+    for content_ref, _, _, _, _, content_title, content_description, _ in content_files:
+        __make_content_objects__(xip, content_title, content_ref, io_ref, security_tag, content_description,
+                                 content_type)
 
-        for content_ref, filename in access_refs_dict.items():
-            access_file_name = os.path.basename(filename)
-            __make_bitstream__(xip, access_file_name, filename, callback, ACCESS_CONTENT_FOLDER)
+    for content_ref, _, file_name, location, _, _, _, generation_label in content_files:
+        __make_generation__(xip, file_name, content_ref, generation_label, location)
+
+    # hash the preservation and access files in one pool, the bitstreams keep the original order
+    fixity_results = __measure_fixity__([(entry[1], entry[4]) for entry in content_files],
+                                        kwargs.get('Fixity_Workers'))
+    for (_, filename, file_name, location, callback, _, _, _), (file_stats, fixity_result) in zip(content_files,
+                                                                                                   fixity_results):
+        __make_bitstream__(xip, file_name, filename, callback, location, fixity_result, file_stats)
 
     if 'Identifiers' in kwargs:
         identifier_map = kwargs.get('Identifiers')
@@ -1057,7 +1161,7 @@ def complex_asset_package(preservation_files_list=None, access_files_list=None,
             if metadata_ns:
                 if metadata_path and isinstance(metadata_path, str):
                     if os.path.exists(metadata_path) and os.path.isfile(metadata_path):
-                        descriptive_metadata = xml.etree.ElementTree.parse(source=metadata_path)
+                        descriptive_metadata = _parse_metadata(source=metadata_path)
                         metadata = SubElement(xip, 'xip:Metadata', {'schemaUri': metadata_ns})
                         metadata_ref = SubElement(metadata, 'xip:Ref')
                         metadata_ref.text = str(uuid.uuid4())
@@ -1067,7 +1171,7 @@ def complex_asset_package(preservation_files_list=None, access_files_list=None,
                         content.append(descriptive_metadata.getroot())
                     elif isinstance(metadata_path, str):
                         try:
-                            descriptive_metadata = xml.etree.ElementTree.fromstring(metadata_path)
+                            descriptive_metadata = _metadata_fromstring(metadata_path)
                             metadata = SubElement(xip, 'xip:Metadata', {'schemaUri': metadata_ns})
                             metadata_ref = SubElement(metadata, 'xip:Ref')
                             metadata_ref.text = str(uuid.uuid4())
@@ -1080,7 +1184,7 @@ def complex_asset_package(preservation_files_list=None, access_files_list=None,
                 if metadata_path and isinstance(metadata_path, list):
                     for path in metadata_path:
                         if os.path.exists(path) and os.path.isfile(path):
-                            descriptive_metadata = xml.etree.ElementTree.parse(source=path)
+                            descriptive_metadata = _parse_metadata(source=path)
                             metadata = SubElement(xip, 'xip:Metadata', {'schemaUri': metadata_ns})
                             metadata_ref = SubElement(metadata, 'xip:Ref')
                             metadata_ref.text = str(uuid.uuid4())
@@ -1090,35 +1194,10 @@ def complex_asset_package(preservation_files_list=None, access_files_list=None,
                             content.append(descriptive_metadata.getroot())
 
     if xip is not None:
-        export_folder = export_folder
-        top_level_folder = os.path.join(export_folder, io_ref)
-        os.mkdir(top_level_folder)
-        inner_folder = os.path.join(top_level_folder, io_ref)
-        os.mkdir(inner_folder)
-        content_folder = os.path.join(inner_folder, CONTENT_FOLDER)
-        os.mkdir(content_folder)
-        preservation_content_folder = os.path.join(content_folder, PRESERVATION_CONTENT_FOLDER)
-        os.mkdir(preservation_content_folder)
-        access_content_folder = os.path.join(content_folder, ACCESS_CONTENT_FOLDER)
-        os.mkdir(access_content_folder)
-        metadata_path = os.path.join(inner_folder, "metadata.xml")
-        metadata = open(metadata_path, "wt", encoding='utf-8')
-        metadata.write(prettify(xip))
-        metadata.close()
-        for content_ref, filename in preservation_refs_dict.items():
-            src_file = filename
-            dst_file = os.path.join(preservation_content_folder, os.path.basename(filename))
-            shutil.copyfile(src_file, dst_file)
-        for content_ref, filename in access_refs_dict.items():
-            src_file = filename
-            dst_file = os.path.join(access_content_folder, os.path.basename(filename))
-            shutil.copyfile(src_file, dst_file)
-        if compress:
-            shutil.make_archive(top_level_folder, 'zip', top_level_folder)
-        else:
-            shutil.make_archive(top_level_folder, 'szip', top_level_folder)
-        shutil.rmtree(top_level_folder)
-        return top_level_folder + ".zip"
+        zip_path = os.path.join(export_folder, io_ref) + ".zip"
+        __write_package__(zip_path, io_ref, xip, [(entry[1], entry[3], file_stats) for entry, (file_stats, _) in
+                                                  zip(content_files, fixity_results)], compress)
+        return zip_path
 
 
 def simple_asset_package(preservation_file=None, access_file=None, export_folder=None, parent_folder=None,
@@ -1173,6 +1252,13 @@ def simple_asset_package(preservation_file=None, access_file=None, export_folder
 
 
 def upload_config():
+    """
+    The boto3 TransferConfig used for package uploads
+
+    Change the returned object to tune uploads, e.g. max_concurrency to upload more parts at the same time.
+    Changes to max_concurrency should be made before the first package upload.
+    max_concurrency is also the number of blocks uploaded at the same time to Azure containers.
+    """
     return transfer_config
 
 
@@ -1182,8 +1268,16 @@ def _unpad(s):
 
 class UploadAPI(AuthenticatedAPI):
 
+    def __init__(self, username: str = None, password: str = None, tenant: str = None, server: str = None,
+                 use_shared_secret: bool = False, two_fa_secret_key: str = None,
+                 protocol: str = "https", request_hook: Callable = None, credentials_path: str = 'credentials.properties'):
 
-
+        super().__init__(username, password, tenant, server, use_shared_secret, two_fa_secret_key,
+                         protocol, request_hook, credentials_path)
+        self._upload_transfer = None
+        self._upload_transfer_lock = threading.Lock()
+        self._bucket_resource = None
+        self._bucket_resource_credentials = None
 
     def ingest_web_video(self, url=None, parent_folder=None, **kwargs):
         """
@@ -1202,10 +1296,13 @@ class UploadAPI(AuthenticatedAPI):
 
         """
         try:
-            import youtube_dl
+            import yt_dlp as youtube_dl
         except ImportError:
-            logger.error("Package youtube_dl is required for this method. pip install --upgrade youtube-dl")
-            raise RuntimeError("Package youtube_dl is required for this method. pip install --upgrade youtube-dl")
+            try:
+                import youtube_dl
+            except ImportError:
+                logger.error("Package yt-dlp is required for this method. pip install --upgrade yt-dlp")
+                raise RuntimeError("Package yt-dlp is required for this method. pip install --upgrade yt-dlp")
 
         ydl_opts = {}
 
@@ -1215,6 +1312,13 @@ class UploadAPI(AuthenticatedAPI):
 
         ydl_opts = {'outtmpl': '%(id)s.mp4', 'progress_hooks': [my_hook], }
 
+        if youtube_dl.__name__ == "yt_dlp":
+            # download the fragments of streamed (HLS/DASH) videos in parallel
+            ydl_opts['concurrent_fragment_downloads'] = WEB_VIDEO_FRAGMENT_WORKERS
+            if shutil.which("aria2c") is not None:
+                ydl_opts['external_downloader'] = {'default': 'aria2c'}
+                ydl_opts['external_downloader_args'] = {'aria2c': ['-x', '16', '-s', '16']}
+
         # if True:
         #    ydl_opts['writesubtitles'] = True
         #    ydl_opts['writeautomaticsub'] = True
@@ -1272,15 +1376,10 @@ class UploadAPI(AuthenticatedAPI):
 
         :return: dict
         """
-        headers = {HEADER_TOKEN: self.token}
         endpoint = f"/upload/{location_id}/upload-credentials"
-        request = self.session.get(f'https://{self.server}/api/location{endpoint}', headers=headers)
+        request = self._request('GET', f'https://{self.server}/api/location{endpoint}')
         if request.status_code == requests.codes.ok:
-            json_response = str(request.content.decode('utf-8'))
-            return json.loads(json_response)
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.upload_credentials(location_id)
+            return json.loads(request.content)
         else:
             exception = HTTPException(location_id, request.status_code, request.url, "upload_credentials",
                                       request.content.decode('utf-8'))
@@ -1338,15 +1437,10 @@ class UploadAPI(AuthenticatedAPI):
         Upload locations are configured on the Sources page as 'SIP Upload'.
         :return: dict
         """
-        headers = {HEADER_TOKEN: self.token}
         endpoint = "/api/location/upload"
-        request = self.session.get(f'https://{self.server}{endpoint}', headers=headers)
+        request = self._request('GET', f'https://{self.server}{endpoint}')
         if request.status_code == requests.codes.ok:
-            json_response = str(request.content.decode('utf-8'))
-            return json.loads(json_response)['locations']
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.upload_locations()
+            return json.loads(request.content)['locations']
         else:
             exception = HTTPException("", request.status_code, request.url, "upload_locations",
                                       request.content.decode('utf-8'))
@@ -1426,52 +1520,57 @@ class UploadAPI(AuthenticatedAPI):
         bytes_ingested = 0
 
         folder_path = os.path.normpath(filesystem_path)
+        parent_path = Path(folder_path).parent
+
+        # the files of each folder are looked up in the repository concurrently, one request per file
+        with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+            for dirname, subdirs, files in os.walk(folder_path):
+                base = os.path.basename(dirname)
+                code = os.path.relpath(dirname, parent_path)
+                p = get_parent(entity_client, code, parent_ref)
+                f = get_folder(entity_client, base, security_tag, p, code)
+                identifiers = dict()
+                candidates = []
+                for file in files:
+                    full_path = os.path.join(dirname, file)
+                    if os.path.islink(full_path):
+                        logger.info(f"Skipping link {file}")
+                        continue
+                    candidates.append((file, full_path, os.path.join(code, file)))
+                exists = executor.map(lambda candidate: entity_exists(entity_client, candidate[2]), candidates)
+                full_path_list = []
+                for (file, full_path, asset_code), asset_exists in zip(candidates, exists):
+                    if not asset_exists:
+                        bytes_ingested = bytes_ingested + os.stat(full_path).st_size
+                        logger.info(f"Adding new file: {file} to package ready for upload")
+                        file_identifiers = {"code": asset_code}
+                        identifiers[full_path] = file_identifiers
+                        full_path_list.append(full_path)
+                    else:
+                        logger.info(f"Skipping file {file} already exists in repository")
 
-        for dirname, subdirs, files in os.walk(folder_path):
-            base = os.path.basename(dirname)
-            code = os.path.relpath(dirname, Path(folder_path).parent)
-            p = get_parent(entity_client, code, parent_ref)
-            f = get_folder(entity_client, base, security_tag, p, code)
-            identifiers = dict()
-            for file in list(files):
-                full_path = os.path.join(dirname, file)
-                if os.path.islink(full_path):
-                    logger.info(f"Skipping link {file}")
-                    files.remove(file)
-                    continue
-                asset_code = os.path.join(code, file)
-                if not entity_exists(entity_client, asset_code):
-                    bytes_ingested = bytes_ingested + os.stat(full_path).st_size
-                    logger.info(f"Adding new file: {file} to package ready for upload")
-                    file_identifiers = {"code": asset_code}
-                    identifiers[full_path] = file_identifiers
-                else:
-                    logger.info(f"Skipping file {file} already exists in repository")
-                    files.remove(file)
-
-            if len(files) > 0:
-                full_path_list = [os.path.join(dirname, file) for file in files]
-                package = multi_asset_package(asset_file_list=full_path_list, parent_folder=f, SecurityTag=security_tag,
-                                              Identifiers=identifiers)
-                if callback:
-                    progress_display = UploadProgressConsoleCallback(package)
-                else:
-                    progress_display = None
+                if len(full_path_list) > 0:
+                    package = multi_asset_package(asset_file_list=full_path_list, parent_folder=f,
+                                                  SecurityTag=security_tag, Identifiers=identifiers)
+                    if callback:
+                        progress_display = UploadProgressConsoleCallback(package)
+                    else:
+                        progress_display = None
 
-                if bucket_name is None:
-                    self.upload_zip_package(path_to_zip_package=package, callback=progress_display,
-                                            delete_after_upload=delete_after_upload)
-                else:
-                    self.upload_zip_to_Source(path_to_zip_package=package, container_name=bucket_name,
-                                              show_progress=bool(progress_display is not None),
-                                              delete_after_upload=delete_after_upload)
+                    if bucket_name is None:
+                        self.upload_zip_package(path_to_zip_package=package, callback=progress_display,
+                                                delete_after_upload=delete_after_upload)
+                    else:
+                        self.upload_zip_to_Source(path_to_zip_package=package, container_name=bucket_name,
+                                                  show_progress=bool(progress_display is not None),
+                                                  delete_after_upload=delete_after_upload)
 
-                logger.info(f"Uploaded " + "{:.1f}".format(bytes_ingested / (1024 * 1024)) + " MB")
+                    logger.info(f"Uploaded " + "{:.1f}".format(bytes_ingested / (1024 * 1024)) + " MB")
 
-                if max_MB_ingested > 0:
-                    if bytes_ingested > (1024 * 1024 * max_MB_ingested):
-                        logger.info(f"Reached Max Upload Limit")
-                        break
+                    if max_MB_ingested > 0:
+                        if bytes_ingested > (1024 * 1024 * max_MB_ingested):
+                            logger.info(f"Reached Max Upload Limit")
+                            break
 
     def upload_zip_to_Source(self, path_to_zip_package, container_name, folder=None, delete_after_upload=False,
                              show_progress=False):
@@ -1548,12 +1647,14 @@ class UploadAPI(AuthenticatedAPI):
                 if show_progress:
                     with tqdm.wrapattr(open(path_to_zip_package, 'rb'), "read", total=len_bytes) as data:
                         blob_client = container.upload_blob(name=upload_key, data=data, metadata=metadata,
-                                                            length=len_bytes)
+                                                            length=len_bytes,
+                                                            max_concurrency=transfer_config.max_concurrency)
                         properties = blob_client.get_blob_properties()
                 else:
                     with open(path_to_zip_package, "rb") as data:
                         blob_client = container.upload_blob(name=upload_key, data=data, metadata=metadata,
-                                                            length=len_bytes)
+                                                            length=len_bytes,
+                                                            max_concurrency=transfer_config.max_concurrency)
                         properties = blob_client.get_blob_properties()
 
                 if delete_after_upload:
@@ -1591,9 +1692,7 @@ class UploadAPI(AuthenticatedAPI):
                 session_token = credentials['sessionToken']
                 endpoint = credentials['endpoint']
 
-                session = boto3.Session(aws_access_key_id=access_key, aws_secret_access_key=secret_key,
-                                        aws_session_token=session_token)
-                s3 = session.resource(service_name="s3")
+                s3 = self._bucket_s3_resource(access_key, secret_key, session_token)
 
                 logger.debug(f"S3 Session: {s3}")
 
@@ -1606,17 +1705,101 @@ class UploadAPI(AuthenticatedAPI):
                 elif isinstance(folder, str):
                     metadata['collectionreference'] = folder
 
-                metadata['size'] = str(Path(path_to_zip_package).stat().st_size)
+                package_size = Path(path_to_zip_package).stat().st_size
+                metadata['size'] = str(package_size)
                 metadata['createdby'] = self.username
 
-                metadata_map = {'Metadata': metadata}
-
-                s3_object.upload_file(path_to_zip_package, Callback=callback, ExtraArgs=metadata_map,
-                                      Config=transfer_config)
+                if package_size < transfer_config.multipart_threshold:
+                    # small packages are sent with a single PUT, skipping the transfer manager threads
+                    with open(path_to_zip_package, "rb") as body:
+                        s3_object.put(Body=body, ContentLength=package_size, Metadata=metadata)
+                    if callback is not None:
+                        callback(package_size)
+                else:
+                    metadata_map = {'Metadata': metadata}
+                    s3_object.upload_file(path_to_zip_package, Callback=callback, ExtraArgs=metadata_map,
+                                          Config=transfer_config)
 
                 if delete_after_upload:
                     os.remove(path_to_zip_package)
 
+    def _bucket_s3_resource(self, access_key, secret_key, session_token):
+        """
+        The S3 resource used to upload packages to a bucket connected to Preservica
+
+        The resource is kept while the upload credentials stay the same, so consecutive uploads
+        reuse its connection pool instead of creating a new session for every package.
+        """
+        credentials = (access_key, secret_key, session_token)
+        with self._upload_transfer_lock:
+            if self._bucket_resource is None or self._bucket_resource_credentials != credentials:
+                session = boto3.Session(aws_access_key_id=access_key, aws_secret_access_key=secret_key,
+                                        aws_session_token=session_token)
+                self._bucket_resource = session.resource(service_name="s3",
+                                                         config=Config(
+                                                             max_pool_connections=transfer_config.max_concurrency,
+                                                             tcp_keepalive=True))
+                self._bucket_resource_credentials = credentials
+            return self._bucket_resource
+
+    def _package_transfer(self):
+        """
+        The S3Transfer used to upload packages to Preservica
+
+        The transfer and its S3 client are created on first use and shared by every upload from this
+        UploadAPI, so the connection pool and upload threads are reused.
+        The client credentials are refreshed from the Preservica token when they expire.
+        """
+        with self._upload_transfer_lock:
+            if self._upload_transfer is not None:
+                return self._upload_transfer
+
+            endpoint = f'{self.protocol}://{self.server}/api/s3/buckets'
+
+            retries= {
+                'max_attempts': 5,
+                'mode': 'adaptive'
+            }
+
+            def new_credentials():
+                cred_metadata: dict = {}
+                cred_metadata['access_key'] =  self.__token__()
+                cred_metadata['secret_key'] = "NOT_USED"
+                cred_metadata['token'] = ""
+                cred_metadata["expiry_time"] = (datetime.now(tzlocal()) + timedelta(minutes=12)).isoformat()
+                logger.info("Refreshing credentials at: " + str(datetime.now(tzlocal())))
+                return cred_metadata
+
+            session = get_session()
+
+            session_credentials = RefreshableCredentials.create_from_metadata(
+                metadata=new_credentials(),
+                refresh_using=new_credentials,
+                advisory_timeout = 4 * 60,
+                mandatory_timeout = 12 * 60,
+                method = 'Preservica'
+            )
+
+            autorefresh_session = boto3.Session(botocore_session=session)
+
+            session._credentials = session_credentials
+
+            config = Config(s3={'addressing_style': 'path'}, read_timeout=120, connect_timeout=120,
+                            request_checksum_calculation="WHEN_REQUIRED",
+                            response_checksum_validation="WHEN_REQUIRED",
+                            retries=retries, tcp_keepalive=True, max_pool_connections=transfer_config.max_concurrency)
+
+
+            s3_client = autorefresh_session.client('s3', endpoint_url=endpoint, config=config)
+
+            transfer = S3Transfer(client=s3_client, config=transfer_config)
+
+            transfer.PutObjectTask = PutObjectTask
+            transfer.CompleteMultipartUploadTask = CompleteMultipartUploadTask
+            transfer.upload_file = upload_file
+            self._upload_transfer = transfer
+            return transfer
+
     def upload_zip_package(self, path_to_zip_package, folder=None, callback=None, delete_after_upload=False):
         """
         Uploads a zip file package directly to Preservica and starts an ingest workflow
@@ -1635,46 +1818,8 @@ class UploadAPI(AuthenticatedAPI):
 
         """
         bucket = f'{self.tenant.lower()}.package.upload'
-        endpoint = f'{self.protocol}://{self.server}/api/s3/buckets'
         self.token = self.__token__()
 
-
-        retries= {
-            'max_attempts': 5,
-            'mode': 'adaptive'
-        }
-
-        def new_credentials():
-            cred_metadata: dict = {}
-            cred_metadata['access_key'] =  self.__token__()
-            cred_metadata['secret_key'] = "NOT_USED"
-            cred_metadata['token'] = ""
-            cred_metadata["expiry_time"] = (datetime.now(tzlocal()) + timedelta(minutes=12)).isoformat()
-            logger.info("Refreshing credentials at: " + str(datetime.now(tzlocal())))
-            return cred_metadata
-
-        session = get_session()
-
-        session_credentials = RefreshableCredentials.create_from_metadata(
-            metadata=new_credentials(),
-            refresh_using=new_credentials,
-            advisory_timeout = 4 * 60,
-            mandatory_timeout = 12 * 60,
-            method = 'Preservica'
-        )
-
-        autorefresh_session = boto3.Session(botocore_session=session)
-
-        session._credentials = session_credentials
-
-        config = Config(s3={'addressing_style': 'path'}, read_timeout=120, connect_timeout=120,
-               request_checksum_calculation="WHEN_REQUIRED",
-               response_checksum_validation="WHEN_REQUIRED",
-               retries=retries, tcp_keepalive=True)
-
-
-        s3_client = autorefresh_session.client('s3', endpoint_url=endpoint, config=config)
-
         metadata = {}
         if folder is not None:
             if hasattr(folder, "reference"):
@@ -1700,12 +1845,7 @@ class UploadAPI(AuthenticatedAPI):
 
                 logger.info("Using Multipart Chunk Size: " + str(transfer_config.multipart_chunksize))
 
-                transfer = S3Transfer(client=s3_client, config=transfer_config)
-
-                transfer.PutObjectTask = PutObjectTask
-                transfer.CompleteMultipartUploadTask = CompleteMultipartUploadTask
-                transfer.upload_file = upload_file
-
+                transfer = self._package_transfer()
 
                 response = transfer.upload_file(self=transfer, filename=path_to_zip_package, bucket=bucket,
                                                 key=key_id,
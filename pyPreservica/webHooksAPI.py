@@ -129,14 +129,9 @@ class WebHooksAPI(AuthenticatedAPI):
         :return: list of web hooks
         """
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token}
-        response = self.session.get(f'{self.protocol}://{self.server}{BASE_ENDPOINT}/subscriptions', headers=headers)
-        if response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.subscriptions()
+        response = self._request('GET', f'{self.protocol}://{self.server}{BASE_ENDPOINT}/subscriptions')
         if response.status_code == requests.codes.ok:
-            json_response = str(response.content.decode('utf-8'))
-            doc = json.loads(json_response)
+            doc = json.loads(response.content)
             return doc
         else:
             exception = HTTPException("", response.status_code, response.url, "subscriptions",
@@ -162,15 +157,10 @@ class WebHooksAPI(AuthenticatedAPI):
         :return:
         """
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token}
-        response = self.session.delete(
-            f'{self.protocol}://{self.server}{BASE_ENDPOINT}/subscriptions/{subscription_id}',
-            headers=headers)
-        if response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.unsubscribe(subscription_id)
+        response = self._request(
+            'DELETE', f'{self.protocol}://{self.server}{BASE_ENDPOINT}/subscriptions/{subscription_id}')
         if response.status_code == requests.codes.no_content:
-            json_response = str(response.content.decode('utf-8'))
+            json_response = response.content.decode('utf-8')
             logger.debug(json_response)
             return json_response
         else:
@@ -189,18 +179,15 @@ class WebHooksAPI(AuthenticatedAPI):
         :return: json_response
         """
         self._check_if_user_has_manager_role()
-        headers = {HEADER_TOKEN: self.token, 'Accept': 'application/json', 'Content-Type': 'application/json'}
+        headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
 
         json_payload = f'{{"url": "{url}", "triggerType": "{triggerType.value}", "secret": "{secret}",  ' \
                        f'"includeIdentifiers": "true"}}'
 
-        response = self.session.post(f'{self.protocol}://{self.server}{BASE_ENDPOINT}/subscriptions', headers=headers,
-                                     data=json.dumps(json.loads(json_payload)))
-        if response.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.subscribe(url, triggerType, secret)
+        response = self._request('POST', f'{self.protocol}://{self.server}{BASE_ENDPOINT}/subscriptions', headers=headers,
+                                 data=json.dumps(json.loads(json_payload)))
         if response.status_code == requests.codes.ok:
-            json_response = str(response.content.decode('utf-8'))
+            json_response = response.content.decode('utf-8')
             logger.debug(json_response)
             return json_response
         else:
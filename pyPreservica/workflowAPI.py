@@ -15,6 +15,7 @@ from typing import Callable, Generator
 from xml.etree import ElementTree
 
 from pyPreservica.common import *
+from pyPreservica.common import _xml_fromstring
 
 logger = logging.getLogger(__name__)
 
@@ -111,15 +112,12 @@ class ProcessAPI(AuthenticatedAPI):
 
     def __set_status__(self, process_id: str, state: str) -> bool:
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/json'}
-        request = self.session.put(
-            f'{self.protocol}://{self.server}/{self.base_url}/ingest/configs/{process_id}/active', headers=headers, data=str(state))
+        headers = {'Content-Type': 'application/json'}
+        request = self._request(
+            'PUT', f'{self.protocol}://{self.server}/{self.base_url}/ingest/configs/{process_id}/active', headers=headers, data=str(state))
         if request.status_code == requests.codes.ok:
-            config = json.loads(request.content.decode("utf-8"))
+            config = request.json()
             return bool(config['active'])
-        if request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.__set_status__(process_id, state)
         else:
             logger.error(request)
             raise RuntimeError(request.status_code, "deactivate_process")
@@ -155,14 +153,13 @@ class ProcessAPI(AuthenticatedAPI):
         :return: list of Processes
         :rtype:  list
         """
-        headers = {HEADER_TOKEN: self.token}
         params = {}
         if ingest_types is not None:
             params['types'] = ingest_types
-        with self.session.get(f'{self.protocol}://{self.server}/{self.base_url}/ingest/configs', headers=headers, params=params)  as request:
+        with self._request('GET', f'{self.protocol}://{self.server}/{self.base_url}/ingest/configs', params=params)  as request:
             if request.status_code == requests.codes.ok:
                 results = []
-                json_dict = json.loads(request.content.decode("utf-8"))
+                json_dict = request.json()
                 for entry in json_dict['configs']:
                     p = Process(entry['apiId'], entry['name'])
                     p.description = entry['description']
@@ -171,9 +168,6 @@ class ProcessAPI(AuthenticatedAPI):
                     p.trigger_type = entry['trigger']['type']
                     results.append(p)
                 return results
-            if request.status_code == requests.codes.unauthorized:
-                self.token = self.__token__()
-                return self.ingest_process(ingest_types)
 
         return []
 
@@ -211,13 +205,11 @@ class WorkflowAPI(AuthenticatedAPI):
 
         """
 
-        headers = {HEADER_TOKEN: self.token}
         params = {"type": workflow_type}
         workflow_contexts = []
-        request = self.session.get(f'{self.protocol}://{self.server}/{self.base_url}/contexts', headers=headers, params=params)
+        request = self._request('GET', f'{self.protocol}://{self.server}/{self.base_url}/contexts', params=params)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            entity_response = _xml_fromstring(request.content)
             contexts = entity_response.findall(f".//{{{NS_WORKFLOW}}}WorkflowContext")
             for context in contexts:
                 wrkfl_id = context.find(f".//{{{NS_WORKFLOW}}}Id").text
@@ -225,9 +217,6 @@ class WorkflowAPI(AuthenticatedAPI):
                 workflow_context = WorkflowContext(wrkfl_id, name)
                 workflow_contexts.append(workflow_context)
             return workflow_contexts
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.get_workflow_contexts(workflow_type)
         else:
             logger.error(request.content)
             raise RuntimeError(request.status_code, "get_workflow_contexts_by_type")
@@ -244,13 +233,11 @@ class WorkflowAPI(AuthenticatedAPI):
 
         """
 
-        headers = {HEADER_TOKEN: self.token}
         params = {"workflowDefinitionId": definition}
         workflow_contexts = []
-        request = self.session.get(f'{self.protocol}://{self.server}/{self.base_url}/contexts', headers=headers, params=params)
+        request = self._request('GET', f'{self.protocol}://{self.server}/{self.base_url}/contexts', params=params)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            entity_response = _xml_fromstring(request.content)
             contexts = entity_response.findall(f".//{{{NS_WORKFLOW}}}WorkflowContext")
             for context in contexts:
                 wrkfl_id = context.find(f".//{{{NS_WORKFLOW}}}Id").text
@@ -258,9 +245,6 @@ class WorkflowAPI(AuthenticatedAPI):
                 workflow_context = WorkflowContext(wrkfl_id, name)
                 workflow_contexts.append(workflow_context)
             return workflow_contexts
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.get_workflow_contexts(definition)
         else:
             logger.error(request.content)
             raise RuntimeError(request.status_code, "get_workflow_contexts")
@@ -281,7 +265,7 @@ class WorkflowAPI(AuthenticatedAPI):
 
         """
 
-        headers = {HEADER_TOKEN: self.token, 'Content-Type': 'application/xml;charset=UTF-8'}
+        headers = {'Content-Type': 'application/xml;charset=UTF-8'}
 
         correlation_id = str(uuid.uuid4())
 
@@ -298,13 +282,10 @@ class WorkflowAPI(AuthenticatedAPI):
         xml.etree.ElementTree.SubElement(request_payload, "CorrelationId").text = correlation_id
 
         xml_request = xml.etree.ElementTree.tostring(request_payload, encoding='utf-8')
-        request = self.session.post(f'{self.protocol}://{self.server}/{self.base_url}/instances', headers=headers,
-                                    data=xml_request)
+        request = self._request('POST', f'{self.protocol}://{self.server}/{self.base_url}/instances', headers=headers,
+                                data=xml_request)
         if request.status_code == requests.codes.created:
             return correlation_id
-        if request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.start_workflow_instance(workflow_context, **kwargs)
         else:
             logger.error(request.content)
             raise RuntimeError(request.status_code, "start_workflow_instance failed")
@@ -324,15 +305,11 @@ class WorkflowAPI(AuthenticatedAPI):
         else:
             param_string = str(int(instance_ids))
 
-        headers = {HEADER_TOKEN: self.token}
         params = {"workflowInstanceIds": param_string}
-        request = self.session.post(f'{self.protocol}://{self.server}/{self.base_url}/instances/terminate',
-                                    headers=headers, params=params)
+        request = self._request('POST', f'{self.protocol}://{self.server}/{self.base_url}/instances/terminate',
+                                params=params)
         if request.status_code == requests.codes.accepted:
             return
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.terminate_workflow_instance(instance_ids)
         else:
             logger.error(request.content)
             raise RuntimeError(request.status_code, "terminate_workflow_instance")
@@ -349,14 +326,13 @@ class WorkflowAPI(AuthenticatedAPI):
 
         """
 
-        headers = {HEADER_TOKEN: self.token}
         params = {"includeErrors": "true"}
-        request = self.session.get(f'{self.protocol}://{self.server}/{self.base_url}/instances/{str(instance_id)}',
-                                   headers=headers, params=params)
+        request = self._request('GET', f'{self.protocol}://{self.server}/{self.base_url}/instances/{str(instance_id)}',
+                                params=params)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
+            xml_response = request.content.decode('utf-8')
             logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            entity_response = _xml_fromstring(request.content)
             w_id = int(entity_response.find(f".//{{{NS_WORKFLOW}}}Id").text)
             assert instance_id == w_id
             workflow_instance = WorkflowInstance(int(instance_id))
@@ -385,9 +361,6 @@ class WorkflowAPI(AuthenticatedAPI):
             workflow_instance.xml_response = xml_response
 
             return workflow_instance
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.workflow_instance(instance_id)
         else:
             logger.error(request.content)
             raise RuntimeError(request.status_code, "workflow_instance")
@@ -424,8 +397,6 @@ class WorkflowAPI(AuthenticatedAPI):
 
         """
 
-        headers = {HEADER_TOKEN: self.token}
-
         if workflow_state not in self.workflow_states:
             logger.error("Invalid Workflow State")
             raise RuntimeError("Invalid Workflow State")
@@ -455,11 +426,10 @@ class WorkflowAPI(AuthenticatedAPI):
         params["start"] = int(start_value)
         params["max"] = int(maximum)
 
-        request = self.session.get(f'{self.protocol}://{self.server}/{self.base_url}/instances', headers=headers, params=params)
+        request = self._request('GET', f'{self.protocol}://{self.server}/{self.base_url}/instances', params=params)
         if request.status_code == requests.codes.ok:
-            xml_response = str(request.content.decode('utf-8'))
-            logger.debug(xml_response)
-            entity_response = xml.etree.ElementTree.fromstring(xml_response)
+            logger.debug(request.content)
+            entity_response = _xml_fromstring(request.content)
             total_count = int(entity_response.find(f".//{{{NS_WORKFLOW}}}TotalCount").text)
             count = int(entity_response.find(f".//{{{NS_WORKFLOW}}}Count").text)
             workflow_instance = entity_response.findall(f".//{{{NS_WORKFLOW}}}WorkflowInstance")
@@ -490,9 +460,6 @@ class WorkflowAPI(AuthenticatedAPI):
                     f".//{{{NS_WORKFLOW}}}WorkflowDefinitionTextId").text
                 workflow_instances.append(workflow_instance)
             return tuple((total_count, count, workflow_instances))
-        elif request.status_code == requests.codes.unauthorized:
-            self.token = self.__token__()
-            return self.__workflow_instances__(workflow_state, workflow_type, maximum, start_value, **kwargs)
         else:
             logger.error(request.content)
             raise RuntimeError(request.status_code, "workflow_instances")
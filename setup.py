@@ -42,6 +42,7 @@ setup(
     ],
     keywords='Preservica API Preservation',
     install_requires=["requests", "urllib3", "certifi", "boto3>=1.38.0", "botocore>=1.38.0", "s3transfer", "azure-storage-blob", "tqdm", "pyotp", "python-dateutil"],
+    extras_require={"fast": ["lxml", "blake3", "brotli"], "http2": ["httpx[http2,brotli]"]},
     project_urls={
         'Documentation': 'https://pypreservica.readthedocs.io',
         'Source': 'https://github.com/carj/pyPreservica',
@@ -0,0 +1,34 @@
+import threading
+from collections import OrderedDict
+from unittest import mock
+
+from pyPreservica import *
+
+
+def offline(api_class, server="test.preservica.com", version=(7, 7, 0)):
+    """
+    Create an API client which never contacts a server, its session is a mock
+    """
+    client = object.__new__(api_class)
+    client.session = mock.MagicMock()
+    client.session.headers = {}
+    client._client = None
+    client._token_lock = threading.Lock()
+    client.protocol = "https"
+    client.server = server
+    client._entity_base = f"https://{server}/api/entity"
+    client._content_base = f"https://{server}/api/content"
+    client.major_version, client.minor_version, client.patch_version = version
+    client.token = "token"
+    client.__version_namespace__()
+    if isinstance(client, EntityAPI):
+        client._entity_cache = OrderedDict()
+        client._entity_cache_lock = threading.Lock()
+        client._entity_cache_generation = 0
+        client._detail_cache = OrderedDict()
+        client._detail_cache_lock = threading.Lock()
+    return client
+
+
+def response(status_code=200, content=b"", headers=None):
+    return mock.MagicMock(status_code=status_code, content=content, headers=headers or {})
@@ -0,0 +1,164 @@
+import io
+import time
+from unittest import mock
+
+import pytest
+from pyPreservica import *
+from pyPreservica import common
+from tests.offline import offline, response
+
+URL = "https://test.preservica.com/api/entity/information-objects"
+
+
+@pytest.mark.parametrize("filename, expected", [
+    ("page-1.tiff", "page-1.tiff"),
+    ("Greyscale Master", "Greyscale Master"),
+    ("a/b\\c:d*e?f\"g<h>i|j.txt", "abcdefghij.txt"),
+    ("tab\tand\nnew line", "tabandnew line"),
+    ("file. ", "file"),
+    ("...", "__"),
+    ("", "__"),
+    ("CON", "__CON"),
+    ("con.txt", "__con.txt"),
+    ("LPT1.tar.gz", "__LPT1.tar.gz"),
+    ("console.txt", "console.txt"),
+    ("ﬁle", "file"),
+])
+def test_sanitize(filename, expected):
+    assert sanitize(filename) == expected
+
+
+def test_sanitize_long_names_keep_the_extension():
+    name = sanitize("x" * 300 + ".tiff")
+    assert len(name) == 255
+    assert name.endswith("x.tiff")
+
+
+@pytest.mark.parametrize("value", ["y", "yes", "t", "true", "on", "1", "TRUE", "Yes"])
+def test_strtobool_true(value):
+    assert strtobool(value) is True
+
+
+@pytest.mark.parametrize("value", ["n", "no", "f", "false", "off", "0", "FALSE", "No"])
+def test_strtobool_false(value):
+    assert strtobool(value) is False
+
+
+@pytest.mark.parametrize("value", ["", "2", "maybe", "truthy"])
+def test_strtobool_invalid(value):
+    with pytest.raises(ValueError):
+        strtobool(value)
+
+
+def test_strtobool_values():
+    assert set(common._STRTOBOOL) == {'y', 'yes', 't', 'true', 'on', '1', 'n', 'no', 'f', 'false', 'off', '0'}
+
+
+def new_client(tokens=("new token",)):
+    client = offline(AuthenticatedAPI)
+    client.__token__ = mock.MagicMock(side_effect=list(tokens))
+    return client
+
+
+def test_request_does_not_refresh_a_fresh_token():
+    client = new_client()
+    client.session.request.return_value = response()
+
+    client._request('GET', URL)
+
+    client.__token__.assert_not_called()
+    assert client.token == "token"
+
+
+def test_request_refreshes_a_token_close_to_expiry():
+    client = new_client()
+    client._token_expiry = time.monotonic() + common.TOKEN_REFRESH_MARGIN - 1
+    client.session.request.return_value = response()
+
+    client._request('GET', URL)
+
+    client.__token__.assert_called_once()
+    assert client.token == "new token"
+    assert client.session.headers[HEADER_TOKEN] == "new token"
+    assert client._token_expiry > time.monotonic() + common.TOKEN_REFRESH_MARGIN
+
+
+def test_request_retries_once_after_401():
+    client = new_client()
+    unauthorized = response(status_code=401)
+    client.session.request.side_effect = [unauthorized, response(content=b"<xml/>")]
+
+    assert client._request('GET', URL, params={'max': 10}).content == b"<xml/>"
+
+    unauthorized.close.assert_called_once()
+    client.__token__.assert_called_once()
+    assert client.session.request.call_count == 2
+    assert client.session.request.call_args_list[1] == mock.call('GET', URL, headers={}, params={'max': 10})
+
+
+def test_request_returns_the_second_401():
+    client = new_client()
+    client.session.request.side_effect = [response(status_code=401), response(status_code=401)]
+
+    assert client._request('GET', URL).status_code == 401
+    assert client.session.request.call_count == 2
+
+
+def test_request_rewinds_the_request_body_before_the_retry():
+    client = new_client()
+    data = io.BytesIO(b"header" + b"body")
+    data.read(len(b"header"))
+    sent = []
+
+    def send(method, url, headers=None, **kwargs):
+        sent.append(kwargs['data'].read())
+        return response(status_code=401 if len(sent) == 1 else 200)
+
+    client.session.request.side_effect = send
+
+    assert client._request('PUT', URL, data=data).status_code == 200
+    assert sent == [b"body", b"body"]
+
+
+def test_request_with_its_own_token_is_not_retried():
+    client = new_client()
+    client._token_expiry = time.monotonic()
+    client.session.request.return_value = response(status_code=401)
+
+    assert client._request('GET', URL, headers={HEADER_TOKEN: "manager token"}).status_code == 401
+
+    client.__token__.assert_not_called()
+    client.session.request.assert_called_once_with('GET', URL, headers={HEADER_TOKEN: "manager token"})
+
+
+def test_refresh_token_keeps_a_token_another_thread_has_replaced():
+    client = new_client()
+    client.token = "replaced token"
+
+    assert client._refresh_token("token") == "replaced token"
+    client.__token__.assert_not_called()
+
+
+def test_metadata_urls_follow_changes_to_the_metadata_dict():
+    asset = Asset("ref", "title", metadata={"u1": "ns1"})
+    assert asset.metadata_urls("ns1") == ["u1"]
+
+    asset.metadata["u2"] = "ns2"
+    asset.metadata["u3"] = "ns1"
+    del asset.metadata["u1"]
+
+    assert asset.metadata_urls("ns1") == ["u3"]
+    assert asset.metadata_urls("ns2") == ["u2"]
+    assert Asset("ref", "title").metadata_urls("ns1") == []
+
+
+def test_delete_metadata_finds_fragments_added_in_place():
+    client = offline(EntityAPI)
+    client.session.request.return_value = response(status_code=204)
+    asset = Asset("ref", "title", metadata={})
+    asset.metadata[f"{URL}/ref/metadata/m1"] = "ns2"
+
+    with mock.patch.object(client, "entity", return_value=asset):
+        client.delete_metadata(asset, "ns2")
+
+    client.session.request.assert_called_once_with('DELETE', f"{URL}/ref/metadata/m1", headers={})
@@ -0,0 +1,59 @@
+from pyPreservica import *
+from pyPreservica import entityAPI
+from tests.offline import offline, response
+
+ASSET_ID = "9bad5acf-e7a1-458a-927d-2d1e7f15974d"
+FOLDER_ID = "ebd977f6-bebd-4ecf-99be-e054989f9af4"
+
+
+def asset_response(client, title="title"):
+    return response(content=f'<EntityResponse xmlns="{client.entity_ns}" xmlns:xip="{client.xip_ns}">'
+                            f'<xip:InformationObject><xip:Ref>{ASSET_ID}</xip:Ref><xip:Title>{title}</xip:Title>'
+                            f'<xip:SecurityTag>open</xip:SecurityTag><xip:Parent>{FOLDER_ID}</xip:Parent>'
+                            f'</xip:InformationObject></EntityResponse>'.encode("utf-8"))
+
+
+def test_entity_cache_is_off_by_default():
+    client = offline(EntityAPI)
+    client.session.request.side_effect = [asset_response(client, "first"), asset_response(client, "second")]
+
+    assert client.asset(ASSET_ID).title == "first"
+    assert client.asset(ASSET_ID).title == "second"
+    assert client.session.request.call_count == 2
+
+
+def test_entity_cache_can_be_turned_on(monkeypatch):
+    monkeypatch.setattr(entityAPI, "ENTITY_CACHE_TTL", 30.0)
+    client = offline(EntityAPI)
+    client.session.request.side_effect = [asset_response(client, "first"), asset_response(client, "second")]
+
+    asset = client.asset(ASSET_ID)
+    assert asset.title == "first"
+    assert client.asset(ASSET_ID).title == "first"
+    assert client.session.request.call_count == 1
+
+    client._forget_entity(asset)
+    assert client.asset(ASSET_ID).title == "second"
+    assert client.session.request.call_count == 2
+
+
+def test_generation_cache_is_off_by_default():
+    client = offline(EntityAPI)
+    client.session.request.side_effect = [response(content=b"<first/>"), response(content=b"<second/>")]
+    url = f"{client._entity_base}/content-objects/{ASSET_ID}/generations/1"
+
+    assert client._detail_content(url, "generation") == b"<first/>"
+    assert client._detail_content(url, "generation") == b"<second/>"
+
+
+def test_generation_cache_can_be_turned_on(monkeypatch):
+    monkeypatch.setattr(entityAPI, "DETAIL_CACHE_TTL", 300.0)
+    client = offline(EntityAPI)
+    client.session.request.side_effect = [response(content=b"<first/>"), response(content=b"<second/>")]
+    url = f"{client._entity_base}/content-objects/{ASSET_ID}/generations/1"
+
+    assert client._detail_content(url, "generation") == b"<first/>"
+    assert client._detail_content(url, "generation") == b"<first/>"
+
+    client._forget_generations(ContentObject(ASSET_ID, "title"))
+    assert client._detail_content(url, "generation") == b"<second/>"
@@ -0,0 +1,105 @@
+import hashlib
+import io
+import os
+import sys
+import threading
+from unittest import mock
+
+import pytest
+from pyPreservica import *
+from pyPreservica import uploadAPI
+
+
+def write_file(path, data: bytes, mtime=None):
+    path.write_bytes(data)
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+    return str(path)
+
+
+def test_sha_callbacks(tmp_path):
+    file = write_file(tmp_path / "test.txt", b"pyPreservica" * 1000)
+    data = b"pyPreservica" * 1000
+    assert Sha1FixityCallBack()("test.txt", file) == ("SHA1", hashlib.sha1(data).hexdigest())
+    assert Sha256FixityCallBack()("test.txt", file) == ("SHA256", hashlib.sha256(data).hexdigest())
+    assert Sha512FixityCallBack()("test.txt", file) == ("SHA512", hashlib.sha512(data).hexdigest())
+
+
+def test_multi_fixity_callback(tmp_path):
+    data = b"pyPreservica" * 1000
+    file = write_file(tmp_path / "test.txt", data)
+    fixity = MultiFixityCallBack(("sha1", "md5"))("test.txt", file)
+    assert fixity == {"SHA1": hashlib.sha1(data).hexdigest(), "MD5": hashlib.md5(data).hexdigest()}
+
+
+def test_callback_reads_a_rewritten_file(tmp_path):
+    mtime = 1_700_000_000_000_000_000
+    file = write_file(tmp_path / "test.txt", b"first version", mtime)
+    assert Sha1FixityCallBack()("test.txt", file)[1] == hashlib.sha1(b"first version").hexdigest()
+    assert MultiFixityCallBack(("sha256", "md5"))("test.txt", file)["MD5"] == hashlib.md5(b"first version").hexdigest()
+
+    # same size and modification time, but different content
+    write_file(tmp_path / "test.txt", b"other version", mtime)
+    assert Sha1FixityCallBack()("test.txt", file)[1] == hashlib.sha1(b"other version").hexdigest()
+    assert MultiFixityCallBack(("sha256", "md5"))("test.txt", file)["MD5"] == hashlib.md5(b"other version").hexdigest()
+
+
+def test_hashing_file_wrapper(tmp_path):
+    data = os.urandom(3 * 1024 * 1024 + 7)
+    file = write_file(tmp_path / "test.bin", data)
+    copy = io.BytesIO()
+    with open(file, "rb") as src, HashingFileWrapper(src, ("sha1", "sha512")) as reader:
+        copy.write(reader.read())
+        digests = reader.digests()
+    assert copy.getvalue() == data
+    assert digests == {"sha1": hashlib.sha1(data).hexdigest(), "sha512": hashlib.sha512(data).hexdigest()}
+    callback = Sha512FixityCallBack()
+    assert callback.from_digests(digests) == callback("test.bin", file)
+
+
+class RecordingCallBack:
+    def __init__(self):
+        self.threads = set()
+
+    def __call__(self, filename, full_path):
+        self.threads.add(threading.current_thread().name)
+        return "SHA1", "0" * 40
+
+
+def test_custom_callbacks_are_called_from_one_thread(tmp_path):
+    files = [write_file(tmp_path / f"{i}.txt", b"pyPreservica") for i in range(16)]
+    callback = RecordingCallBack()
+    results = uploadAPI.__measure_fixity__([(file, callback) for file in files])
+    assert len(results) == 16
+    assert callback.threads == {threading.current_thread().name}
+
+
+def test_library_callbacks_are_called_in_parallel(tmp_path):
+    files = [write_file(tmp_path / f"{i}.txt", f"file {i}".encode()) for i in range(16)]
+    callback = Sha1FixityCallBack()
+    with mock.patch.object(uploadAPI, "ThreadPoolExecutor", wraps=uploadAPI.ThreadPoolExecutor) as executor:
+        results = uploadAPI.__measure_fixity__([(file, callback) for file in files])
+    executor.assert_called_once()
+    assert [fixity for _, fixity in results] == [("SHA1", hashlib.sha1(f"file {i}".encode()).hexdigest())
+                                                 for i in range(16)]
+
+
+def test_fixity_workers_can_be_given_for_custom_callbacks(tmp_path):
+    files = [write_file(tmp_path / f"{i}.txt", b"pyPreservica") for i in range(16)]
+    with mock.patch.object(uploadAPI, "ThreadPoolExecutor", wraps=uploadAPI.ThreadPoolExecutor) as executor:
+        uploadAPI.__measure_fixity__([(file, RecordingCallBack()) for file in files], 4)
+    executor.assert_called_once_with(max_workers=4)
+
+
+def test_blake3_callback_needs_blake3(tmp_path, monkeypatch):
+    file = write_file(tmp_path / "test.txt", b"pyPreservica")
+    monkeypatch.setitem(sys.modules, "blake3", None)
+    with pytest.raises(RuntimeError):
+        Blake3FixityCallBack()("test.txt", file)
+
+
+def test_multi_fixity_callback_needs_an_algorithm(tmp_path):
+    with pytest.raises(RuntimeError):
+        MultiFixityCallBack(())
+    with pytest.raises(RuntimeError):
+        FileHash.multi(write_file(tmp_path / "test.txt", b"pyPreservica"), [])
@@ -0,0 +1,100 @@
+from unittest import mock
+
+import pytest
+from pyPreservica import *
+from pyPreservica import common
+from tests.offline import offline, response
+
+ASSET_ID = "9bad5acf-e7a1-458a-927d-2d1e7f15974d"
+
+
+def version_number(client):
+    client.major_version, client.minor_version, client.patch_version = 7, 7, 0
+    return "7.7.0"
+
+
+def new_client(**kwargs):
+    with mock.patch.object(AuthenticatedAPI, "_refresh_token"), \
+            mock.patch.object(AuthenticatedAPI, "__version_number__", version_number), \
+            mock.patch.object(AuthenticatedAPI, "_find_user_roles_"):
+        return EntityAPI(username="test", password="test", server="test.preservica.com",
+                         credentials_path="missing.properties", **kwargs)
+
+
+def test_http2_is_off_by_default():
+    client = new_client()
+    assert client._client is None
+
+
+def test_http2_needs_httpx(monkeypatch):
+    monkeypatch.setattr(common, "httpx", None)
+    with pytest.raises(RuntimeError):
+        new_client(use_http2=True)
+
+
+def test_http2_cannot_use_request_hook(monkeypatch):
+    monkeypatch.setattr(common, "httpx", mock.MagicMock())
+    with pytest.raises(RuntimeError):
+        new_client(use_http2=True, request_hook=lambda response, *args, **kwargs: None)
+
+
+def test_http2_can_be_turned_on():
+    pytest.importorskip("h2")
+    client = new_client(use_http2=True)
+    assert client._client is not None
+    client._client.close()
+
+
+def http2_client():
+    httpx = pytest.importorskip("httpx")
+    client = offline(EntityAPI)
+    client._client = mock.MagicMock()
+    return client, httpx
+
+
+def test_entity_get_is_sent_over_http2():
+    client, _ = http2_client()
+    client._client.request.return_value = response(content=b"<xml/>")
+    url = f"{client._entity_base}/information-objects/{ASSET_ID}"
+
+    assert client._request('GET', url, params={'max': 10}).content == b"<xml/>"
+    client._client.request.assert_called_once_with('GET', url, headers={}, params={'max': 10})
+    client.session.request.assert_not_called()
+
+
+@pytest.mark.parametrize("method, path, kwargs", [
+    ('GET', "/api/entity/information-objects", {'stream': True}),
+    ('GET', "/api/content/thumbnail", {}),
+    ('POST', "/api/entity/information-objects", {'data': b"<xml/>"}),
+    ('DELETE', "/api/entity/information-objects", {}),
+])
+def test_other_requests_use_the_session(method, path, kwargs):
+    client, _ = http2_client()
+    client.session.request.return_value = response()
+
+    client._request(method, f"https://{client.server}{path}", **kwargs)
+    client._client.request.assert_not_called()
+    client.session.request.assert_called_once()
+
+
+def test_http2_transport_error_falls_back_to_the_session():
+    client, httpx = http2_client()
+    client._client.request.side_effect = httpx.ConnectError("connection refused")
+    client.session.request.return_value = response(content=b"<xml/>")
+    url = f"{client._entity_base}/information-objects/{ASSET_ID}"
+
+    assert client._request('GET', url).content == b"<xml/>"
+    client.session.request.assert_called_once_with('GET', url, headers={})
+
+
+@pytest.mark.parametrize("status_code", common.RETRY_STATUS_CODES)
+def test_http2_throttled_response_falls_back_to_the_session(status_code):
+    client, _ = http2_client()
+    throttled = response(status_code=status_code)
+    client._client.request.return_value = throttled
+    client.session.request.return_value = response(content=b"<xml/>")
+    url = f"{client._entity_base}/information-objects/{ASSET_ID}"
+
+    assert client._request('GET', url).content == b"<xml/>"
+    throttled.close.assert_called_once()
+    client.session.request.assert_called_once_with('GET', url, headers={})
@@ -1,5 +1,8 @@
 import pytest
+from unittest import mock
 from pyPreservica import *
+from pyPreservica import entityAPI
+from tests.offline import offline, response
 
 FOLDER_ID = "ebd977f6-bebd-4ecf-99be-e054989f9af4"
 ASSET_ID = "683f9db7-ff81-4859-9c03-f68cfa5d9c3d"
@@ -206,3 +209,20 @@ def test_can_update_identifier(setup_data):
     entity = entity_set.pop()
     assert entity.reference == folder.reference
     client.delete_identifiers(folder, "ISBN", "ISBN_0002")
+
+
+def test_delete_identifiers_does_not_use_the_shared_pool():
+    client = offline(EntityAPI)
+    ns = client.xip_ns
+    identifiers = "".join(f"<Identifier><ApiId>{i}</ApiId><Type>ISBN</Type><Value>{i}</Value>"
+                          f"<Entity>{FOLDER_ID}</Entity></Identifier>" for i in range(3))
+    document = f'<IdentifiersResponse xmlns="{ns}"><Identifiers>{identifiers}</Identifiers></IdentifiersResponse>'
+    client.session.request.side_effect = lambda method, url, **kwargs: \
+        response(content=document.encode("utf-8")) if method == 'GET' else response(status_code=204)
+    folder = Folder(FOLDER_ID, "title")
+
+    with mock.patch.object(entityAPI, "_POOL") as pool:
+        assert client.delete_identifiers(folder, "ISBN", "1") is folder
+    pool.map.assert_not_called()
+    deleted = [call.args[1] for call in client.session.request.call_args_list if call.args[0] == 'DELETE']
+    assert deleted == [f"{client._entity_base}/structural-objects/{FOLDER_ID}/identifiers/1"]
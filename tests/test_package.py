@@ -0,0 +1,199 @@
+import hashlib
+import os
+import zipfile
+import xml.etree.ElementTree
+from unittest import mock
+
+import pytest
+from pyPreservica import *
+from pyPreservica import uploadAPI
+
+FOLDER_ID = "ebd977f6-bebd-4ecf-99be-e054989f9af4"
+NS = "{http://preservica.com/XIP/v6.0}"
+
+
+def write_file(folder, name, data: bytes):
+    path = folder / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return str(path)
+
+
+def bitstreams(zf, metadata_entry):
+    """Return {location/filename: (FileSize, {algorithm: value})} from the XIP document in the package"""
+    xip = xml.etree.ElementTree.fromstring(zf.read(metadata_entry))
+    result = {}
+    for bitstream in xip.iter(f"{NS}Bitstream"):
+        if bitstream.find(f"{NS}Filename") is None:
+            continue
+        fixities = {fixity.findtext(f"{NS}FixityAlgorithmRef"): fixity.findtext(f"{NS}FixityValue")
+                    for fixity in bitstream.iter(f"{NS}Fixity")}
+        key = f"{bitstream.findtext(f'{NS}PhysicalLocation') or ''}/{bitstream.findtext(f'{NS}Filename')}"
+        result[key.lstrip("/")] = (bitstream.findtext(f"{NS}FileSize"), fixities)
+    return result
+
+
+def test_prettify_does_not_change_the_element():
+    xip = xml.etree.ElementTree.Element("XIP")
+    xml.etree.ElementTree.SubElement(xml.etree.ElementTree.SubElement(xip, "InformationObject"), "Title").text = "t"
+    before = xml.etree.ElementTree.tostring(xip)
+
+    document = uploadAPI.prettify(xip)
+
+    assert "\n  <InformationObject>\n    <Title>t</Title>" in document
+    assert xml.etree.ElementTree.tostring(xip) == before
+
+
+def test_complex_asset_package(tmp_path):
+    page_1 = write_file(tmp_path / "files", "page-1.tiff", b"page 1" * 1000)
+    page_2 = write_file(tmp_path / "files", "page-2.tiff", b"page 2" * 1000)
+    book = write_file(tmp_path / "files", "book.pdf", b"%PDF book")
+
+    package = complex_asset_package(preservation_files_list=[page_1, page_2], access_files_list=[book],
+                                    export_folder=str(tmp_path), parent_folder=FOLDER_ID)
+
+    io_ref = os.path.basename(package).replace(".zip", "")
+    with zipfile.ZipFile(package) as zf:
+        assert zf.testzip() is None
+        assert [info.filename for info in zf.infolist()] == [
+            f"{io_ref}/", f"{io_ref}/content/", f"{io_ref}/content/a1/", f"{io_ref}/content/p1/",
+            f"{io_ref}/content/p1/page-1.tiff", f"{io_ref}/content/p1/page-2.tiff", f"{io_ref}/content/a1/book.pdf",
+            f"{io_ref}/metadata.xml"]
+        assert zf.getinfo(f"{io_ref}/content/p1/page-1.tiff").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo(f"{io_ref}/content/a1/book.pdf").compress_type == zipfile.ZIP_STORED
+        assert zf.read(f"{io_ref}/content/p1/page-2.tiff") == b"page 2" * 1000
+        assert bitstreams(zf, f"{io_ref}/metadata.xml") == {
+            "p1/page-1.tiff": ("6000", {"SHA1": hashlib.sha1(b"page 1" * 1000).hexdigest()}),
+            "p1/page-2.tiff": ("6000", {"SHA1": hashlib.sha1(b"page 2" * 1000).hexdigest()}),
+            "a1/book.pdf": ("9", {"SHA1": hashlib.sha1(b"%PDF book").hexdigest()})}
+    assert sorted(os.listdir(tmp_path)) == sorted(["files", os.path.basename(package)])
+
+
+def test_uncompressed_package(tmp_path):
+    page = write_file(tmp_path / "files", "page-1.tiff", b"page 1" * 1000)
+
+    package = simple_asset_package(preservation_file=page, export_folder=str(tmp_path), parent_folder=FOLDER_ID,
+                                   compress=False)
+
+    with zipfile.ZipFile(package) as zf:
+        assert {info.compress_type for info in zf.infolist()} == {zipfile.ZIP_STORED}
+
+
+def test_generic_asset_package(tmp_path):
+    master = write_file(tmp_path / "master", "page-1.tiff", b"master")
+    greyscale = write_file(tmp_path / "greyscale", "page-1.tiff", b"greyscale")
+    access = write_file(tmp_path / "access", "page-1.jpg", b"access")
+
+    package = generic_asset_package(preservation_files_dict={"Master": [master], "Greyscale Master": [greyscale]},
+                                    access_files_dict={"Access": [access]}, export_folder=str(tmp_path),
+                                    parent_folder=FOLDER_ID,
+                                    Preservation_files_fixity_callback=MultiFixityCallBack(("sha256", "md5")))
+
+    io_ref = os.path.basename(package).replace(".zip", "")
+    grey_location = sanitize("Greyscale Master")
+    with zipfile.ZipFile(package) as zf:
+        assert zf.testzip() is None
+        names = [info.filename for info in zf.infolist()]
+        assert names[:2] == [f"{io_ref}/", f"{io_ref}/content/"]
+        assert names[-1] == f"{io_ref}/metadata.xml"
+        assert sorted(names[2:-1]) == sorted([
+            f"{io_ref}/content/Master/", f"{io_ref}/content/{grey_location}/", f"{io_ref}/content/Access/",
+            f"{io_ref}/content/Master/page-1.tiff", f"{io_ref}/content/{grey_location}/page-1.tiff",
+            f"{io_ref}/content/Access/page-1.jpg"])
+        assert zf.read(f"{io_ref}/content/{grey_location}/page-1.tiff") == b"greyscale"
+        assert zf.getinfo(f"{io_ref}/content/Access/page-1.jpg").compress_type == zipfile.ZIP_STORED
+        assert bitstreams(zf, f"{io_ref}/metadata.xml") == {
+            "Master/page-1.tiff": ("6", {"SHA256": hashlib.sha256(b"master").hexdigest(),
+                                         "MD5": hashlib.md5(b"master").hexdigest()}),
+            f"{grey_location}/page-1.tiff": ("9", {"SHA256": hashlib.sha256(b"greyscale").hexdigest(),
+                                                   "MD5": hashlib.md5(b"greyscale").hexdigest()}),
+            "Access/page-1.jpg": ("6", {"SHA1": hashlib.sha1(b"access").hexdigest()})}
+
+
+def test_multi_asset_package(tmp_path):
+    files = [write_file(tmp_path / "files", f"image-{i}.tiff", f"image {i}".encode()) for i in range(3)]
+    files.append(write_file(tmp_path / "files", "image.jpg", b"jpeg"))
+
+    package = multi_asset_package(asset_file_list=files, export_folder=str(tmp_path), parent_folder=FOLDER_ID)
+
+    package_id = os.path.basename(package).replace(".zip", "")
+    with zipfile.ZipFile(package) as zf:
+        assert zf.testzip() is None
+        assert [info.filename for info in zf.infolist()] == [
+            f"{package_id}/", f"{package_id}/content/",
+            *[f"{package_id}/content/{os.path.basename(file)}" for file in files],
+            f"{package_id}/metadata.xml"]
+        assert zf.getinfo(f"{package_id}/content/image-0.tiff").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo(f"{package_id}/content/image.jpg").compress_type == zipfile.ZIP_STORED
+        xip = xml.etree.ElementTree.fromstring(zf.read(f"{package_id}/metadata.xml"))
+        assert len(xip.findall(f"{NS}InformationObject")) == 4
+        assert bitstreams(zf, f"{package_id}/metadata.xml") == {
+            **{f"image-{i}.tiff": (str(len(f"image {i}")), {"SHA1": hashlib.sha1(f"image {i}".encode()).hexdigest()})
+               for i in range(3)},
+            "image.jpg": ("4", {"SHA1": hashlib.sha1(b"jpeg").hexdigest()})}
+    assert not os.path.exists(os.path.join(str(tmp_path), package_id + ".xml"))
+
+
+def test_duplicate_file_names_in_a_representation(tmp_path):
+    first = write_file(tmp_path / "first", "page-1.tiff", b"first")
+    second = write_file(tmp_path / "second", "page-1.tiff", b"second")
+
+    with pytest.raises(RuntimeError):
+        complex_asset_package(preservation_files_list=[first, second], export_folder=str(tmp_path),
+                              parent_folder=FOLDER_ID)
+    with pytest.raises(RuntimeError):
+        generic_asset_package(preservation_files_dict={"Master": [first, second]}, export_folder=str(tmp_path),
+                              parent_folder=FOLDER_ID)
+    with pytest.raises(RuntimeError):
+        multi_asset_package(asset_file_list=[first, second], export_folder=str(tmp_path), parent_folder=FOLDER_ID)
+    assert sorted(os.listdir(tmp_path)) == ["first", "second"]
+
+
+def test_same_file_name_in_different_representations(tmp_path):
+    tiff = write_file(tmp_path / "tiff", "page-1.tiff", b"tiff")
+    access = write_file(tmp_path / "access", "page-1.tiff", b"access")
+
+    package = complex_asset_package(preservation_files_list=[tiff], access_files_list=[access],
+                                    export_folder=str(tmp_path), parent_folder=FOLDER_ID)
+
+    io_ref = os.path.basename(package).replace(".zip", "")
+    with zipfile.ZipFile(package) as zf:
+        assert zf.read(f"{io_ref}/content/p1/page-1.tiff") == b"tiff"
+        assert zf.read(f"{io_ref}/content/a1/page-1.tiff") == b"access"
+
+
+class PrecomputedFixity(Sha256FixityCallBack):
+    def __call__(self, filename, full_path):
+        return "SHA256", f"precomputed {filename}"
+
+
+def test_fixity_callback_subclass_is_called(tmp_path):
+    image = write_file(tmp_path / "files", "image.tiff", b"image")
+
+    complex_package = complex_asset_package(preservation_files_list=[image], export_folder=str(tmp_path),
+                                            parent_folder=FOLDER_ID,
+                                            Preservation_files_fixity_callback=PrecomputedFixity())
+    multi_package = multi_asset_package(asset_file_list=[image], export_folder=str(tmp_path),
+                                        parent_folder=FOLDER_ID,
+                                        Preservation_files_fixity_callback=PrecomputedFixity())
+
+    io_ref = os.path.basename(complex_package).replace(".zip", "")
+    with zipfile.ZipFile(complex_package) as zf:
+        assert bitstreams(zf, f"{io_ref}/metadata.xml") == {
+            "p1/image.tiff": ("5", {"SHA256": "precomputed image.tiff"})}
+    package_id = os.path.basename(multi_package).replace(".zip", "")
+    with zipfile.ZipFile(multi_package) as zf:
+        assert bitstreams(zf, f"{package_id}/metadata.xml") == {
+            "image.tiff": ("5", {"SHA256": "precomputed image.tiff"})}
+
+
+def test_package_entries_use_the_compress_level(tmp_path):
+    page = write_file(tmp_path / "files", "page-1.tiff", b"page 1" * 1000)
+    files = [write_file(tmp_path / "files", f"image-{i}.tiff", f"image {i}".encode()) for i in range(2)]
+
+    with mock.patch.object(zipfile.zlib, "compressobj", wraps=zipfile.zlib.compressobj) as compressobj:
+        simple_asset_package(preservation_file=page, export_folder=str(tmp_path), parent_folder=FOLDER_ID)
+        multi_asset_package(asset_file_list=files, export_folder=str(tmp_path), parent_folder=FOLDER_ID)
+
+    # the content file and metadata.xml of the first package, two files and metadata.xml of the second
+    assert [c.args[0] for c in compressobj.call_args_list] == [uploadAPI.ZIP_COMPRESS_LEVEL] * 5
@@ -1,6 +1,8 @@
 import pytest
 import json
+from unittest import mock
 from pyPreservica import *
+from tests.offline import offline, response
 
 
 def test_format_families():
@@ -47,3 +49,25 @@ def test_property():
     document = par.property('00bfe91a-eb9d-540c-8b00-0497701d773a')
     ffa = json.loads(document)
     assert ffa['id']['name'] == "prp/1"
+
+
+def test_add_format_family_uses_basic_auth_only():
+    par = offline(PreservationActionRegistry)
+    par.username, par.password = "user", "password"
+    par.session.request.return_value = response(status_code=401)
+    with mock.patch.object(par, "_refresh_token") as refresh:
+        with pytest.raises(RuntimeError):
+            par.add_format_family('{"name": "test"}')
+    refresh.assert_not_called()
+    par.session.request.assert_called_once()
+    kwargs = par.session.request.call_args.kwargs
+    assert kwargs["auth"].username == "user"
+    assert kwargs["headers"][HEADER_TOKEN] is None
+
+
+def test_basic_auth_request_drops_the_token_header():
+    session = requests.Session()
+    session.headers[HEADER_TOKEN] = "token"
+    request = requests.Request('DELETE', "https://test.preservica.com/Registry/par/rulesets/1",
+                               headers={HEADER_TOKEN: None})
+    assert HEADER_TOKEN not in session.prepare_request(request).headers
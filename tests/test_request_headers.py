@@ -0,0 +1,26 @@
+import pytest
+from pyPreservica import *
+from pyPreservica import entityAPI
+from tests.offline import offline, response
+
+CO_ID = "2b769cf6-f56e-4474-9604-1f3bf7588278"
+file = "./test_data/LC-USZ62-20901.tiff"
+
+
+def test_shared_headers_are_read_only():
+    with pytest.raises(TypeError):
+        entityAPI._OCTET_HEADERS["Filename"] = "test.tiff"
+
+
+def test_replace_generation_does_not_change_shared_headers():
+    entity_client = offline(EntityAPI)
+    entity_client.session.request.return_value = response(content=b"pid")
+    content_object = ContentObject(CO_ID, "title")
+
+    pid = entity_client.replace_generation_async(content_object, file, "MD5", "0123456789abcdef")
+
+    assert pid == "pid"
+    assert dict(entityAPI._OCTET_HEADERS) == {'Content-Type': 'application/octet-stream'}
+    headers = entity_client.session.request.call_args.kwargs["headers"]
+    assert headers["Fixity-MD5"] == "0123456789abcdef"
+    assert headers["Filename"] == "LC-USZ62-20901.tiff"
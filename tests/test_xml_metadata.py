@@ -1,3 +1,7 @@
+import csv
+import os
+import xml.etree.ElementTree
+
 import pytest
 import xmlschema
 from xmlschema import XMLResource, XMLSchemaBase
@@ -20,3 +24,38 @@ def test_can_create_xml_docs_from_csv():
     search_file = csv_to_search_xml(csv_file, xml_namespace="https://metadata.com", root_element="oai_dc")
 
     xmlschema.validate(search_file, search_schema)
+
+
+def element_tree_document(root_element, namespaces, headers, row):
+    xml_object = xml.etree.ElementTree.Element(root_element, namespaces)
+    for value, header in zip(row, headers):
+        xml.etree.ElementTree.SubElement(xml_object, header).text = value
+    return xml.etree.ElementTree.tostring(xml_object, encoding='utf-8', xml_declaration=True).decode("utf-8")
+
+
+def test_csv_to_xml_writes_the_same_documents_as_element_tree(tmp_path):
+    csv_file = tmp_path / "metadata.csv"
+    rows = [["Title", "Date Created", "Sub-Title", "filename"],
+            ["Fish & Chips <1>", "", "\"quoted\" 'text' ×", "first"],
+            ["Second", "2024", "", "second"]]
+    with open(csv_file, "w", encoding="utf-8-sig", newline="") as csv_out:
+        csv.writer(csv_out).writerows(rows)
+    namespaces = {"xmlns": "https://metadata.com", "xmlns:dc": "http://purl.org/dc/elements/1.1/"}
+
+    names = list(csv_to_xml(str(csv_file), xml_namespace="https://metadata.com", root_element="oai_dc",
+                            export_folder=str(tmp_path),
+                            additional_namespaces={"dc": "http://purl.org/dc/elements/1.1/"}))
+
+    assert names == [os.path.join(str(tmp_path), "first.xml"), os.path.join(str(tmp_path), "second.xml")]
+    for name, row in zip(names, rows[1:]):
+        with open(name, encoding="utf-8") as document:
+            assert document.read() == element_tree_document("oai_dc", namespaces,
+                                                            ["Title", "DateCreated", "SubTitle", "filename"], row)
+
+
+def test_csv_to_xml_needs_the_file_name_column(tmp_path):
+    csv_file = tmp_path / "metadata.csv"
+    csv_file.write_text("Title,Identifier\nfirst,1\n", encoding="utf-8")
+
+    assert list(csv_to_xml(str(csv_file), xml_namespace="https://metadata.com", root_element="oai_dc",
+                           export_folder=str(tmp_path))) == []
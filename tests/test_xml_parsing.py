@@ -0,0 +1,42 @@
+import xml.etree.ElementTree
+
+import pytest
+import pyPreservica
+from pyPreservica import *
+from pyPreservica import common
+from tests.offline import offline
+
+ASSET_ID = "9bad5acf-e7a1-458a-927d-2d1e7f15974d"
+FOLDER_ID = "ebd977f6-bebd-4ecf-99be-e054989f9af4"
+
+
+def entity_xml(client):
+    return (f'<EntityResponse xmlns="{client.entity_ns}" xmlns:xip="{client.xip_ns}">'
+            f'<xip:InformationObject><xip:Ref>{ASSET_ID}</xip:Ref><xip:Title>title</xip:Title>'
+            f'<xip:SecurityTag>open</xip:SecurityTag><xip:Parent>{FOLDER_ID}</xip:Parent>'
+            f'</xip:InformationObject></EntityResponse>')
+
+
+def test_parser_is_not_exported():
+    assert not hasattr(pyPreservica, "ET")
+    assert not hasattr(pyPreservica, "_lxml_etree")
+
+
+def test_standard_library_parser_without_lxml(monkeypatch):
+    monkeypatch.setattr(common, "_lxml_etree", None)
+    assert isinstance(common._xml_fromstring("<a><b>text</b></a>"), xml.etree.ElementTree.Element)
+
+
+@pytest.mark.parametrize("use_lxml", [False, True])
+def test_entity_from_string_returns_plain_values(monkeypatch, use_lxml):
+    if use_lxml:
+        pytest.importorskip("lxml")
+    else:
+        monkeypatch.setattr(common, "_lxml_etree", None)
+    client = offline(EntityAPI)
+
+    entity = client.entity_from_string(entity_xml(client))
+
+    assert entity == {'reference': ASSET_ID, 'title': 'title', 'description': None, 'security_tag': 'open',
+                      'parent': FOLDER_ID, 'metadata': {}}
+    assert all(type(value) in (str, dict, type(None)) for value in entity.values())